@@ -23,6 +23,7 @@ setup(
         "Runtime": ["psutil"],
         "ConsoleColor": ["colorama"],
         "Graphs": ["numpy", "matplotlib"],
+        "Deflate": ["deflate"],
     },
     author="Scott Mooney (Grimrukh)",
     author_email="grimrukh@gmail.com",
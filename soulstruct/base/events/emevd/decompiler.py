@@ -1,20 +1,77 @@
 """Verbose output that matches EVS language for 'decompiling'. (Does not use IF blocks.)"""
 from __future__ import annotations
 
-import abc
+import array
 import inspect
 import logging
+import re
 import struct
 import typing as tp
-from functools import wraps
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
 
 from .exceptions import InstructionNotFoundError
 from .enums import *
 
 _LOGGER = logging.getLogger(__name__)
 
+_NO_DEFAULT = object()
+_INSTRUCTION_METHOD_RE = re.compile(r"_(\d+)_(\d{2,})")  # e.g. `_3_05` or `_1003_101` (zero-padded index)
+_STATE_PREFIXES = {True: "Enable", False: "Disable"}  # for `InstructionDecompiler._set_state()`
+_RELATIVE_FLAG_TEST_NAMES = {1: "ThisEvent", 2: "ThisEventSlot"}  # for `InstructionDecompiler._get_flag_test()`
+_STANDBY_ANIMATION_DEFAULTS = MappingProxyType({
+    "standby_animation": -1,
+    "damage_animation": -1,
+    "cancel_animation": -1,
+    "death_animation": -1,
+    "standby_return_animation": -1,
+})  # for `InstructionDecompiler._2004_09()`
 
-def parse_parameters(func_name: str = None, no_name_count=0, ignore_args=()):
+
+def _get_arg_coercers(func, param_names: tp.Sequence[str]) -> tuple[tuple[int, str, tp.Callable], ...]:
+    """Index, name, and coercion function of each parameter of `func` with a type hint, in signature order.
+
+    Each coercion function is called as `coerce(decompiler, name, value)` and returns the replacement argument value.
+    """
+    type_hints = tp.get_type_hints(func)
+    arg_coercers = []
+    for i, name in enumerate(param_names):
+        if not (enum_class := type_hints.get(name)):
+            continue
+        if enum_class is bool:
+            arg_coercers.append((i, name, _coerce_bool))
+        elif enum_class is EntityEnum:
+            arg_coercers.append((i, name, _coerce_entity))
+        else:
+            arg_coercers.append((i, name, partial(_coerce_game_enum, enum_class.__name__)))
+    return tuple(arg_coercers)
+
+
+def _coerce_bool(decompiler: InstructionDecompiler, name: str, value):
+    return Variable(value) if isinstance(value, str) else bool(value)
+
+
+def _coerce_entity(decompiler: InstructionDecompiler, name: str, value):
+    try:
+        return _get_enum_value(EntityEnum, value).name.upper()  # all-caps name (e.g. `PLAYER`)
+    except ValueError:
+        return value  # leave as entity ID
+
+
+def _coerce_game_enum(enum_name: str, decompiler: InstructionDecompiler, name: str, value):
+    try:
+        enum = getattr(decompiler.ENUMS, enum_name)  # get real enum class from game-specific module
+    except AttributeError:
+        raise ValueError(f"Invalid enum type for decompiler (arg '{name}'): {enum_name}")
+    try:
+        return _get_enum_value(enum, value)
+    except ValueError:
+        if isinstance(value, str):
+            return Variable(value)  # event argument
+        raise ValueError(f"Invalid {str(enum)} value: {value}")
+
+
+def parse_parameters(func_name: str = None, no_name_count=0, ignore_args=()) -> tp.Callable:
     """Generates a decorator that produces a formatted string based on `func_name` and the signature of the decorated
     `InstructionDecompiler` method.
 
@@ -30,35 +87,68 @@ def parse_parameters(func_name: str = None, no_name_count=0, ignore_args=()):
     else:
         decorate_func = None
 
-    def _decorator(func):
-        sig = inspect.signature(func)
-        defaults = {k: v.default for k, v in sig.parameters.items() if v.default is not inspect.Parameter.empty}
+    def _decorator(func: tp.Callable[..., str]) -> tp.Callable[..., str]:
+        full_sig = inspect.signature(func)
+        sig = full_sig.replace(parameters=tuple(full_sig.parameters.values())[1:])  # without `self`
+        param_names = tuple(sig.parameters)
+        # Default values of `param_names`, by index (`_NO_DEFAULT` if the parameter has no default).
+        param_defaults = tuple(
+            _NO_DEFAULT if p.default is inspect.Parameter.empty else p.default for p in sig.parameters.values()
+        )
+        param_count = len(param_names)
+        if func_name is not None:
+            # Formatting of each argument in the output string is fixed by the signature, so it is decided here. The
+            # first `no_name_count` arguments are never named or omitted.
+            # Frozen as `(prefix, default)` pairs, where `default` is `_NO_DEFAULT` if the argument is never omitted.
+            arg_formats = tuple(
+                ("", _NO_DEFAULT) if i < no_name_count else (f"{key}=", default)
+                for i, (key, default) in enumerate(zip(param_names, param_defaults))
+            )
+            if all(default is _NO_DEFAULT for _, default in arg_formats):
+                # No argument can be omitted, so the whole output string can be formatted in one call.
+                format_template = f"{func_name}({', '.join(prefix + '{}' for prefix, _ in arg_formats)})"
+            else:
+                format_template = None
+        else:
+            arg_formats = ()
+            format_template = None
+        # Output for `ignore_args`, if given, never changes.
+        ignored_output = f"{func_name}()" if func_name is not None and ignore_args else None
+        # Type hints are resolved on first call rather than on import, as most instructions are never decompiled in a
+        # given session. The result never changes after that.
+        arg_coercers = None
 
         @wraps(func)
-        def _wrapper(self: InstructionDecompiler, *args):
-            if func_name is not None and ignore_args and args == ignore_args:
-                return f"{func_name}()"  # arguments are ignored
-            try:
-                parameters = sig.bind(self, *args).arguments
-            except Exception:
-                _LOGGER.error(f"Decompiler error: signature = {sig}, received = {('self',) + args}")
-                raise
-            self._set_enums(parameters, tp.get_type_hints(func))
+        def _wrapper(self: InstructionDecompiler, *args) -> str:
+            nonlocal arg_coercers
+            if ignored_output is not None and args == ignore_args:
+                return ignored_output  # arguments are ignored
+            if len(args) != param_count:
+                # Slow path: only needed to validate omitted defaults or report a bad argument count.
+                try:
+                    sig.bind(*args)
+                except Exception:
+                    _LOGGER.error(f"Decompiler error: signature = {full_sig}, received = {('self',) + args}")
+                    raise
+            if arg_coercers is None:
+                arg_coercers = _get_arg_coercers(func, param_names)
+            if arg_coercers:
+                args = list(args)
+                arg_count = len(args)
+                for i, name, coerce in arg_coercers:
+                    if i < arg_count:  # otherwise, omitted argument with default value
+                        args[i] = coerce(self, name, args[i])
             if func_name is not None:
                 # Function can simply `pass` in this case, as it is never called.
-                arg_strings = []
-                for i, (key, value) in enumerate(parameters.items()):
-                    if i == 0:
-                        continue  # self
-                    if i < no_name_count + 1:
-                        arg_strings.append(f"{value}")
-                    elif key in defaults and defaults[key] == value:
-                        continue  # leave keyword argument out
-                    else:
-                        arg_strings.append(f"{key}={value}")
-                arg_string = ", ".join(arg_strings)
+                if format_template is not None:
+                    return format_template.format(*args)
+                arg_string = ", ".join(
+                    f"{prefix}{value}"
+                    for (prefix, default), value in zip(arg_formats, args)
+                    if default is _NO_DEFAULT or default != value  # leave default keyword arguments out
+                )
                 return f"{func_name}({arg_string})"
-            return func(**parameters)  # enums replaced
+            return func(self, *args)  # enums replaced
 
         return _wrapper
 
@@ -70,17 +160,23 @@ def parse_parameters(func_name: str = None, no_name_count=0, ignore_args=()):
 
 class Variable(str):
     """Type of string representing variable event arguments."""
-    pass
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return str(self)  # no quotes (e.g. inside formatted tuples)
 
 
 class EnumValue:
     """Stores information about an `IntEnum` value, including a proper `repr` for string formatting and `eq` for
     useful value comparisons."""
+    __slots__ = ("type", "type_name", "instance", "name", "value")
+
     def __init__(self, enum: type, value: int):
-        self.type = enum
+        self.instance = enum(value)  # raises `ValueError` before any other attributes are set
+        self.name = self.instance.name
         self.type_name = enum.__name__
-        self.instance = enum(value)
-        self.name = enum(value).name
+        self.type = enum
         self.value = value
 
     def __repr__(self):
@@ -89,123 +185,263 @@ class EnumValue:
     def __eq__(self, other: int):
         return self.value == other
 
+    def __hash__(self):
+        return hash(self.value)
+
     def __getattr__(self, name):
+        if name in EnumValue.__slots__:
+            # Slot was never assigned (e.g. failed construction). Don't recurse into `self.instance`.
+            raise AttributeError(name)
         return getattr(self.instance, name)
 
 
-class InstructionDecompiler(abc.ABC):
+class CutsceneTypeValue(EnumValue):
+    """`EnumValue` of `CutsceneType` with its `skippable` and `fade_out` flags computed on creation."""
+
+    __slots__ = ("skippable", "fade_out")
+
+    def __init__(self, enum: type, value: int):
+        super().__init__(enum, value)
+        self.skippable = self.instance.is_skippable()
+        self.fade_out = self.instance.is_fade_out()
+
+
+@lru_cache(maxsize=None, typed=True)  # typed, as `EnumValue.value` keeps the given `1`, `1.0`, or `True`
+def _get_enum_value(enum: type, value: int) -> EnumValue:
+    """Shared `EnumValue` for each distinct `(enum, value)` pair (and value type). Instances are never modified after
+    creation, and are never evicted (cache size is bounded by enum sizes), so they can be compared by identity.
+
+    Raises `ValueError` (which is not cached) if `value` is not a member of `enum`.
+    """
+    if issubclass(enum, CutsceneType):
+        return CutsceneTypeValue(enum, value)
+    return EnumValue(enum, value)
+
+
+@lru_cache(maxsize=128)
+def _get_arg_struct(arg_type_string: str) -> struct.Struct:
+    """Compiled struct for re-interpreting packed integers as `arg_type_string`."""
+    return struct.Struct("@" + arg_type_string.replace("s", "I"))
+
+
+@lru_cache(maxsize=256, typed=True)  # typed, as `(1, 0)` and `(1, 0.0)` are formatted differently
+def _get_game_map_variable_name(get_map: tp.Callable, area_id, block_id) -> str:
+    """Cached result of `InstructionDecompiler._get_game_map_variable_name()` for game-specific `get_map`."""
+    try:
+        return get_map(area_id, block_id).variable_name
+    except (KeyError, ValueError):
+        return f"({area_id}, {block_id})"
+
+
+class InstructionDecompiler:
     """Converts `Instruction` information to low-level EVS language instructions and tests.
 
     Not yet intelligent enough to produce higher-level features like `if` blocks or `and`/`or` operations.
 
     Subclassed by each game to specify further instructions. Instructions that are shared across the `EMEVD`
     specification for all supported FromSoft games are defined here.
+
+    Methods with a `state: bool` argument test `state is True` and `state is False` in turn and fall back to a generic
+    `...State(...)` call for event arguments. Only the returned branch builds its string, so this is cheaper than
+    indexing a table of format templates by state.
     """
+    __slots__ = ()  # decompilers are stateless; all configuration is on the class
+
     SUSPICIOUS = "  # WARNING: Suspicious usage!"
-    RUN_EVENT_INSTRUCTIONS = [(2000, 0)]
+    RUN_EVENT_INSTRUCTIONS = frozenset({(2000, 0)})
 
     ENUMS = None  # type: tp.Any  # game-specific `enums` module (e.g. `soulstruct.darksouls1r.events.emevd.enums`)
     GET_MAP = None  # type: tp.Callable  # converts `(area_id, block_id)` to `GameMap` instance
 
-    def decompile(self, instruction_class, instruction_index, req_args, opt_args, arg_types=None) -> str:
+    # Maps packed `instruction_class << 16 | instruction_index` opcodes to instruction methods (and to run event
+    # opcodes, below). Built for this class and each subclass on creation, which takes well under a millisecond each.
+    _DISPATCH = {}  # type: dict[int, tp.Callable[..., str]]
+    _RUN_EVENT_OPCODES = frozenset()  # type: frozenset[int]
+
+    # Shared `EnumValue` instances of `ENUMS` members that instruction methods test for, compared with `is`. Set for
+    # each subclass with `ENUMS` on creation.
+    _REGION = None  # type: tp.Optional[EnumValue]
+    _EQUAL = None  # type: tp.Optional[EnumValue]
+    _GREATER_THAN = None  # type: tp.Optional[EnumValue]
+    _GREATER_THAN_OR_EQUAL = None  # type: tp.Optional[EnumValue]
+    _LESS_THAN_OR_EQUAL = None  # type: tp.Optional[EnumValue]
+    _HUMAN = None  # type: tp.Optional[EnumValue]
+    _HOLLOW = None  # type: tp.Optional[EnumValue]
+    _ABSOLUTE = None  # type: tp.Optional[EnumValue]
+    _CHANGE = None  # type: tp.Optional[EnumValue]
+    _UNSPECIFIED_DAMAGE = None  # type: tp.Optional[EnumValue]  # only for games with `DamageType`
+
+    # Default `IfActionButton` keyword arguments for variable, region, and entity `anchor_type`, respectively. Shared
+    # (read-only) by all calls. Set for each subclass with `ENUMS` on creation.
+    _ACTION_BUTTON_DEFAULTS = None  # type: tp.Optional[tp.Mapping[str, tp.Any]]
+    _REGION_ACTION_BUTTON_DEFAULTS = None  # type: tp.Optional[tp.Mapping[str, tp.Any]]
+    _ENTITY_ACTION_BUTTON_DEFAULTS = None  # type: tp.Optional[tp.Mapping[str, tp.Any]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_dispatch()
+        if cls.ENUMS is not None:
+            comparison_type = cls.ENUMS.ComparisonType
+            cls._REGION = _get_enum_value(cls.ENUMS.CoordEntityType, int(cls.ENUMS.CoordEntityType.Region))
+            cls._EQUAL = _get_enum_value(comparison_type, int(comparison_type.Equal))
+            cls._GREATER_THAN = _get_enum_value(comparison_type, int(comparison_type.GreaterThan))
+            cls._GREATER_THAN_OR_EQUAL = _get_enum_value(comparison_type, int(comparison_type.GreaterThanOrEqual))
+            cls._LESS_THAN_OR_EQUAL = _get_enum_value(comparison_type, int(comparison_type.LessThanOrEqual))
+            cls._HUMAN = _get_enum_value(cls.ENUMS.CharacterType, int(cls.ENUMS.CharacterType.Human))
+            cls._HOLLOW = _get_enum_value(cls.ENUMS.CharacterType, int(cls.ENUMS.CharacterType.Hollow))
+            cls._ABSOLUTE = _get_enum_value(cls.ENUMS.FlagType, int(cls.ENUMS.FlagType.Absolute))
+            cls._CHANGE = _get_enum_value(cls.ENUMS.FlagState, int(cls.ENUMS.FlagState.Change))
+            if hasattr(cls.ENUMS, "DamageType"):
+                cls._UNSPECIFIED_DAMAGE = _get_enum_value(cls.ENUMS.DamageType, int(cls.ENUMS.DamageType.Unspecified))
+            action_button_defaults = {"trigger_attribute": cls.ENUMS.TriggerAttribute.Human_or_Hollow, "button": 0}
+            cls._ACTION_BUTTON_DEFAULTS = MappingProxyType(action_button_defaults)
+            cls._REGION_ACTION_BUTTON_DEFAULTS = MappingProxyType({
+                **action_button_defaults, "facing_angle": 0.0, "max_distance": 0.0, "model_point": -1
+            })
+            cls._ENTITY_ACTION_BUTTON_DEFAULTS = MappingProxyType(
+                {**action_button_defaults, "facing_angle": 180.0, "max_distance": 2.0}
+            )
+
+    @classmethod
+    def _build_dispatch(cls):
+        """Build `_DISPATCH` and `_RUN_EVENT_OPCODES` from this class's `_{class}_{index:02d}` instruction methods."""
+        cls.RUN_EVENT_INSTRUCTIONS = frozenset(cls.RUN_EVENT_INSTRUCTIONS)  # in case subclass used a list
+        cls._RUN_EVENT_OPCODES = frozenset(c << 16 | i for c, i in cls.RUN_EVENT_INSTRUCTIONS)
+        dispatch = {}
+        method_names = {}
+        for attr_name in dir(cls):
+            if match := _INSTRUCTION_METHOD_RE.fullmatch(attr_name):
+                opcode = int(match.group(1)) << 16 | int(match.group(2))
+                if opcode in dispatch:
+                    raise ValueError(
+                        f"Instruction methods `{method_names[opcode]}` and `{attr_name}` of `{cls.__name__}` have the "
+                        f"same instruction class and index."
+                    )
+                dispatch[opcode] = getattr(cls, attr_name)
+                method_names[opcode] = attr_name
+        cls._DISPATCH = dispatch
+
+    def decompile(
+        self, instruction_class: int, instruction_index: int, req_args, opt_args, arg_types: str = None
+    ) -> str:
         """Check instruction arguments and call the appropriate instruction method."""
-        if (instruction_class, instruction_index) in self.RUN_EVENT_INSTRUCTIONS:
-            return self._call(instruction_class, instruction_index, req_args, opt_args, arg_types)
+        opcode = instruction_class << 16 | instruction_index
+        if opcode in self._RUN_EVENT_OPCODES:
+            return self._call(opcode, instruction_class, instruction_index, req_args, opt_args, arg_types)
         elif opt_args or arg_types:
             _LOGGER.error(
                 f"Command {instruction_class}[{instruction_index:02d}] cannot use optional arguments or types: "
                 f"args = {req_args}, opt_args = {opt_args}, arg_types = {arg_types}"
             )
             raise ValueError(f"Command {instruction_class}[{instruction_index:02d}] cannot use optional arguments.")
-        return self._call(instruction_class, instruction_index, *req_args)
+        return self._call(opcode, instruction_class, instruction_index, *req_args)
 
-    def _call(self, instruction_class, instruction_index, *args):
-        try:
-            instr_method = getattr(self, f"_{instruction_class}_{instruction_index:02d}")
-        except AttributeError:
+    def decompile_many(self, instructions: tp.Sequence[tuple]) -> list[str]:
+        """Decompile a sequence of `(instruction_class, instruction_index, req_args, opt_args, arg_types)` tuples.
+
+        Gives the same results as calling `decompile()` on each tuple, with per-instruction lookups hoisted out of the
+        loop. Run event instructions, unknown instructions, and invalid optional arguments are passed to `decompile()`.
+        """
+        dispatch = self._DISPATCH
+        run_event_opcodes = self._RUN_EVENT_OPCODES
+        decompiled = [None] * len(instructions)
+        for i, (instruction_class, instruction_index, req_args, opt_args, arg_types) in enumerate(instructions):
+            opcode = instruction_class << 16 | instruction_index
+            instr_method = dispatch.get(opcode)
+            if instr_method is None or opt_args or arg_types or opcode in run_event_opcodes:
+                decompiled[i] = self.decompile(instruction_class, instruction_index, req_args, opt_args, arg_types)
+                continue
+            try:
+                decompiled[i] = instr_method(self, *req_args)
+            except Exception:
+                _LOGGER.error(
+                    f"Could not decompile instruction {instruction_class}[{instruction_index:02d}].\nArgs: {req_args}"
+                )
+                raise
+        return decompiled
+
+    def _call(self, opcode: int, instruction_class: int, instruction_index: int, *args) -> str:
+        instr_method = self._DISPATCH.get(opcode)
+        if instr_method is None:
             raise InstructionNotFoundError(
                 f"Unknown instruction in decompiler: {instruction_class}[{instruction_index:02d}].")
         try:
-            instr_string = instr_method(*args)
+            instr_string = instr_method(self, *args)
         except Exception:
             _LOGGER.error(
                 f"Could not decompile instruction {instruction_class}[{instruction_index:02d}].\nArgs: {args}"
             )
             raise
-        return instr_string.replace("'", "")  # f-string '=' printing puts strings (event arguments) in single quotes
+        return instr_string
 
-    def _get_game_map_variable_name(self, area_id, block_id):
+    def _get_game_map_variable_name(self, area_id, block_id) -> str:
         """Attempts to get the EVS variable name of the game map, like "UNDEAD_BURG".
 
         Falls back to "(area_id, block_id)" tuple (e.g. for event arguments or custom map IDs).
         """
-        try:
-            return self.GET_MAP(area_id, block_id).variable_name
-        except (KeyError, ValueError):
-            return f"({area_id}, {block_id})"
-
-    def _set_enums(self, parameters: dict, type_hints: dict):
-        """Modifies dictionary in-place by replacing detected enum values with their string names."""
-        for key, value in parameters.items():
-            if enum_class := type_hints.get(key, None):
-                if enum_class is bool:
-                    parameters[key] = Variable(value) if isinstance(value, str) else bool(value)
-                elif enum_class is EntityEnum:
-                    try:
-                        parameters[key] = EnumValue(enum_class, value).name.upper()  # all-caps name (e.g. `PLAYER`)
-                    except ValueError:
-                        continue  # leave as entity ID
-                else:
-                    try:
-                        enum = getattr(self.ENUMS, enum_class.__name__)  # get real enum class from game-specific module
-                    except AttributeError:
-                        raise ValueError(f"Invalid enum type for decompiler (arg '{key}'): {enum_class.__name__}")
-                    try:
-                        parameters[key] = EnumValue(enum, value)
-                    except ValueError:
-                        if isinstance(value, str):
-                            parameters[key] = Variable(value)  # event argument
-                        else:
-                            raise ValueError(f"Invalid {str(enum)} value: {value}")
+        return _get_game_map_variable_name(self.GET_MAP, area_id, block_id)
+
+    def _get_action_button_defaults(self, anchor_type) -> tp.Mapping[str, tp.Any]:
+        """Default `IfActionButton` keyword arguments for `anchor_type`, as a shared read-only mapping."""
+        if type(anchor_type) is Variable:
+            return self._ACTION_BUTTON_DEFAULTS
+        if anchor_type is self._REGION:
+            return self._REGION_ACTION_BUTTON_DEFAULTS
+        return self._ENTITY_ACTION_BUTTON_DEFAULTS
 
     @staticmethod
-    def _any_vars(*args):
-        return any(isinstance(v, Variable) for v in args)
+    def _any_vars(*args) -> bool:
+        return Variable in map(type, args)  # `Variable` is never subclassed
 
     @staticmethod
-    def _assemble_arg_string(defaults: dict, *args, **kwargs):
+    def _assemble_arg_string(defaults: tp.Mapping[str, tp.Any], *args, **kwargs) -> str:
         """Assemble a string of `args` (without argument names) and `kwargs` (with argument names) in the given order.
         Any kwarg whose value matches the same key's value in `defaults` is left out.
 
         The values of `args` and `kwargs` should be ready for string formatting.
         """
-        arguments = [f"{arg}" for arg in args]
+        arguments = list(map(str, args))
+        get_default = defaults.get
         for kwarg, value in kwargs.items():
-            try:
-                default = defaults[kwarg]
-            except KeyError:
+            if value != get_default(kwarg, _NO_DEFAULT):  # never equal to `_NO_DEFAULT`
                 arguments.append(f"{kwarg}={value}")
-            else:
-                if value != default:
-                    arguments.append(f"{kwarg}={value}")
         return ", ".join(arguments)
 
+    def _get_flag_test(self, state: EnumValue, flag_type: EnumValue, flag, *args) -> tp.Optional[str]:
+        """Name and arguments of the simple flag test for non-variable `state` and `flag_type` (e.g.
+        "FlagOn(*args, flag)" or "ThisEventSlotOff(*args)"), to follow an instruction prefix like "SkipLinesIf".
+
+        Returns None if there is no simple test for these arguments.
+        """
+        if flag_type is self._ABSOLUTE:
+            return f"Flag{state.name}({', '.join(map(str, args + (flag,)))})"
+        if flag == 0 and (flag_type_name := _RELATIVE_FLAG_TEST_NAMES.get(flag_type.value)):
+            return f"{flag_type_name}{state.name}({', '.join(map(str, args))})"
+        return None
+
     @staticmethod
-    def _process_args(integer_args, arg_type_string):
+    def _format_args(args: tuple) -> str:
+        """Format `args` like a tuple, but without putting strings (event arguments) in quotes."""
+        if len(args) == 1:
+            return f"({args[0]},)"
+        return "(" + ", ".join(map(str, args)) + ")"
+
+    @staticmethod
+    def _process_args(integer_args: tp.Sequence[int], arg_type_string: str) -> tuple:
         """Re-interpret integer data as a given struct."""
-        true_arg_type_string = arg_type_string.replace("s", "I")
-        packed = struct.pack(len(integer_args) * "I", *integer_args)
-        return struct.unpack("@" + true_arg_type_string, packed[: struct.calcsize(true_arg_type_string)])
+        try:
+            packed = array.array("I", integer_args).tobytes()
+        except OverflowError as ex:
+            raise struct.error(f"Event arguments cannot be packed as unsigned integers: {integer_args}") from ex
+        return _get_arg_struct(arg_type_string).unpack_from(packed)
 
     @staticmethod
-    def _set_state(state_type, state: bool, entity: tp.Any = ""):
+    def _set_state(state_type, state: bool, entity: tp.Any = "") -> str:
         """Generates a simple 'Enable{state_type}', 'Disable{state_type}', or 'Set{state_type}State' instruction."""
-        if state is True:
-            return f"Enable{state_type}({entity})"
-        elif state is False:
-            return f"Disable{state_type}({entity})"
+        if type(state) is bool:  # `bool` cannot be subclassed
+            return f"{_STATE_PREFIXES[state]}{state_type}({entity})"
         # Variable `state`.
-        return f"Set{state_type}State(" + (f"{entity}, " if entity else "") + f"{state=})"
+        return f"Set{state_type}State(" + (f"{entity}, " if entity else "") + f"state={state})"
 
     def _2000_00(self, req_args, opt_args, arg_types):
         slot, event_id, first_arg = req_args
@@ -213,7 +449,7 @@ class InstructionDecompiler(abc.ABC):
             req_args = (first_arg, *opt_args)
             if not arg_types.replace("i", ""):
                 # All signed integers (default).
-                return f"RunEvent({event_id}, {slot=}, args={req_args})"
+                return f"RunEvent({event_id}, slot={slot}, args={self._format_args(req_args)})"
             elif all(isinstance(i, int) for i in req_args):
                 try:
                     req_args = self._process_args(req_args, arg_types)
@@ -223,15 +459,15 @@ class InstructionDecompiler(abc.ABC):
                         f"args = {req_args}, arg_types = {arg_types}"
                     )
                     raise
-            return f"RunEvent({event_id}, {slot=}, args={req_args}, arg_types=\"{arg_types}\")"
+            return f"RunEvent({event_id}, slot={slot}, args={self._format_args(req_args)}, arg_types=\"{arg_types}\")"
         elif not opt_args and first_arg == 0:
             # NOTE: Some Bloodborne events use slots for events without optional arguments.
             if slot != 0:
-                return f"RunEvent({event_id}, {slot=})"
+                return f"RunEvent({event_id}, slot={slot})"
             return f"RunEvent({event_id})"
         else:
             # Assume all integers.
-            return f"RunEvent({event_id}, {slot=}, args={(first_arg, *opt_args)})"
+            return f"RunEvent({event_id}, slot={slot}, args={self._format_args((first_arg, *opt_args))})"
 
     # ~~~~~~~~~~~~~~ #
     # ~~~ SYSTEM ~~~ #
@@ -261,18 +497,24 @@ class InstructionDecompiler(abc.ABC):
     def _2002_02(self, cutscene_id, cutscene_type: CutsceneType, move_to_region, area_id, block_id):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         if self._any_vars(cutscene_type):
-            return f"PlayCutsceneAndMovePlayer({cutscene_id}, {cutscene_type=}, {move_to_region=}, {move_to_map=})"
-        skippable = cutscene_type.is_skippable()
-        fade_out = cutscene_type.is_fade_out()
-        return f"PlayCutscene({cutscene_id}, {skippable=}, {fade_out=}, {move_to_region=}, {move_to_map=})"
+            return (
+                f"PlayCutsceneAndMovePlayer({cutscene_id}, cutscene_type={cutscene_type}, "
+                f"move_to_region={move_to_region}, move_to_map={move_to_map})"
+            )
+        skippable = cutscene_type.skippable
+        fade_out = cutscene_type.fade_out
+        return (
+            f"PlayCutscene({cutscene_id}, skippable={skippable}, fade_out={fade_out}, move_to_region={move_to_region}, "
+            f"move_to_map={move_to_map})"
+        )
 
     @parse_parameters
     def _2002_03(self, cutscene_id, cutscene_type: CutsceneType, player_id: EntityEnum):
         if self._any_vars(cutscene_type):
-            return f"PlayCutsceneToPlayer({cutscene_id}, {cutscene_type=}, {player_id=})"
-        skippable = cutscene_type.is_skippable()
-        fade_out = cutscene_type.is_fade_out()
-        return f"PlayCutscene({cutscene_id}, {skippable=}, {fade_out=}, {player_id=})"
+            return f"PlayCutsceneToPlayer({cutscene_id}, cutscene_type={cutscene_type}, player_id={player_id})"
+        skippable = cutscene_type.skippable
+        fade_out = cutscene_type.fade_out
+        return f"PlayCutscene({cutscene_id}, skippable={skippable}, fade_out={fade_out}, player_id={player_id})"
 
     @parse_parameters
     def _2002_04(
@@ -287,13 +529,14 @@ class InstructionDecompiler(abc.ABC):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         if self._any_vars(cutscene_type):
             return (
-                f"PlayCutsceneAndMoveSpecificPlayer({cutscene_id}, {cutscene_type=}, {move_to_region=}, "
-                f"{move_to_map=}, {player_id=})"
+                f"PlayCutsceneAndMoveSpecificPlayer({cutscene_id}, cutscene_type={cutscene_type}, "
+                f"move_to_region={move_to_region}, move_to_map={move_to_map}, player_id={player_id})"
             )
-        skippable = cutscene_type.is_skippable()
-        fade_out = cutscene_type.is_fade_out()
+        skippable = cutscene_type.skippable
+        fade_out = cutscene_type.fade_out
         return (
-            f"PlayCutscene({cutscene_id}, {skippable=}, {fade_out=}, {player_id=}, {move_to_region=}, {move_to_map=})"
+            f"PlayCutscene({cutscene_id}, skippable={skippable}, fade_out={fade_out}, player_id={player_id}, "
+            f"move_to_region={move_to_region}, move_to_map={move_to_map})"
         )
 
     @parse_parameters
@@ -309,14 +552,17 @@ class InstructionDecompiler(abc.ABC):
     ):
         if self._any_vars(cutscene_type):
             return (
-                f"PlayCutsceneAndRotatePlayer({cutscene_id}, {cutscene_type=}, {relative_rotation_axis_x=}, "
-                f"{relative_rotation_axis_z=}, {rotation=}, {vertical_translation=}, {player_id=})"
+                f"PlayCutsceneAndRotatePlayer({cutscene_id}, cutscene_type={cutscene_type}, "
+                f"relative_rotation_axis_x={relative_rotation_axis_x}, "
+                f"relative_rotation_axis_z={relative_rotation_axis_z}, rotation={rotation}, "
+                f"vertical_translation={vertical_translation}, player_id={player_id})"
             )
-        skippable = cutscene_type.is_skippable()
-        fade_out = cutscene_type.is_fade_out()
+        skippable = cutscene_type.skippable
+        fade_out = cutscene_type.fade_out
         return (
-            f"PlayCutscene({cutscene_id=}, {skippable=}, {fade_out=}, {player_id=}, {rotation=}, "
-            f"{relative_rotation_axis_x=}, {relative_rotation_axis_z=}, {vertical_translation=})"
+            f"PlayCutscene(cutscene_id={cutscene_id}, skippable={skippable}, fade_out={fade_out}, "
+            f"player_id={player_id}, rotation={rotation}, relative_rotation_axis_x={relative_rotation_axis_x}, "
+            f"relative_rotation_axis_z={relative_rotation_axis_z}, vertical_translation={vertical_translation})"
         )
 
     # ~~~~~~~~~~~~~ #
@@ -357,20 +603,20 @@ class InstructionDecompiler(abc.ABC):
         if event_return_type == 1:
             if slot == 0:
                 return f"RestartEvent({event_id})"
-            return f"RestartEvent({event_id}, {slot=})"
+            return f"RestartEvent({event_id}, slot={slot})"
         elif event_return_type == 0:
             if slot == 0:
                 return f"StopEvent({event_id})"
-            return f"StopEvent({event_id}, {slot=})"
-        return f"SetEventState({event_id}, {slot=}, {event_return_type=})"
+            return f"StopEvent({event_id}, slot={slot})"
+        return f"SetEventState({event_id}, slot={slot}, event_return_type={event_return_type})"
 
     @parse_parameters
     def _2003_11(self, state: bool, character: EntityEnum, slot, name):
         if state == 1:
-            return f"EnableBossHealthBar({character}, {name=}, {slot=})"
+            return f"EnableBossHealthBar({character}, name={name}, slot={slot})"
         elif state == 0:
-            return f"DisableBossHealthBar({character}, {name=}, {slot=})"
-        return f"SetBossHealthBarState({character}, {name=}, {slot=}, {state=})"
+            return f"DisableBossHealthBar({character}, name={name}, slot={slot})"
+        return f"SetBossHealthBarState({character}, name={name}, slot={slot}, state={state})"
 
     @parse_parameters("KillBoss", no_name_count=1)
     def _2003_12(self, game_area_param_id):
@@ -389,12 +635,12 @@ class InstructionDecompiler(abc.ABC):
             return f"DisableNavmeshType({navmesh_id}, {navmesh_type})"
         elif operation == 0:
             return f"EnableNavmeshType({navmesh_id}, {navmesh_type})"
-        return f"SetNavmeshType({navmesh_id}, {navmesh_type}, {operation=})"
+        return f"SetNavmeshType({navmesh_id}, {navmesh_type}, operation={operation})"
 
     @parse_parameters
     def _2003_14(self, area_id, block_id, player_start):
         game_map = self._get_game_map_variable_name(area_id, block_id)
-        return f"WarpToMap({game_map=}, {player_start=})"
+        return f"WarpToMap(game_map={game_map}, player_start={player_start})"
 
     @parse_parameters("TriggerMultiplayerEvent", no_name_count=1)
     def _2003_16(self, multiplayer_event_id):
@@ -406,7 +652,7 @@ class InstructionDecompiler(abc.ABC):
             return f"EnableRandomFlagInRange(({first_flag}, {last_flag}))"
         elif state == 0:
             return f"DisableRandomFlagInRange(({first_flag}, {last_flag}))"
-        return f"SetRandomFlagInRange(({first_flag}, {last_flag}), {state=})"
+        return f"SetRandomFlagInRange(({first_flag}, {last_flag}), state={state})"
 
     @parse_parameters("ForceAnimation", no_name_count=2)
     def _2003_18(
@@ -437,13 +683,13 @@ class InstructionDecompiler(abc.ABC):
 
     @parse_parameters
     def _2003_24(self, item_type: ItemType, item_id, quantity):
-        if isinstance(item_type, Variable):
+        if type(item_type) is Variable:
             if quantity > 0:
-                return f"RemoveItemFromPlayer({item_id}, {item_type=}, {quantity=})"
-            return f"RemoveItemFromPlayer({item_id}, {item_type=})"
+                return f"RemoveItemFromPlayer({item_id}, item_type={item_type}, quantity={quantity})"
+            return f"RemoveItemFromPlayer({item_id}, item_type={item_type})"
         else:
             if quantity > 0:
-                return f"Remove{item_type.name}FromPlayer({item_id}, {quantity=})"
+                return f"Remove{item_type.name}FromPlayer({item_id}, quantity={quantity})"
             return f"Remove{item_type.name}FromPlayer({item_id})"
 
     @parse_parameters("PlaceSummonSign", no_name_count=2)
@@ -472,7 +718,7 @@ class InstructionDecompiler(abc.ABC):
             return "DisableVagrantSpawning()"
         elif spawning_disabled == 0:
             return "EnableVagrantSpawning()"
-        return f"SetVagrantSpawningState({spawning_disabled=})"
+        return f"SetVagrantSpawningState(spawning_disabled={spawning_disabled})"
 
     @parse_parameters("IncrementEventValue", no_name_count=1)
     def _2003_31(self, flag, bit_count, max_value):
@@ -534,9 +780,14 @@ class InstructionDecompiler(abc.ABC):
         destination,
         model_point,
     ):
-        if not self._any_vars(destination_type) and destination_type.name == "Region" and model_point == -1:
-            return f"Move({character}, {destination=}, {destination_type=})"  # default model point
-        return f"Move({character}, {destination=}, {destination_type=}, {model_point=})"
+        if not self._any_vars(destination_type) and destination_type is self._REGION and model_point == -1:
+            return (  # default model point
+                f"Move({character}, destination={destination}, destination_type={destination_type})"
+            )
+        return (
+            f"Move({character}, destination={destination}, destination_type={destination_type}, "
+            f"model_point={model_point})"
+        )
 
     @parse_parameters("Kill", no_name_count=1)
     def _2004_04(self, character: EntityEnum, award_souls: bool):
@@ -566,9 +817,6 @@ class InstructionDecompiler(abc.ABC):
         death_animation,
         standby_return_animation,
     ):
-        animations = (
-            "standby_animation", "damage_animation", "cancel_animation", "death_animation", "standby_return_animation"
-        )
         if all(
             anim == -1 for anim in (
                 standby_animation, damage_animation, cancel_animation, death_animation, standby_return_animation
@@ -576,7 +824,7 @@ class InstructionDecompiler(abc.ABC):
         ):
             return f"ResetStandbyAnimationSettings({character})"
         arg_string = self._assemble_arg_string(
-            {anim: -1 for anim in animations},
+            _STANDBY_ANIMATION_DEFAULTS,
             character,
             standby_animation=standby_animation,
             damage_animation=damage_animation,
@@ -677,7 +925,7 @@ class InstructionDecompiler(abc.ABC):
             return f"DisableBackread({character})"
         elif remove is False:
             return f"EnableBackread({character})"
-        return f"SetBackreadState({character}, {remove=})"
+        return f"SetBackreadState({character}, remove={remove})"
 
     @parse_parameters
     def _2004_30(self, character: EntityEnum, state: bool):
@@ -690,7 +938,7 @@ class InstructionDecompiler(abc.ABC):
             return f"DisableCharacterCollision({character})"
         elif is_disabled == 0:
             return f"EnableCharacterCollision({character})"
-        return f"SetCharacterCollisionState({character}, {is_disabled=})"
+        return f"SetCharacterCollisionState({character}, is_disabled={is_disabled})"
 
     @parse_parameters("AIEvent", no_name_count=1)
     def _2004_32(self, character: EntityEnum, command_id, slot, first_event_flag, last_event_flag):
@@ -733,9 +981,15 @@ class InstructionDecompiler(abc.ABC):
         model_point,
         set_draw_parent,
     ):
-        if not self._any_vars(destination_type) and destination_type.name == "Region" and model_point == -1:
-            return f"Move({character}, {destination=}, {destination_type=}, {set_draw_parent=})"  # default model point
-        return f"Move({character}, {destination=}, {destination_type=}, {model_point=}, {set_draw_parent=})"
+        if not self._any_vars(destination_type) and destination_type is self._REGION and model_point == -1:
+            return (  # default model point
+                f"Move({character}, destination={destination}, destination_type={destination_type}, "
+                f"set_draw_parent={set_draw_parent})"
+            )
+        return (
+            f"Move({character}, destination={destination}, destination_type={destination_type}, "
+            f"model_point={model_point}, set_draw_parent={set_draw_parent})"
+        )
 
     @parse_parameters
     def _2004_41(
@@ -745,9 +999,14 @@ class InstructionDecompiler(abc.ABC):
         destination,
         model_point,
     ):
-        if not self._any_vars(destination_type) and destination_type.name == "Region" and model_point == -1:
-            return f"Move({character}, {destination=}, {destination_type=}, short_move=True)"  # default model point
-        return f"Move({character}, {destination=}, {destination_type=}, {model_point=}, short_move=True)"
+        if not self._any_vars(destination_type) and destination_type is self._REGION and model_point == -1:
+            return (  # default model point
+                f"Move({character}, destination={destination}, destination_type={destination_type}, short_move=True)"
+            )
+        return (
+            f"Move({character}, destination={destination}, destination_type={destination_type}, "
+            f"model_point={model_point}, short_move=True)"
+        )
 
     @parse_parameters
     def _2004_42(
@@ -758,9 +1017,15 @@ class InstructionDecompiler(abc.ABC):
         model_point,
         copy_draw_parent: EntityEnum,
     ):
-        if not self._any_vars(destination_type) and destination_type.name == "Region" and model_point == -1:
-            return f"Move({character}, {destination=}, {destination_type=}, {copy_draw_parent=})"  # default model point
-        return f"Move({character}, {destination=}, {destination_type=}, {model_point=}, {copy_draw_parent=})"
+        if not self._any_vars(destination_type) and destination_type is self._REGION and model_point == -1:
+            return (  # default model point
+                f"Move({character}, destination={destination}, destination_type={destination_type}, "
+                f"copy_draw_parent={copy_draw_parent})"
+            )
+        return (
+            f"Move({character}, destination={destination}, destination_type={destination_type}, "
+            f"model_point={model_point}, copy_draw_parent={copy_draw_parent})"
+        )
 
     @parse_parameters("ResetAnimation", no_name_count=1)
     def _2004_43(self, character: EntityEnum, disable_interpolation: bool):
@@ -808,7 +1073,7 @@ class InstructionDecompiler(abc.ABC):
 
     @parse_parameters
     def _2005_06(self, obj, obj_act_id, state: bool):
-        return self._set_state("ObjectActivation", state, entity=f"{obj}, {obj_act_id=}")
+        return self._set_state("ObjectActivation", state, entity=f"{obj}, obj_act_id={obj_act_id}")
 
     @parse_parameters("EndOfAnimation", no_name_count=2)
     def _2005_07(self, obj, animation_id):
@@ -836,7 +1101,7 @@ class InstructionDecompiler(abc.ABC):
     @parse_parameters
     def _2005_10(self, obj, area_id, block_id, statue_type: StatueType):
         game_map = self._get_game_map_variable_name(area_id, block_id)
-        return f"RegisterStatue({obj}, {game_map=}, {statue_type=})"
+        return f"RegisterStatue({obj}, game_map={game_map}, statue_type={statue_type})"
 
     @parse_parameters("MoveObjectToCharacter", no_name_count=1)
     def _2005_11(self, obj, character: EntityEnum, model_point):
@@ -854,10 +1119,13 @@ class InstructionDecompiler(abc.ABC):
     def _2005_14(self, obj, obj_act_id, relative_index, state: bool):
         """Defers to a wrapper instruction shared with 2005_06 if `state` is not an event argument."""
         if state is True:
-            return f"EnableObjectActivation({obj}, {obj_act_id=}, {relative_index=})"
+            return f"EnableObjectActivation({obj}, obj_act_id={obj_act_id}, relative_index={relative_index})"
         elif state == 0:
-            return f"DisableObjectActivation({obj}, {obj_act_id=}, {relative_index=})"
-        return f"SetObjectActivationWithIdx({obj}, {obj_act_id=}, {relative_index=}, {state=})"
+            return f"DisableObjectActivation({obj}, obj_act_id={obj_act_id}, relative_index={relative_index})"
+        return (
+            f"SetObjectActivationWithIdx({obj}, obj_act_id={obj_act_id}, relative_index={relative_index}, "
+            f"state={state})"
+        )
 
     @parse_parameters("EnableTreasureCollection", no_name_count=1)
     def _2005_15(self, obj):
@@ -884,14 +1152,17 @@ class InstructionDecompiler(abc.ABC):
         vfx_id,
     ):
         """Argument order changed."""
-        if not self._any_vars(anchor_type) and anchor_type.name == "Region" and model_point == -1:
-            return f"CreateTemporaryVFX({vfx_id}, {anchor_entity=}, {anchor_type=})"
-        return f"CreateTemporaryVFX({vfx_id}, {anchor_entity=}, {anchor_type=}, {model_point=})"
+        if not self._any_vars(anchor_type) and anchor_type is self._REGION and model_point == -1:
+            return f"CreateTemporaryVFX({vfx_id}, anchor_entity={anchor_entity}, anchor_type={anchor_type})"
+        return (
+            f"CreateTemporaryVFX({vfx_id}, anchor_entity={anchor_entity}, anchor_type={anchor_type}, "
+            f"model_point={model_point})"
+        )
 
     @parse_parameters
     def _2006_04(self, obj, model_point, vfx_id):
         """Argument order changed."""
-        return f"CreateObjectVFX({vfx_id}, {obj=}, {model_point=})"
+        return f"CreateObjectVFX({vfx_id}, obj={obj}, model_point={model_point})"
 
     @parse_parameters("DeleteObjectVFX", no_name_count=1)
     def _2006_05(self, obj, erase_root: bool):
@@ -910,7 +1181,10 @@ class InstructionDecompiler(abc.ABC):
         anchor_entity,
         display_distance,
     ):
-        return f"DisplayDialog({text_id}, {anchor_entity=}, {display_distance=}, {button_type=}, {number_buttons=})"
+        return (
+            f"DisplayDialog({text_id}, anchor_entity={anchor_entity}, display_distance={display_distance}, "
+            f"button_type={button_type}, number_buttons={number_buttons})"
+        )
 
     @parse_parameters("DisplayBanner", no_name_count=1)
     def _2007_02(self, banner_type: BannerType):
@@ -962,20 +1236,22 @@ class InstructionDecompiler(abc.ABC):
         decay_start_distance,
         decay_end_distance,
     ):
-        if not self._any_vars(anchor_type) and anchor_type.name == "Region" and model_point == -1:
+        if not self._any_vars(anchor_type) and anchor_type is self._REGION and model_point == -1:
             return (
-                f"SetCameraVibration({vibration_id=}, {anchor_entity=}, {decay_start_distance=}, "
-                f"{decay_end_distance=}, {anchor_type=})"
+                f"SetCameraVibration(vibration_id={vibration_id}, anchor_entity={anchor_entity}, "
+                f"decay_start_distance={decay_start_distance}, decay_end_distance={decay_end_distance}, "
+                f"anchor_type={anchor_type})"
             )
         return (
-            f"SetCameraVibration({vibration_id=}, {anchor_entity=}, {model_point=}, {decay_start_distance=}, "
-            f"{decay_end_distance=}, {anchor_type=})"
+            f"SetCameraVibration(vibration_id={vibration_id}, anchor_entity={anchor_entity}, "
+            f"model_point={model_point}, decay_start_distance={decay_start_distance}, "
+            f"decay_end_distance={decay_end_distance}, anchor_type={anchor_type})"
         )
 
     @parse_parameters
     def _2008_03(self, area_id, block_id, camera_slot):
         game_map = self._get_game_map_variable_name(area_id, block_id)
-        return f"SetLockedCameraSlot({game_map=}, {camera_slot=})"
+        return f"SetLockedCameraSlot(game_map={game_map}, camera_slot={camera_slot})"
 
     # ~~~~~~~~~~~~~~ #
     # ~~~ SCRIPT ~~~ #
@@ -1048,7 +1324,7 @@ class InstructionDecompiler(abc.ABC):
             return f"AwaitConditionTrue({condition})"
         if state is False:
             return f"AwaitConditionFalse({condition})"
-        return f"AwaitConditionState({state=}, {condition=})"
+        return f"AwaitConditionState(state={state}, condition={condition})"
 
     @parse_parameters
     def _1000_01(self, line_count, state: bool, condition):
@@ -1056,12 +1332,15 @@ class InstructionDecompiler(abc.ABC):
             return f"SkipLinesIfConditionTrue({line_count}, {condition})"
         elif state is False:
             return f"SkipLinesIfConditionFalse({line_count}, {condition})"
-        return f"SkipLinesIfConditionState({line_count}, {state=}, {condition=})"
+        return f"SkipLinesIfConditionState({line_count}, state={state}, condition={condition})"
 
     @parse_parameters
     def _1000_02(self, event_return_type: EventReturnType, state: bool, input_condition):
         if self._any_vars(event_return_type, state):
-            return f"ReturnIfConditionState({event_return_type=}, {state=}, {input_condition=})"
+            return (
+                f"ReturnIfConditionState(event_return_type={event_return_type}, state={state}, "
+                f"input_condition={input_condition})"
+            )
         return f"{event_return_type.name}IfCondition{state}({input_condition})"
 
     @parse_parameters("SkipLines", no_name_count=1)
@@ -1072,13 +1351,13 @@ class InstructionDecompiler(abc.ABC):
     def _1000_04(self, event_return_type: EventReturnType):
         if not self._any_vars(event_return_type):
             return f"{event_return_type.name}()"
-        return f"Return({event_return_type=})"
+        return f"Return(event_return_type={event_return_type})"
 
     @parse_parameters
     def _1000_05(self, line_count, comparison_type: ComparisonType, left, right):
-        if isinstance(comparison_type, Variable):
-            return f"SkipLinesIfComparison({line_count}, {comparison_type=}, {left=}, {right=})"
-        return f"SkipLinesIf{comparison_type.name}({line_count}, {left=}, {right=})"
+        if type(comparison_type) is Variable:
+            return f"SkipLinesIfComparison({line_count}, comparison_type={comparison_type}, left={left}, right={right})"
+        return f"SkipLinesIf{comparison_type.name}({line_count}, left={left}, right={right})"
 
     @parse_parameters()
     def _1000_06(
@@ -1089,8 +1368,11 @@ class InstructionDecompiler(abc.ABC):
         right,
     ):
         if self._any_vars(event_return_type, comparison_type):
-            return f"ReturnIfComparison({event_return_type=}, {comparison_type=}, {left=}, {right=})"
-        return f"{event_return_type.name}If{comparison_type.name}({left=}, {right=})"
+            return (
+                f"ReturnIfComparison(event_return_type={event_return_type}, comparison_type={comparison_type}, "
+                f"left={left}, right={right})"
+            )
+        return f"{event_return_type.name}If{comparison_type.name}(left={left}, right={right})"
 
     @parse_parameters
     def _1000_07(self, line_count, state: bool, input_condition):
@@ -1098,12 +1380,15 @@ class InstructionDecompiler(abc.ABC):
             return f"SkipLinesIfFinishedConditionTrue({line_count}, {input_condition})"
         elif state is False:
             return f"SkipLinesIfFinishedConditionFalse({line_count}, {input_condition})"
-        return f"SkipLinesIfFinishedConditionState({line_count}, {state=}, {input_condition=})"
+        return f"SkipLinesIfFinishedConditionState({line_count}, state={state}, input_condition={input_condition})"
 
     @parse_parameters
     def _1000_08(self, event_return_type: EventReturnType, state: bool, input_condition):
         if self._any_vars(event_return_type, state):
-            return f"ReturnIfFinishedConfditionState({event_return_type=}, {state=}, {input_condition=})"
+            return (
+                f"ReturnIfFinishedConfditionState(event_return_type={event_return_type}, state={state}, "
+                f"input_condition={input_condition})"
+            )
         return f"{event_return_type.name}IfFinishedCondition{bool(state)}({input_condition})"
 
     @parse_parameters("WaitForNetworkApproval")
@@ -1137,33 +1422,20 @@ class InstructionDecompiler(abc.ABC):
     @parse_parameters
     def _1003_00(self, state: FlagState, flag_type: FlagType, flag):
         if self._any_vars(state, flag_type):
-            return f"AwaitFlagState({state=}, {flag_type=}, {flag=})"
-        if state != 2:
-            if flag_type == 0:
-                return f"AwaitFlag{state.name}({flag})"
-            elif flag_type == 1:
-                if flag == 0:
-                    return f"AwaitThisEvent{state.name}()"
-            elif flag_type == 2:
-                if flag == 0:
-                    return f"AwaitThisEventSlot{state.name}()"
+            return f"AwaitFlagState(state={state}, flag_type={flag_type}, flag={flag})"
+        if state is not self._CHANGE and (flag_test := self._get_flag_test(state, flag_type, flag)):
+            return f"Await{flag_test}"
         # No simple instruction found -- this implies a highly unusual combination of arguments!
-        return f"AwaitFlagState({state=}, {flag_type=}, {flag=})" + self.SUSPICIOUS
+        return f"AwaitFlagState(state={state}, flag_type={flag_type}, flag={flag})" + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_01(self, line_count, state: FlagState, flag_type: FlagType, flag):
         if self._any_vars(state, flag_type):
-            return f"SkipLinesIfFlagState({state=}, {flag_type=}, {flag=})"
-        if state != 2:
-            if flag_type == 0:
-                return f"SkipLinesIfFlag{state.name}({line_count}, {flag})"
-            elif flag == 0:
-                if flag_type == 1:
-                    return f"SkipLinesIfThisEvent{state.name}({line_count})"
-                elif flag_type == 2:
-                    return f"SkipLinesIfThisEventSlot{state.name}({line_count})"
+            return f"SkipLinesIfFlagState(state={state}, flag_type={flag_type}, flag={flag})"
+        if state is not self._CHANGE and (flag_test := self._get_flag_test(state, flag_type, flag, line_count)):
+            return f"SkipLinesIf{flag_test}"
         # No simple instruction found -- this implies a highly unusual combination of arguments!
-        return f"SkipLinesIfFlagState({state=}, {flag_type=}, {flag=})" + self.SUSPICIOUS
+        return f"SkipLinesIfFlagState(state={state}, flag_type={flag_type}, flag={flag})" + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_02(
@@ -1174,17 +1446,17 @@ class InstructionDecompiler(abc.ABC):
         flag,
     ):
         if self._any_vars(event_return_type, state, flag_type):
-            return f"ReturnIfFlagState({event_return_type=}, {state=}, {flag_type=}, {flag=})"
-        if state != 2:
-            if flag_type == 0:
-                return f"{event_return_type.name}IfFlag{state.name}({flag})"
-            elif flag == 0:
-                if flag_type == 1:
-                    return f"{event_return_type.name}IfThisEvent{state.name}()"
-                elif flag_type == 2:
-                    return f"{event_return_type.name}IfThisEventSlot{state.name}()"
+            return (
+                f"ReturnIfFlagState(event_return_type={event_return_type}, state={state}, flag_type={flag_type}, "
+                f"flag={flag})"
+            )
+        if state is not self._CHANGE and (flag_test := self._get_flag_test(state, flag_type, flag)):
+            return f"{event_return_type.name}If{flag_test}"
         # No simple instruction found -- this implies a highly unusual combination of arguments!
-        return f"ReturnIfFlagState({event_return_type=}, {state=}, {flag_type=}, {flag=})" + self.SUSPICIOUS
+        return (
+            f"ReturnIfFlagState(event_return_type={event_return_type}, state={state}, flag_type={flag_type}, "
+            f"flag={flag})"
+        ) + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_03(
@@ -1192,10 +1464,15 @@ class InstructionDecompiler(abc.ABC):
     ):
         flag_range = f"({first_flag}, {last_flag})"
         if self._any_vars(state, flag_type):
-            return f"SkipLinesIfFlagRangeState({line_count}, {state=}, {flag_type=}, {flag_range=})"
-        if flag_type == 0:
+            return (
+                f"SkipLinesIfFlagRangeState({line_count}, state={state}, flag_type={flag_type}, "
+                f"flag_range={flag_range})"
+            )
+        if flag_type is self._ABSOLUTE:
             return f"SkipLinesIfFlagRange{state.name}({line_count}, {flag_range})"
-        return f"SkipLinesIfFlagRangeState({line_count}, {state=}, {flag_type=}, {flag_range=})" + self.SUSPICIOUS
+        return (
+            f"SkipLinesIfFlagRangeState({line_count}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        ) + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_04(
@@ -1208,42 +1485,52 @@ class InstructionDecompiler(abc.ABC):
     ):
         flag_range = f"({first_flag}, {last_flag})"
         if self._any_vars(event_return_type, state, flag_type):
-            return f"ReturnIfFlagRangeState({event_return_type=}, {state=}, {flag_type=}, {flag_range=})"
-        if flag_type == 0:
+            return (
+                f"ReturnIfFlagRangeState(event_return_type={event_return_type}, state={state}, flag_type={flag_type}, "
+                f"flag_range={flag_range})"
+            )
+        if flag_type is self._ABSOLUTE:
             return f"{event_return_type.name}IfFlagRange{state.name}({flag_range})"
-        return f"ReturnIfFlagRangeState({event_return_type=}, {state=}, {flag_type=}, {flag_range=})" + self.SUSPICIOUS
+        return (
+            f"ReturnIfFlagRangeState(event_return_type={event_return_type}, state={state}, flag_type={flag_type}, "
+            f"flag_range={flag_range})"
+        ) + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_05(self, line_count, state: MultiplayerState):
         if self._any_vars(state):
-            return f"SkipLinesIfMultiplayerState({line_count}, {state=})"
+            return f"SkipLinesIfMultiplayerState({line_count}, state={state})"
         return f"SkipLinesIf{state.name}({line_count})"
 
     @parse_parameters
     def _1003_06(self, event_return_type: EventReturnType, state: MultiplayerState):
         if self._any_vars(event_return_type, state):
-            return f"ReturnIfMultiplayerState({event_return_type=}, {state=})"
+            return f"ReturnIfMultiplayerState(event_return_type={event_return_type}, state={state})"
         return f"{event_return_type.name}If{state.name}()"
 
     @parse_parameters
     def _1003_07(self, line_count, state: bool, area_id, block_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
         if state is True:
-            return f"SkipLinesIfInsideMap({line_count}, {game_map=})"
+            return f"SkipLinesIfInsideMap({line_count}, game_map={game_map})"
         elif state is False:
-            return f"SkipLinesIfOutsideMap({line_count}, {game_map=})"
-        return f"SkipLinesIfMapPresenceState({line_count}, {state=}, {game_map=})"
+            return f"SkipLinesIfOutsideMap({line_count}, game_map={game_map})"
+        return f"SkipLinesIfMapPresenceState({line_count}, state={state}, game_map={game_map})"
 
     @parse_parameters
     def _1003_08(self, event_return_type: EventReturnType, state: bool, area_id, block_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
         if self._any_vars(event_return_type, state):
-            return f"ReturnIfMapPresenceState({event_return_type=}, {game_map=}, {state=})"
+            return (
+                f"ReturnIfMapPresenceState(event_return_type={event_return_type}, game_map={game_map}, state={state})"
+            )
         if state is True:
-            return f"{event_return_type.name}IfInsideMap({game_map=})"
+            return f"{event_return_type.name}IfInsideMap(game_map={game_map})"
         elif state is False:
-            return f"{event_return_type.name}IfOutsideMap({game_map=})"
-        return f"ReturnIfMapPresenceState({event_return_type=}, {game_map=}, {state=})" + self.SUSPICIOUS
+            return f"{event_return_type.name}IfOutsideMap(game_map={game_map})"
+        return (
+            f"ReturnIfMapPresenceState(event_return_type={event_return_type}, game_map={game_map}, state={state})"
+        ) + self.SUSPICIOUS
 
     # ~~~~~~~~~~~~~~~~~~~~ #
     # ~~~ LOGIC: OBJECT~~~ #
@@ -1255,7 +1542,7 @@ class InstructionDecompiler(abc.ABC):
             return f"AwaitObjectDestroyed({obj})"
         if state is False:
             return f"AwaitObjectNotDestroyed({obj})"
-        return f"AwaitObjectDestructionState({state=}, {obj=})"
+        return f"AwaitObjectDestructionState(state={state}, obj={obj})"
 
     @parse_parameters
     def _1005_01(self, line_count, state: bool, obj):
@@ -1263,17 +1550,19 @@ class InstructionDecompiler(abc.ABC):
             return f"SkipLinesIfObjectDestroyed({line_count}, {obj})"
         if state is False:
             return f"SkipLinesIfObjectNotDestroyed({line_count}, {obj})"
-        return f"SkipLinesIfObjectDestructionState({line_count}, {obj}, {state=})"
+        return f"SkipLinesIfObjectDestructionState({line_count}, {obj}, state={state})"
 
     @parse_parameters
     def _1005_02(self, event_return_type: EventReturnType, state: bool, obj):
         if self._any_vars(event_return_type, state):
-            return f"ReturnIfObjectDestructionState({event_return_type=}, {obj=}, {state=})"
+            return f"ReturnIfObjectDestructionState(event_return_type={event_return_type}, obj={obj}, state={state})"
         if state is True:
             return f"{event_return_type.name}IfObjectDestroyed({obj})"
         elif state is False:
             return f"{event_return_type.name}IfObjectNotDestroyed({obj})"
-        return f"ReturnIfObjectDestructionState({event_return_type=}, {obj=}, {state=})" + self.SUSPICIOUS
+        return (
+            f"ReturnIfObjectDestructionState(event_return_type={event_return_type}, obj={obj}, state={state})"
+        ) + self.SUSPICIOUS
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~ #
     # ~~~ CONDITIONS: SYSTEM ~~~ #
@@ -1282,8 +1571,8 @@ class InstructionDecompiler(abc.ABC):
     @parse_parameters
     def _0_00(self, condition, state: bool, input_condition):
         if self._any_vars(state):
-            return f"IfConditionState({condition}, {state=}, {input_condition=})"
-        return f"IfCondition{state}({condition}, {input_condition=})"
+            return f"IfConditionState({condition}, state={state}, input_condition={input_condition})"
+        return f"IfCondition{state}({condition}, input_condition={input_condition})"
 
     @parse_parameters("IfValueComparison", no_name_count=2)
     def _0_01(self, condition, comparison_type: ComparisonType, left, right):
@@ -1316,49 +1605,46 @@ class InstructionDecompiler(abc.ABC):
     @parse_parameters
     def _3_00(self, condition, state: FlagState, flag_type: FlagType, flag):
         if self._any_vars(state, flag_type):
-            return f"IfFlagState({condition}, {state=}, {flag_type=}, {flag=})"
-        if flag_type == 0:
-            return f"IfFlag{state.name}({condition}, {flag})"
-        elif flag == 0:
-            if flag_type == 1:
-                return f"IfThisEvent{state.name}({condition})"
-            elif flag_type == 2:
-                return f"IfThisEventSlot{state.name}({condition})"
-        return f"IfFlagState({condition}, {state=}, {flag_type=}, {flag=})" + self.SUSPICIOUS
+            return f"IfFlagState({condition}, state={state}, flag_type={flag_type}, flag={flag})"
+        if flag_test := self._get_flag_test(state, flag_type, flag, condition):
+            return f"If{flag_test}"
+        return f"IfFlagState({condition}, state={state}, flag_type={flag_type}, flag={flag})" + self.SUSPICIOUS
 
     @parse_parameters
     def _3_01(self, condition, state: RangeState, flag_type: FlagType, first_flag, last_flag):
         flag_range = f"({first_flag}, {last_flag})"
         if self._any_vars(state, flag_type):
-            return f"IfFlagRangeState({condition}, {state=}, {flag_type=}, {flag_range=})"
-        if flag_type == 0:
+            return f"IfFlagRangeState({condition}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        if flag_type is self._ABSOLUTE:
             return f"IfFlagRange{state.name}({condition}, {flag_range})"
-        return f"IfFlagRangeState({condition}, {state=}, {flag_type=}, {flag_range=})" + self.SUSPICIOUS
+        return (
+            f"IfFlagRangeState({condition}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        ) + self.SUSPICIOUS
 
     @parse_parameters
     def _3_02(self, condition, state: bool, character: EntityEnum, region):
         if state is True:
-            return f"IfCharacterInsideRegion({condition}, {character}, {region=})"
+            return f"IfCharacterInsideRegion({condition}, {character}, region={region})"
         elif state is False:
-            return f"IfCharacterOutsideRegion({condition}, {character}, {region=})"
-        return f"IfCharacterRegionState({condition}, {character}, {region=}, {state=})"
+            return f"IfCharacterOutsideRegion({condition}, {character}, region={region})"
+        return f"IfCharacterRegionState({condition}, {character}, region={region}, state={state})"
 
     @parse_parameters
     def _3_03(self, condition, state: bool, entity: EntityEnum, other_entity: EntityEnum, radius):
         if state is True:
-            return f"IfEntityWithinDistance({condition}, {entity}, {other_entity}, {radius=})"
+            return f"IfEntityWithinDistance({condition}, {entity}, {other_entity}, radius={radius})"
         elif state is False:
-            return f"IfEntityBeyondDistance({condition}, {entity}, {other_entity}, {radius=})"
-        return f"IfEntityDistanceState({condition}, {entity}, {other_entity}, {radius}, {state=})"
+            return f"IfEntityBeyondDistance({condition}, {entity}, {other_entity}, radius={radius})"
+        return f"IfEntityDistanceState({condition}, {entity}, {other_entity}, {radius}, state={state})"
 
     @parse_parameters
     def _3_04(self, condition, item_type: ItemType, item, state: bool):
-        if not isinstance(state, Variable):
+        if type(state) is not Variable:
             state_name = "Has" if state else "DoesNotHave"
-            if isinstance(item_type, Variable):
-                return f"IfPlayer{state_name}Item({condition}, {item}, {item_type=}, including_box=False)"
+            if type(item_type) is Variable:
+                return f"IfPlayer{state_name}Item({condition}, {item}, item_type={item_type}, including_box=False)"
             return f"IfPlayer{state_name}{item_type.name}({condition}, {item}, including_box=False)"
-        return f"IfPlayerItemState({condition}, {state=}, {item=}, {item_type=}, including_box=False)"
+        return f"IfPlayerItemState({condition}, state={state}, item={item}, item_type={item_type}, including_box=False)"
 
     @parse_parameters
     def _3_05(
@@ -1373,17 +1659,8 @@ class InstructionDecompiler(abc.ABC):
         trigger_attribute: TriggerAttribute,
         button,
     ):
-        defaults = {
-            "trigger_attribute": self.ENUMS.TriggerAttribute.Human_or_Hollow,
-            "button": 0,
-        }
-        if not self._any_vars(anchor_type):
-            defaults["facing_angle"] = 0.0 if anchor_type.name == "Region" else 180.0
-            defaults["max_distance"] = 0.0 if anchor_type.name == "Region" else 2.0
-            if anchor_type.name == "Region":
-                defaults["model_point"] = -1
         arg_string = self._assemble_arg_string(
-            defaults,
+            self._get_action_button_defaults(anchor_type),
             condition,
             prompt_text=prompt_text,
             anchor_entity=anchor_entity,
@@ -1399,25 +1676,25 @@ class InstructionDecompiler(abc.ABC):
     @parse_parameters
     def _3_06(self, condition, state: MultiplayerState):
         if self._any_vars(state):
-            return f"IfMultiplayerState({condition}, {state=})"
+            return f"IfMultiplayerState({condition}, state={state})"
         return f"If{state.name}({condition})"
 
     @parse_parameters
     def _3_07(self, condition, state: bool, region):
         if state is True:
-            return f"IfAllPlayersInsideRegion({condition}, {region=})"
+            return f"IfAllPlayersInsideRegion({condition}, region={region})"
         elif state is False:
-            return f"IfAllPlayersOutsideRegion({condition}, {region=})"
-        return f"IfAllPlayersRegionState({condition}, {region=}, {state=})"
+            return f"IfAllPlayersOutsideRegion({condition}, region={region})"
+        return f"IfAllPlayersRegionState({condition}, region={region}, state={state})"
 
     @parse_parameters
     def _3_08(self, condition, state: bool, area_id, block_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
         if state is True:
-            return f"IfInsideMap({condition}, {game_map=})"
+            return f"IfInsideMap({condition}, game_map={game_map})"
         elif state is False:
-            return f"IfOutsideMap({condition}, {game_map=})"
-        return f"IfMapPresenceState({condition}, {game_map=}, {state=})"
+            return f"IfOutsideMap({condition}, game_map={game_map})"
+        return f"IfMapPresenceState({condition}, game_map={game_map}, state={state})"
 
     @parse_parameters("IfMultiplayerEvent", no_name_count=2)
     def _3_09(self, condition, multiplayer_event_id):
@@ -1439,7 +1716,7 @@ class InstructionDecompiler(abc.ABC):
                 f"IfTrueFlagCountComparison({condition}, {comparison_value}, {flag_type}, "
                 f"{comparison_type}, {flag_range})"
             )
-        if flag_type == 0:
+        if flag_type is self._ABSOLUTE:
             return f"IfTrueFlagCount{comparison_type.name}({condition}, {comparison_value}, {flag_range})"
         return (
             f"IfTrueFlagCountComparison({condition}, {comparison_value}, {flag_type}, "
@@ -1455,22 +1732,28 @@ class InstructionDecompiler(abc.ABC):
         value,
     ):
         if world_tendency_type == 0:
-            if comparison_type == 4:
+            if comparison_type is self._GREATER_THAN_OR_EQUAL:
                 return f"IfWhiteWorldTendencyGreaterThanOrEqual({condition}, {value})"
-            return f"IfWhiteWorldTendencyComparison({condition}, {comparison_type=}, {value=})"
+            return f"IfWhiteWorldTendencyComparison({condition}, comparison_type={comparison_type}, value={value})"
         if world_tendency_type == 1:
-            if comparison_type == 4:
+            if comparison_type is self._GREATER_THAN_OR_EQUAL:
                 return f"IfBlackWorldTendencyGreaterThanOrEqual({condition}, {value})"
-            return f"IfBlackWorldTendencyComparison({condition}, {comparison_type=}, {value=})"
-        return f"IfWorldTendencyComparison({condition}, {world_tendency_type=}, {comparison_type=}, {value=})"
+            return f"IfBlackWorldTendencyComparison({condition}, comparison_type={comparison_type}, value={value})"
+        return (
+            f"IfWorldTendencyComparison({condition}, world_tendency_type={world_tendency_type}, "
+            f"comparison_type={comparison_type}, value={value})"
+        )
 
     @parse_parameters
     def _3_12(self, condition, flag, bit_count, comparison_type: ComparisonType, value):
-        if comparison_type == 0:
-            return f"IfEventValueEqual({condition}, {flag}, {bit_count=}, {value=})"
-        if comparison_type == 2:
-            return f"IfEventValueGreaterThan({condition}, {flag}, {bit_count=}, {value=})"
-        return f"IfEventValueComparison({condition}, {flag}, {bit_count=}, {comparison_type=}, {value=})"
+        if comparison_type is self._EQUAL:
+            return f"IfEventValueEqual({condition}, {flag}, bit_count={bit_count}, value={value})"
+        if comparison_type is self._GREATER_THAN:
+            return f"IfEventValueGreaterThan({condition}, {flag}, bit_count={bit_count}, value={value})"
+        return (
+            f"IfEventValueComparison({condition}, {flag}, bit_count={bit_count}, comparison_type={comparison_type}, "
+            f"value={value})"
+        )
 
     @parse_parameters
     def _3_13(
@@ -1485,17 +1768,8 @@ class InstructionDecompiler(abc.ABC):
         trigger_attribute: TriggerAttribute,
         button,
     ):
-        defaults = {
-            "trigger_attribute": self.ENUMS.TriggerAttribute.Human_or_Hollow,
-            "button": 0,
-        }
-        if not self._any_vars(anchor_type):
-            defaults["facing_angle"] = 0.0 if anchor_type.name == "Region" else 180.0
-            defaults["max_distance"] = 0.0 if anchor_type.name == "Region" else 2.0
-            if anchor_type.name == "Region":
-                defaults["model_point"] = -1
         arg_string = self._assemble_arg_string(
-            defaults,
+            self._get_action_button_defaults(anchor_type),
             condition,
             prompt_text=prompt_text,
             anchor_entity=anchor_entity,
@@ -1515,24 +1789,27 @@ class InstructionDecompiler(abc.ABC):
 
     @parse_parameters
     def _3_15(self, condition, item_type: ItemType, item_id):
-        return f"IfItemDropped({condition}, {item_id}, {item_type=})"
+        return f"IfItemDropped({condition}, {item_id}, item_type={item_type})"
 
     @parse_parameters
     def _3_16(self, condition, item_type: ItemType, item, state: bool):
-        if not isinstance(state, Variable):
+        if type(state) is not Variable:
             state_name = "Has" if state else "DoesNotHave"
-            if isinstance(item_type, Variable):
-                return f"IfPlayer{state_name}Item({condition}, {item}, {item_type=}, including_box=True)"
+            if type(item_type) is Variable:
+                return f"IfPlayer{state_name}Item({condition}, {item}, item_type={item_type}, including_box=True)"
             return f"IfPlayer{state_name}{item_type.name}({condition}, {item}, including_box=True)"
-        return f"IfPlayerItemState({condition}, {state=}, {item=}, {item_type=}, including_box=True)"
+        return f"IfPlayerItemState({condition}, state={state}, item={item}, item_type={item_type}, including_box=True)"
 
     @parse_parameters
     def _3_17(self, condition, comparison_type: ComparisonType, completion_count):
-        if comparison_type == 0:
-            return f"IfNewGameCycleEqual({condition}, {completion_count=})"
-        if comparison_type == 4:
-            return f"IfNewGameCycleGreaterThanOrEqual({condition}, {completion_count=})"
-        return f"IfNewGameCycleComparison({condition}, {comparison_type=}, {completion_count=})"
+        if comparison_type is self._EQUAL:
+            return f"IfNewGameCycleEqual({condition}, completion_count={completion_count})"
+        if comparison_type is self._GREATER_THAN_OR_EQUAL:
+            return f"IfNewGameCycleGreaterThanOrEqual({condition}, completion_count={completion_count})"
+        return (
+            f"IfNewGameCycleComparison({condition}, comparison_type={comparison_type}, "
+            f"completion_count={completion_count})"
+        )
 
     @parse_parameters
     def _3_18(
@@ -1548,17 +1825,8 @@ class InstructionDecompiler(abc.ABC):
         button,
         line_intersects: EntityEnum,
     ):
-        defaults = {
-            "trigger_attribute": self.ENUMS.TriggerAttribute.Human_or_Hollow,
-            "button": 0,
-        }
-        if not self._any_vars(anchor_type):
-            defaults["facing_angle"] = 0.0 if anchor_type.name == "Region" else 180.0
-            defaults["max_distance"] = 0.0 if anchor_type.name == "Region" else 2.0
-            if anchor_type.name == "Region":
-                defaults["model_point"] = -1
         arg_string = self._assemble_arg_string(
-            defaults,
+            self._get_action_button_defaults(anchor_type),
             condition,
             prompt_text=prompt_text,
             anchor_entity=anchor_entity,
@@ -1586,17 +1854,8 @@ class InstructionDecompiler(abc.ABC):
         button,
         line_intersects: EntityEnum,
     ):
-        defaults = {
-            "trigger_attribute": self.ENUMS.TriggerAttribute.Human_or_Hollow,
-            "button": 0,
-        }
-        if not self._any_vars(anchor_type):
-            defaults["facing_angle"] = 0.0 if anchor_type.name == "Region" else 180.0
-            defaults["max_distance"] = 0.0 if anchor_type.name == "Region" else 2.0
-            if anchor_type.name == "Region":
-                defaults["model_point"] = -1
         arg_string = self._assemble_arg_string(
-            defaults,
+            self._get_action_button_defaults(anchor_type),
             condition,
             prompt_text=prompt_text,
             anchor_entity=anchor_entity,
@@ -1629,7 +1888,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfDLCOwned({condition})"
         elif is_owned is False:
             return f"IfDLCNotOwned({condition})"
-        return f"IfDLCState({condition}, {is_owned=})"
+        return f"IfDLCState({condition}, is_owned={is_owned})"
 
     @parse_parameters
     def _3_22(self, condition, state: bool):
@@ -1637,7 +1896,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfOnline({condition})"
         elif state is False:
             return f"IfOffline({condition})"
-        return f"IfOnlineState({condition}, {state=})"
+        return f"IfOnlineState({condition}, state={state})"
 
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
     # ~~~ CONDITIONS: CHARACTER ~~~ #
@@ -1649,7 +1908,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfCharacterDead({condition}, {character})"
         elif state is False:
             return f"IfCharacterAlive({condition}, {character})"
-        return f"IfCharacterDeathState({condition}, {character}, {state=})"
+        return f"IfCharacterDeathState({condition}, {character}, state={state})"
 
     @parse_parameters("IfAttacked", no_name_count=2)
     def _4_01(self, condition, attacked: EntityEnum, attacker: EntityEnum):
@@ -1663,15 +1922,17 @@ class InstructionDecompiler(abc.ABC):
         comparison_type: ComparisonType,
         value,
     ):
-        if not isinstance(comparison_type, Variable):
+        if type(comparison_type) is not Variable:
             return f"IfHealth{comparison_type.name}({condition}, {character}, {value})"
-        return f"IfHealthComparison({condition}, {character=}, {comparison_type=}, {value=})"
+        return (
+            f"IfHealthComparison({condition}, character={character}, comparison_type={comparison_type}, value={value})"
+        )
 
     @parse_parameters
     def _4_03(self, condition, character: EntityEnum, character_type: CharacterType):
-        if character_type == 8:
+        if character_type is self._HOLLOW:
             return f"IfCharacterHollow({condition}, {character})"
-        elif character_type == 0:
+        elif character_type is self._HUMAN:
             return f"IfCharacterHuman({condition}, {character})"
         return f"IfCharacterType({condition}, {character}, {character_type})"
 
@@ -1687,7 +1948,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfCharacterTargeting({condition}, {targeting_character}, {targeted_character})"
         elif state is False:
             return f"IfCharacterNotTargeting({condition}, {targeting_character}, {targeted_character})"
-        return f"IfCharacterTargetingState({condition}, {targeting_character}, {targeted_character}, {state=})"
+        return f"IfCharacterTargetingState({condition}, {targeting_character}, {targeted_character}, state={state})"
 
     @parse_parameters
     def _4_05(self, condition, character: EntityEnum, special_effect, state: bool):
@@ -1695,7 +1956,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfCharacterHasSpecialEffect({condition}, {character}, {special_effect})"
         elif state is False:
             return f"IfCharacterDoesNotHaveSpecialEffect({condition}, {character}, {special_effect})"
-        return f"IfCharacterSpecialEffectState({condition}, {character}, {special_effect}, {state=})"
+        return f"IfCharacterSpecialEffectState({condition}, {character}, {special_effect}, state={state})"
 
     @parse_parameters
     def _4_06(
@@ -1706,11 +1967,14 @@ class InstructionDecompiler(abc.ABC):
         value,
         comparison_type: ComparisonType,
     ):
-        if comparison_type == 5:
-            return f"IfCharacterPartHealthLessThanOrEqual({condition}, {character}, {npc_part_id=}, {value=})"
+        if comparison_type is self._LESS_THAN_OR_EQUAL:
+            return (
+                f"IfCharacterPartHealthLessThanOrEqual({condition}, {character}, npc_part_id={npc_part_id}, "
+                f"value={value})"
+            )
         return (
-            f"IfCharacterPartHealthComparison({condition}, {character}, {npc_part_id=}, "
-            f"{comparison_type=}, {value=})"
+            f"IfCharacterPartHealthComparison({condition}, {character}, npc_part_id={npc_part_id}, "
+            f"comparison_type={comparison_type}, value={value})"
         )
 
     @parse_parameters
@@ -1719,15 +1983,15 @@ class InstructionDecompiler(abc.ABC):
             return f"IfCharacterBackreadEnabled({condition}, {character})"
         elif state is False:
             return f"IfCharacterBackreadDisabled({condition}, {character})"
-        return f"IfCharacterBackreadState({condition}, {character}, {state=})"
+        return f"IfCharacterBackreadState({condition}, {character}, state={state})"
 
     @parse_parameters
     def _4_08(self, condition, character: EntityEnum, tae_event_id, state: bool):
         if state is True:
-            return f"IfHasTAEEvent({condition}, {character}, {tae_event_id=})"
+            return f"IfHasTAEEvent({condition}, {character}, tae_event_id={tae_event_id})"
         elif state is False:
-            return f"IfDoesNotHaveTAEEvent({condition}, {character}, {tae_event_id=})"
-        return f"IfTAEEventState({condition}, {character}, {tae_event_id=}, {state=})"
+            return f"IfDoesNotHaveTAEEvent({condition}, {character}, tae_event_id={tae_event_id})"
+        return f"IfTAEEventState({condition}, {character}, tae_event_id={tae_event_id}, state={state})"
 
     @parse_parameters("IfHasAIStatus", no_name_count=2)
     def _4_09(self, condition, character: EntityEnum, ai_status: AIStatusType):
@@ -1739,7 +2003,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfSkullLanternActive({condition})"
         elif state is False:
             return f"IfSkullLanternInactive({condition})"
-        return f"IfSkullLanternState({condition}, {state=})"
+        return f"IfSkullLanternState({condition}, state={state})"
 
     @parse_parameters("IfPlayerClass", no_name_count=2)
     def _4_11(self, condition, class_type: ClassType):
@@ -1751,9 +2015,9 @@ class InstructionDecompiler(abc.ABC):
 
     @parse_parameters
     def _4_13(self, condition, comparison_type: ComparisonType, comparison_value):
-        if comparison_type == 4:
+        if comparison_type is self._GREATER_THAN_OR_EQUAL:
             return f"IfPlayerSoulLevelGreaterThanOrEqual({condition}, {comparison_value})"
-        if comparison_type == 5:
+        if comparison_type is self._LESS_THAN_OR_EQUAL:
             return f"IfPlayerSoulLevelLessThanOrEqual({condition}, {comparison_value})"
         return f"IfPlayerSoulLevelComparison({condition}, {comparison_type}, {comparison_value})"
 
@@ -1765,7 +2029,7 @@ class InstructionDecompiler(abc.ABC):
         comparison_type: ComparisonType,
         value,
     ):
-        if isinstance(comparison_type, Variable):
+        if type(comparison_type) is Variable:
             return f"IfHealthValueComparison({condition}, {character}, {comparison_type}, {value})"
         return f"IfHealthValue{comparison_type.name}({condition}, {character}, {value})"
 
@@ -1779,7 +2043,7 @@ class InstructionDecompiler(abc.ABC):
             return f"IfObjectDestroyed({condition}, {obj})"
         elif state is False:
             return f"IfObjectNotDestroyed({condition}, {obj})"
-        return f"IfObjectDestructionState({condition}, {obj}, {state=})"
+        return f"IfObjectDestructionState({condition}, {obj}, state={state})"
 
     @parse_parameters("IfObjectDamagedBy", no_name_count=2)
     def _5_01(self, condition, obj, attacker: EntityEnum):
@@ -1808,3 +2072,6 @@ class InstructionDecompiler(abc.ABC):
     @parse_parameters("IfStandingOnCollision", no_name_count=2)
     def _11_02(self, condition, collision):
         pass
+
+
+InstructionDecompiler._build_dispatch()  # subclasses build their own in `__init_subclass__`
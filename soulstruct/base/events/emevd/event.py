@@ -165,8 +165,11 @@ class Event(abc.ABC):
         function_def = self._indent_and_wrap_function_def(function_name, function_args, wrap_limit=self.WRAP_LIMIT)
         function_def += f"\n    {function_docstring}"
         evs_event_string = restart_type_decorator + function_def
-        for i, instr in enumerate(self.instructions):
-            instruction = instr.to_evs(self.EVENT_ARG_TYPES)
+        decompiled = self.Instruction.DECOMPILER.decompile_many(
+            [instr.get_decompiler_args(self.EVENT_ARG_TYPES) for instr in self.instructions]
+        )
+        for instr, instruction in zip(self.instructions, decompiled):
+            instruction = instr.add_event_layers_to_evs(instruction)
             if label_match := _LABEL_RE.match(instruction):
                 if evs_event_string[-1] != "\n":
                     evs_event_string += "\n"
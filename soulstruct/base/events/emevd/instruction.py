@@ -102,6 +102,11 @@ class Instruction(abc.ABC):
         return numeric
 
     def to_evs(self, event_arg_types):
+        instruction = self.DECOMPILER.decompile(*self.get_decompiler_args(event_arg_types))
+        return self.add_event_layers_to_evs(instruction)
+
+    def get_decompiler_args(self, event_arg_types) -> tuple:
+        """Arguments for `DECOMPILER.decompile()`, or one item of the list passed to `DECOMPILER.decompile_many()`."""
         args, opt_args = self.get_required_and_optional_args()
         opt_arg_types = None
         if (
@@ -111,9 +116,10 @@ class Instruction(abc.ABC):
             and args[1] in event_arg_types
         ):
             opt_arg_types = event_arg_types[args[1]]
-        instruction = self.DECOMPILER.decompile(
-            self.instruction_class, self.instruction_index, args, opt_args, opt_arg_types
-        )
+        return self.instruction_class, self.instruction_index, args, opt_args, opt_arg_types
+
+    def add_event_layers_to_evs(self, instruction: str) -> str:
+        """Add this instruction's event layers (if any) to its decompiled EVS `instruction` string."""
         if self.event_layers:
             instruction = instruction[:-1] + self.event_layers.to_evs()
         return instruction
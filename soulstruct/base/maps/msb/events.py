@@ -1,5 +1,6 @@
 import abc
 import typing as tp
+from functools import partial
 
 from soulstruct.base.events.emevd.enums import SoundType
 from soulstruct.game_types import *
@@ -1049,5 +1050,5 @@ for _entry_subtype in MSBEventList.ENTRY_SUBTYPE_ENUM:
     setattr(
         MSBEventList,
         _entry_subtype.pluralized_name,
-        property(lambda self, _e=_entry_subtype: [e for e in self._entries if e.ENTRY_SUBTYPE == _e]),
+        property(partial(MSBEntryList._get_subtype_entries, entry_subtype=_entry_subtype)),
     )
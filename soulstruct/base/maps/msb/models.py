@@ -1,4 +1,5 @@
 import typing as tp
+from functools import partial
 
 from soulstruct.exceptions import SoulstructError
 from soulstruct.utilities import read_chars_from_buffer, partialmethod
@@ -204,5 +205,5 @@ for _entry_subtype in MSBModelSubtype:
     setattr(
         MSBModelList,
         _entry_subtype.pluralized_name,
-        property(lambda self, _e=_entry_subtype: [e for e in self._entries if e.ENTRY_SUBTYPE == _e]),
+        property(partial(MSBEntryList._get_subtype_entries, entry_subtype=_entry_subtype)),
     )
@@ -191,6 +191,7 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
     def __init__(self, msb_entry_list_source=None, name=""):
         self.name = ""
         self._entries = []
+        self._entries_by_subtype = None  # type: tp.Optional[dict[MSBSubtype, list[MSBEntryType]]]
 
         if msb_entry_list_source is None:
             return
@@ -229,6 +230,7 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
         self.name = read_chars_from_buffer(msb_buffer, header["name_offset"], encoding=self.NAME_ENCODING)
 
         self._entries = []
+        self._clear_entries_by_subtype()
 
         for entry_offset in entry_offsets:
             msb_buffer.seek(entry_offset)
@@ -308,13 +310,15 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
     def __getitem__(self, entry: tp.Union[int, str]) -> MSBEntryType:
         """You can access entries using their global index or (if unique) name."""
         if isinstance(entry, int):
-            return self.get_entries()[entry]
+            return self._entries[entry]
         elif isinstance(entry, str):
             return self.get_entry_by_name(entry_name=entry, entry_subtype=None)
         raise TypeError(f"`MSBEntryList` key must be a global entry index or unique entry name, not {entry}.")
 
     def get_entries(self, entry_subtype=None) -> list[MSBEntryType]:
-        """Return a list of entries of the given subtype, or all entries in global order if no subtype is given.
+        """Return a new list of entries of the given subtype, or all entries in global order if no subtype is given.
+
+        Entries should be added, moved, or removed with the methods of this class, not by modifying the returned list.
 
         Note that only the global index (`entry_subtype=None`) is valid for index links from other MSB entries, with the
         sole exceptions of:
@@ -322,9 +326,32 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
             - the `MSBEnvironmentEvent` entry linked to by an `MSBCollision` entry
         """
         if entry_subtype is None:
-            return self._entries  # Full entry list, with types potentially intermingled.
-        entry_subtype = self.resolve_entry_subtype(entry_subtype)
-        return [e for e in self._entries if e.ENTRY_SUBTYPE == entry_subtype]
+            return list(self._entries)  # Full entry list, with types potentially intermingled.
+        return self._get_subtype_entries(self.resolve_entry_subtype(entry_subtype))
+
+    def _get_subtype_entries(self, entry_subtype: MSBSubtype) -> list[MSBEntryType]:
+        """Return a new list of entries of the given (already resolved) subtype. Used by pluralized subtype properties.
+
+        The cached subtype list is copied because callers (e.g. editors) are free to modify the list they are given, as
+        they could when it was rebuilt on every call.
+        """
+        return list(self._get_entries_by_subtype().get(entry_subtype, ()))
+
+    def _get_entries_by_subtype(self) -> dict[MSBSubtype, list[MSBEntryType]]:
+        """Dictionary mapping each entry subtype to its entries, in global order.
+
+        The dictionary is cached until `_clear_entries_by_subtype()` is called by a method that adds, removes, or moves
+        entries. (Subtypes are class attributes of entries, so they cannot change otherwise.)
+        """
+        if self._entries_by_subtype is None:
+            entries_by_subtype = {}
+            for entry in self._entries:
+                entries_by_subtype.setdefault(entry.ENTRY_SUBTYPE, []).append(entry)
+            self._entries_by_subtype = entries_by_subtype
+        return self._entries_by_subtype
+
+    def _clear_entries_by_subtype(self):
+        self._entries_by_subtype = None
 
     def get_entry_names(self, entry_subtype=None) -> list[str]:
         """Returns a list of entry names (global or `entry_subtype`-specific)."""
@@ -402,6 +429,7 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
         if global_index is None:
             global_index = self.get_subtype_next_global_index(entry.ENTRY_SUBTYPE)
         self._entries.insert(global_index, entry)
+        self._clear_entries_by_subtype()
         return entry
 
     @_entry_lookup
@@ -444,6 +472,7 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
             else:
                 global_index = self.get_subtype_next_global_index(entry.ENTRY_SUBTYPE)
             self._entries.insert(global_index, duplicated)
+            self._clear_entries_by_subtype()
 
         return duplicated
 
@@ -451,12 +480,14 @@ class MSBEntryList(abc.ABC, tp.Generic[MSBEntryType]):
     def delete_entry(self, entry: EntrySpecType) -> MSBEntryType:
         """Delete (and return) specified `entry`."""
         self._entries.remove(entry)
+        self._clear_entries_by_subtype()
         return entry
 
     def delete_all_entries_of_subtype(self, entry_subtype):
         """Delete all entries of the given `entry_subtype`."""
         for entry in self.get_entries(entry_subtype):
             self._entries.remove(entry)
+        self._clear_entries_by_subtype()
 
     def get_subtype_next_global_index(self, entry_subtype: MSBSubtype) -> int:
         """Returns next global index of given `entry_subtype`, e.g. for inserting a new entry into the `MSBEntryList` at
@@ -18,6 +18,7 @@ import abc
 import logging
 import typing as tp
 import struct
+from functools import partial
 
 from soulstruct.exceptions import InvalidFieldValueError, SoulstructError
 from soulstruct.game_types import *
@@ -953,5 +954,5 @@ for _entry_subtype in MSBPartSubtype:
     setattr(
         MSBPartList,
         _entry_subtype.pluralized_name,
-        property(lambda self, _e=_entry_subtype: [e for e in self._entries if e.ENTRY_SUBTYPE == _e]),
+        property(partial(MSBEntryList._get_subtype_entries, entry_subtype=_entry_subtype)),
     )
@@ -15,6 +15,7 @@ import abc
 import typing as tp
 import logging
 import struct
+from functools import partial
 
 from soulstruct.utilities import read_chars_from_buffer, pad_chars, partialmethod
 from soulstruct.utilities.binary_struct import BinaryStruct
@@ -342,5 +343,5 @@ for _entry_subtype in MSBRegionList.ENTRY_SUBTYPE_ENUM:
     setattr(
         MSBRegionList,
         _entry_subtype.pluralized_name,
-        property(lambda self, _e=_entry_subtype: [e for e in self._entries if e.ENTRY_SUBTYPE == _e]),
+        property(partial(MSBEntryList._get_subtype_entries, entry_subtype=_entry_subtype)),
     )
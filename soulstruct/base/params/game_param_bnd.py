@@ -77,7 +77,7 @@ class GameParamBND(BaseBND, abc.ABC):
         self.load_manifest_header(data)
         if "params" not in data:
             raise KeyError("Field `params` not specified in `GameParamBND` dict.")
-        self._entries.clear()
+        self.clear_entries()
         entry_ids = set()
         for i, param_dict in enumerate(data["params"]):
             for field in ("entry_id", "path", "magic", "data"):
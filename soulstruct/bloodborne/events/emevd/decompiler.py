@@ -8,19 +8,25 @@ from . import enums
 
 class InstructionDecompiler(_BaseDecompiler):
 
+    __slots__ = ()
     ENUMS = enums
     GET_MAP = staticmethod(get_map)
 
     @parse_parameters
     def _3_23(self, condition, attacked_entity: EntityEnum, attacker: EntityEnum, damage_type: DamageType):
-        if not self._any_vars(damage_type) and damage_type.name == "Unspecified":
+        if damage_type is self._UNSPECIFIED_DAMAGE:
             # Leave out default `damage_type` value.
             if attacker == -1:
-                return f"IfAttackedWithDamageType({condition}, {attacked_entity=})"
-            return f"IfAttackedWithDamageType({condition}, {attacked_entity=}, {attacker=})"
+                return f"IfAttackedWithDamageType({condition}, attacked_entity={attacked_entity})"
+            return f"IfAttackedWithDamageType({condition}, attacked_entity={attacked_entity}, attacker={attacker})"
         if attacker == -1:
-            return f"IfAttackedWithDamageType({condition}, {attacked_entity=}, {damage_type=})"
-        return f"IfAttackedWithDamageType({condition}, {attacked_entity=}, {attacker=}, {damage_type=})"
+            return (
+                f"IfAttackedWithDamageType({condition}, attacked_entity={attacked_entity}, damage_type={damage_type})"
+            )
+        return (
+            f"IfAttackedWithDamageType({condition}, attacked_entity={attacked_entity}, attacker={attacker}, "
+            f"damage_type={damage_type})"
+        )
 
     @parse_parameters("IfActionButtonParam", no_name_count=1)
     def _3_24(self, condition, action_button_id, entity: EntityEnum):
@@ -33,7 +39,7 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _3_26(self, condition, value, comparison_type: ComparisonType):
         if self._any_vars(comparison_type):
-            return f"IfPlayerInsightAmountComparison({condition}, {value}, {comparison_type=})"
+            return f"IfPlayerInsightAmountComparison({condition}, {value}, comparison_type={comparison_type})"
         return f"IfPlayerInsightAmount{comparison_type.name}({condition}, {value})"
 
     @parse_parameters("IfDialogChoice", no_name_count=2)
@@ -54,13 +60,13 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"IfCharacterDrawGroupActive({condition}, {character})"
         if state is False:
             return f"IfCharacterDrawGroupInactive({condition}, {character})"
-        return f"IfCharacterDrawGroupState({condition}, {character}, {state=})"
+        return f"IfCharacterDrawGroupState({condition}, {character}, state={state})"
 
     @parse_parameters
     def _1000_101(self, label: Label, state: bool, input_condition):
         if not self._any_vars(state):
-            return f"GotoIfCondition{state}({label}, {input_condition=})"
-        return f"GotoIfConditionState({label}, {state=}, {input_condition=})"
+            return f"GotoIfCondition{state}({label}, input_condition={input_condition})"
+        return f"GotoIfConditionState({label}, state={state}, input_condition={input_condition})"
 
     @parse_parameters("Goto", no_name_count=1)
     def _1000_103(self, label: Label):
@@ -73,8 +79,8 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _1000_107(self, label: Label, state: bool, input_condition):
         if not self._any_vars(state):
-            return f"GotoIfFinishedCondition{state}({label}, {input_condition=})"
-        return f"GotoIfFinishedConditionState({label}, {state=}, {input_condition=})"
+            return f"GotoIfFinishedCondition{state}({label}, input_condition={input_condition})"
+        return f"GotoIfFinishedConditionState({label}, state={state}, input_condition={input_condition})"
 
     @parse_parameters("SkipLinesIfCoopClientCountComparison", no_name_count=3)
     def _1003_09(self, skip_lines, comparison_type: ComparisonType, value):
@@ -119,30 +125,26 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _1003_101(self, label: Label, state: FlagState, flag_type: FlagType, flag):
         if self._any_vars(state, flag_type):
-            return f"GotoIfFlagState({label}, {state=}, {flag_type=}, {flag=})"
-        if state != FlagState.Change:
-            if flag_type == FlagType.Absolute:
-                return f"GotoIfFlag{state.name}({label}, {flag})"
-            elif flag == 0:
-                if flag_type == FlagType.RelativeToThisEvent:
-                    return f"GotoIfThisEvent{state.name}({label})"
-                elif flag_type == FlagType.RelativeToThisEventSlot:
-                    return f"GotoIfThisEventSlot{state.name}({label})"
-        return f"GotoIfFlagState({label}, {state=}, {flag_type=}, {flag=})" + self.SUSPICIOUS
+            return f"GotoIfFlagState({label}, state={state}, flag_type={flag_type}, flag={flag})"
+        if state is not self._CHANGE and (flag_test := self._get_flag_test(state, flag_type, flag, label)):
+            return f"GotoIf{flag_test}"
+        return f"GotoIfFlagState({label}, state={state}, flag_type={flag_type}, flag={flag})" + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_103(self, label: Label, state: RangeState, flag_type: FlagType, first_flag, last_flag):
         flag_range = f"({first_flag}, {last_flag})"
         if self._any_vars(state, flag_type):
-            return f"GotoIfFlagRangeState({label}, {state=}, {flag_type=}, {flag_range=})"
-        if flag_type == FlagType.Absolute:
+            return f"GotoIfFlagRangeState({label}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        if flag_type is self._ABSOLUTE:
             return f"GotoIfFlagRange{state.name}({label}, {flag_range})"
-        return f"GotoIfFlagRangeState({label}, {state=}, {flag_type=}, {flag_range=})" + self.SUSPICIOUS
+        return (
+            f"GotoIfFlagRangeState({label}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        ) + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_105(self, label: Label, state: MultiplayerState):
         if self._any_vars(state):
-            return f"GotoIfMultiplayerState({label}, {state=})"
+            return f"GotoIfMultiplayerState({label}, state={state})"
         return f"GotoIf{state.name}({label})"
 
     @parse_parameters
@@ -152,7 +154,7 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"GotoIfInsideMap({label}, {game_map})"
         if state is False:
             return f"GotoIfOutsideMap({label}, {game_map})"
-        return f"GotoIfMapPresenceState({label}, {game_map}, {state=})"
+        return f"GotoIfMapPresenceState({label}, {game_map}, state={state})"
 
     @parse_parameters("GotoIfCoopClientCountComparison", no_name_count=3)
     def _1003_109(self, label: Label, comparison_type: ComparisonType, value):
@@ -164,7 +166,7 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"GotoIfObjectDestroyed({label}, {obj})"
         if state is False:
             return f"GotoIfObjectNotDestroyed({label}, {obj})"
-        return f"GotoIfObjectDestructionState({label}, {obj}, {state=})"
+        return f"GotoIfObjectDestructionState({label}, {obj}, state={state})"
 
     def _1014_00(self):
         return "DefineLabel(0)"
@@ -209,8 +211,8 @@ class InstructionDecompiler(_BaseDecompiler):
     ):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndMovePlayerAndSetTimePeriod({cutscene}, {cutscene_type}, {move_to_region=}, "
-            f"{move_to_map=}, {player_id=}, {time_period_id=})"
+            f"PlayCutsceneAndMovePlayerAndSetTimePeriod({cutscene}, {cutscene_type}, move_to_region={move_to_region}, "
+            f"move_to_map={move_to_map}, player_id={player_id}, time_period_id={time_period_id})"
         )
 
     @parse_parameters("PlayCutsceneAndSetTimePeriod", no_name_count=2)
@@ -220,7 +222,7 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _2002_08(self, region, area_id, block_id):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
-        return f"PlayCutsceneAndMovePlayer_Dummy({region}, {move_to_map=})"
+        return f"PlayCutsceneAndMovePlayer_Dummy({region}, move_to_map={move_to_map})"
 
     @parse_parameters("HandleMinibossDefeat", no_name_count=1)
     def _2003_15(self, miniboss_id):
@@ -260,21 +262,21 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"EnableMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y})"
         if state is False:
             return f"DisableMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y})"
-        return f"SetMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y}, {state=})"
+        return f"SetMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y}, state={state})"
 
     @parse_parameters
     def _2003_46(self, content_image_part_id, state: bool):
         """No Enable/Disable wrappers."""
-        return f"SetMapContentImageDisplayState({content_image_part_id}, {state=})"
+        return f"SetMapContentImageDisplayState({content_image_part_id}, state={state})"
 
     @parse_parameters
     def _2003_47(self, hierarchy, grid_x, grid_y, state: bool):
         """No Enable/Disable wrappers."""
-        return f"SetMapBoundariesDisplay({hierarchy}, {grid_x}, {grid_y}, {state=})"
+        return f"SetMapBoundariesDisplay({hierarchy}, {grid_x}, {grid_y}, state={state})"
 
     @parse_parameters
     def _2003_48(self, region, state: bool, duration, wind_parameter_id):
-        return f"SetAreaWind({region}, {state=}, {duration=}, {wind_parameter_id=})"
+        return f"SetAreaWind({region}, state={state}, duration={duration}, wind_parameter_id={wind_parameter_id})"
 
     @parse_parameters("WarpPlayerToRespawnPoint", no_name_count=1)
     def _2003_49(self, respawn_point_id):
@@ -14,6 +14,7 @@ __all__ = [
 
 import struct
 import typing as tp
+from functools import partial
 
 from soulstruct.game_types import *
 from soulstruct.base.maps.msb.utils import MapFieldInfo
@@ -768,5 +769,5 @@ for _entry_subtype in MSBPartSubtype:
     setattr(
         MSBPartList,
         _entry_subtype.pluralized_name,
-        property(lambda self, _e=_entry_subtype: [e for e in self._entries if e.ENTRY_SUBTYPE == _e]),
+        property(partial(MSBEntryList._get_subtype_entries, entry_subtype=_entry_subtype)),
     )
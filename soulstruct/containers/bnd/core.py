@@ -2,9 +2,19 @@ import abc
 import io
 import json
 import logging
+import mmap
+import os
+import struct
 import zlib
 import typing as tp
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, compress
+from math import isqrt
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 
 from soulstruct.containers.bnd.magic import *
 from soulstruct.containers.dcx import DCX
@@ -12,22 +22,60 @@ from soulstruct.base.game_file import GameFile, InvalidGameFileTypeError
 from soulstruct.utilities.core import read_chars_from_buffer
 from soulstruct.utilities.binary_struct import BinaryStruct
 
+try:
+    import deflate  # optional `libdeflate` bindings, used for faster entry decompression when available
+except ImportError:
+    deflate = None
+
 __all__ = ["BND", "BND3", "BND4", "BaseBND", "BNDEntry"]
 _LOGGER = logging.getLogger(__name__)
 
 
+def _get_primes_below(limit: int) -> tuple[int, ...]:
+    """Returns all primes less than `limit` (at least 3), found with a sieve of Eratosthenes."""
+    sieve = bytearray(b"\x01") * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit, i)))
+    return tuple(compress(range(limit), sieve))
+
+
+_HASH_GROUP_PRIMES = _get_primes_below(10008)  # ends with 10007
+
+
 class BNDError(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _get_binary_struct(*field_groups: tuple[str, tuple]) -> BinaryStruct:
+    """Returns a `BinaryStruct` built from `(byte_order, fields)` groups, which is only constructed once.
+
+    These structs are shared between all BNDs with the same layout, so fields must never be added to them.
+    """
+    binary_struct = BinaryStruct()
+    for byte_order, fields in field_groups:
+        binary_struct.add_fields(*fields, byte_order=byte_order)
+    return binary_struct
+
+
 class BNDEntry:
 
     # Header struct is computed in BND, as it is constant across entries in the same BND.
 
-    def __init__(self, data: bytes, entry_id: int = None, path: str = None, magic=0x40):
-        self.data = data  # Packed binary data, identical to what the unpacked file would look like.
-        self.id = entry_id  # Index used by the game engine to access the packed data (in most cases).
-        self.path = path  # Full internal 'path' (in most cases). Encoded in shift-jis with escaped backslashes.
+    # Incremented whenever the ID or path of any entry changes, which invalidates cached `BND.entries_by_*` dictionaries.
+    _key_change_count = 0
+
+    def __init__(self, data: tp.Optional[bytes], entry_id: int = None, path: str = None, magic=0x40):
+        self._data = data  # Packed binary data, identical to what the unpacked file would look like.
+        self._compressed_data = None  # type: tp.Optional[bytes]
+        self._uncompressed_size = None  # type: tp.Optional[int]
+        self._packed_data = None  # type: tp.Optional[bytes]  # result of last compression of `data` for packing
+        self._id = entry_id  # Index used by the game engine to access the packed data (in most cases).
+        self._path = path  # Full internal 'path' (in most cases). Encoded in shift-jis with escaped backslashes.
+        self._parsed_path = None  # type: tp.Optional[Path]  # `Path(self.path)`, created on first use
+        self._path_hash = None  # type: tp.Optional[int]  # `BND4.path_hash(self.path)`, cached by BND4 hash tables
         self.magic = magic  # Defaults to 0x40, which seems to be used in DS1/DS3 at least.
 
     @classmethod
@@ -45,32 +93,109 @@ class BNDEntry:
             )
             data = bnd_buffer.read(d.compressed_data_size)
             if is_entry_compressed(d.entry_magic):
-                data = zlib.decompressobj().decompress(data)
-            entry_headers.append(cls(entry_id=d.get("entry_id", None), path=path, data=data, magic=d.entry_magic))
+                # Decompression is deferred until `data` is first accessed.
+                entry = cls(entry_id=d.get("entry_id", None), path=path, data=None, magic=d.entry_magic)
+                entry._compressed_data = data
+                entry._uncompressed_size = d.get("uncompressed_data_size", None)
+            else:
+                entry = cls(entry_id=d.get("entry_id", None), path=path, data=data, magic=d.entry_magic)
+            entry_headers.append(entry)
 
         return entry_headers
 
+    @property
+    def data(self) -> bytes:
+        """Entry data, which is decompressed on first access if the entry was unpacked from a BND compressed.
+
+        Note that corrupt compressed data is therefore only detected (raising `zlib.error`) when `data` is first
+        accessed, not when the BND is loaded. A truncated compressed stream is not an error: as before, whatever data
+        it contains is returned.
+        """
+        if self._data is None and self._compressed_data is not None:
+            self._data = self._decompress(self._compressed_data, self._uncompressed_size)
+            self._compressed_data = None
+        return self._data
+
+    @staticmethod
+    def _decompress(compressed_data: bytes, uncompressed_size: tp.Optional[int]) -> bytes:
+        if deflate is not None and uncompressed_size is not None:
+            try:
+                return deflate.zlib_decompress(compressed_data, uncompressed_size)
+            except deflate.DeflateError:
+                pass  # e.g. truncated stream, which `zlib` below partially decompresses (or raises `zlib.error`)
+        try:
+            if uncompressed_size is not None:
+                return zlib.decompress(compressed_data, bufsize=uncompressed_size)
+            return zlib.decompress(compressed_data)
+        except zlib.error:
+            # One-shot decompression rejects truncated streams, which a decompression object partially decompresses.
+            return zlib.decompressobj().decompress(compressed_data)
+
+    @data.setter
+    def data(self, value: bytes):
+        self._data = value
+        self._compressed_data = None
+        self._uncompressed_size = None
+        self._packed_data = None
+
     def get_data_for_pack(self):
-        """Compresses data first if appropriate. Returns `(data, is_compressed)`."""
+        """Compresses data first if appropriate. Returns `(data, is_compressed)`.
+
+        Compressed data is kept until `data` is next set, so repacking unchanged entries does not compress them again.
+        (Mutable `data`, such as a `bytearray`, is always compressed again.)
+        """
         if is_entry_compressed(self.magic):
-            return zlib.compress(self.data, level=7), True
+            if self._packed_data is not None:
+                return self._packed_data, True
+            data = self.data
+            packed_data = zlib.compress(data, level=7)
+            if type(data) is bytes:
+                self._packed_data = packed_data
+            return packed_data, True
         return self.data, False
 
     @property
     def data_size(self):
+        if self._data is None and self._uncompressed_size is not None:
+            return self._uncompressed_size
         return len(self.data)
 
     def get_packed_path(self, encoding):
-        """Encodes path in Japanese and null-terminates."""
-        return self.path.encode(encoding) + b"\x00"
+        """Encodes path in Japanese (or UTF-16) and null-terminates (with a two-byte null for UTF-16)."""
+        return (self.path + "\0").encode(encoding)
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @id.setter
+    def id(self, value: int):
+        self._id = value
+        BNDEntry._key_change_count += 1
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @path.setter
+    def path(self, value: str):
+        self._path = value
+        self._parsed_path = None
+        self._path_hash = None
+        BNDEntry._key_change_count += 1
+
+    def _get_parsed_path(self) -> Path:
+        if self._parsed_path is None:
+            self._parsed_path = Path(self._path)
+        return self._parsed_path
 
     @property
     def name(self):
-        return Path(self.path).name
+        return self._get_parsed_path().name
 
     @property
     def stem(self):
-        return Path(self.path).stem
+        return self._get_parsed_path().stem
 
     @property
     def path_with_forward_slashes(self):
@@ -78,7 +203,7 @@ class BNDEntry:
 
     @property
     def directory_with_forward_slashes(self):
-        return str(Path(self.path).parent).replace("\\", "/")
+        return str(self._get_parsed_path().parent).replace("\\", "/")
 
     def copy(self):
         return BNDEntry(data=self.data, entry_id=self.id, path=self.path, magic=self.magic)
@@ -114,11 +239,25 @@ class BaseBND(GameFile, abc.ABC):
         self.header_struct = None  # type: tp.Optional[BinaryStruct]
 
         self._entries = []  # type: list[BNDEntry]
+        self._entries_key = None  # type: tp.Optional[int]  # see `_check_entries_key()`
+        self._entries_by_id = None  # type: tp.Optional[dict[int, BNDEntry]]
+        self._entries_by_path = None  # type: tp.Optional[dict[str, BNDEntry]]
+        self._entries_by_basename = None  # type: tp.Optional[dict[str, BNDEntry]]
 
         super().__init__(bnd_source, dcx_magic=dcx_magic)
 
-    def _handle_other_source_types(self, file_source, **kwargs) -> tp.Optional[io.BufferedIOBase]:
-        """A BND can also be loaded from a `bnd_manifest.json` file or a directory containing such a file."""
+    def _handle_other_source_types(self, file_source, **kwargs) -> tp.Union[io.BufferedIOBase, mmap.mmap, None]:
+        """A BND can also be loaded from a `bnd_manifest.json` file or a directory containing such a file.
+
+        Packed (non-DCX) BND files are memory-mapped rather than opened as a buffered stream, so the many small
+        seek/read calls made while unpacking entries are served from the page cache without a system call each. The
+        returned `mmap.mmap` supports the `read()`, `seek()`, `tell()`, and `close()` calls that `GameFile` and
+        `unpack()` make on buffers, and is closed by `GameFile` once unpacked.
+
+        This is not zero-copy: entries copy their (possibly compressed) data out of the map, so they never read from it
+        after it is closed. Keeping the map open for the life of the BND would stop the file from being overwritten on
+        Windows (e.g. by `write()`).
+        """
 
         if isinstance(file_source, (str, Path)):
             file_source = Path(file_source)
@@ -132,6 +271,17 @@ class BaseBND(GameFile, abc.ABC):
                     self.path = directory  # writing this path will conflict with this unpacked folder source
                 self.load_unpacked_dir(directory)
                 return
+            if file_source.is_file() and file_source.suffix != ".json":
+                with file_source.open("rb") as f:
+                    try:
+                        bnd_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except ValueError:
+                        pass  # empty file cannot be mapped; fall back to default handling
+                    else:
+                        if bnd_mmap[:4] != b"DCX\0":
+                            self.path = file_source
+                            return bnd_mmap
+                        bnd_mmap.close()  # DCX data is decompressed into memory anyway
 
         raise InvalidGameFileTypeError(f"`bnd_source` is not a `bnd_manifest.json` file or directory containing one.")
 
@@ -156,13 +306,18 @@ class BaseBND(GameFile, abc.ABC):
 
     def add_entries_from_manifest(self, entries: dict, directory, use_id_prefix: bool):
         directory = Path(directory)
-        unsorted_entries = {}  # maps ID to (path, data, magic) tuple
+        entry_files = []  # type: list[tuple[int, str, Path, int]]
         for root, entry_dicts in entries.items():
             for entry in entry_dicts:
                 find_entry_basename = f"__{entry['id']}__{entry['name']}" if use_id_prefix else entry['name']
-                with (directory / find_entry_basename).open("rb") as entry_file:
-                    entry_data = entry_file.read()
-                unsorted_entries[entry['id']] = (f"{root}\\{entry['name']}", entry_data, entry['magic'])
+                entry_path = f"{root}\\{entry['name']}"
+                entry_files.append((entry['id'], entry_path, directory / find_entry_basename, entry['magic']))
+        # Entry files are read from a thread pool, as file reads release the GIL.
+        with ThreadPoolExecutor(max_workers=min(32, len(entry_files) or 1)) as executor:
+            entries_data = list(executor.map(Path.read_bytes, [file_path for _, _, file_path, _ in entry_files]))
+        unsorted_entries = {}  # maps ID to (path, data, magic) tuple
+        for (entry_id, path, _, magic), entry_data in zip(entry_files, entries_data):
+            unsorted_entries[entry_id] = (path, entry_data, magic)
         for entry_id, (path, data, magic) in sorted(unsorted_entries.items()):
             self.add_entry(BNDEntry(entry_id=entry_id, path=path, data=data, magic=magic))
 
@@ -183,30 +338,53 @@ class BaseBND(GameFile, abc.ABC):
         directory.mkdir(parents=True, exist_ok=True)
 
         entry_tree_dict = {}
+        # Maps (case-normalized) file path to `(file_path, entry)`. If entries share an output file, the last one wins.
+        entry_files = {}  # type: dict[str, tuple[Path, BNDEntry]]
         use_index_prefix = self.has_repeated_entry_names
 
         for i, entry in enumerate(self._entries):
-            entry_directory = str(Path(entry.path).parent)  # no trailing backslash
+            entry_directory = str(entry._get_parsed_path().parent)  # no trailing backslash
             entry_dict = {"magic": entry.magic, "id": entry.id if has_id(self.magic) else i, "name": entry.name}
             entry_tree_dict.setdefault(entry_directory, []).append(entry_dict)
             entry_file_name = f"__{entry.id}__{entry.name}" if use_index_prefix else entry.name
-            with (directory / entry_file_name).open("wb") as f:
-                packed_entry, _ = entry.get_data_for_pack()
-                f.write(packed_entry)
+            entry_file_path = directory / entry_file_name
+            entry_files[os.path.normcase(entry_file_path)] = (entry_file_path, entry)
+
+        # File writes (and any compression) release the GIL, so entry files are written from a thread pool. Each file
+        # path is only written once, so the result does not depend on the order in which the threads run.
+        if entry_files:
+            with ThreadPoolExecutor(max_workers=min(32, len(entry_files))) as executor:
+                list(executor.map(self._write_entry_file, *zip(*entry_files.values())))
 
         json_dict = self.get_json_header()
         json_dict["entries"] = entry_tree_dict
 
         # NOTE: BND manifest is always encoded in shift-JIS.
+        # Encoded in one `dumps()` call, as `dump()` issues a separate write for every JSON token.
         with (directory / "bnd_manifest.json").open("w", encoding="shift-jis") as f:
-            json.dump(json_dict, f, indent=4)
+            f.write(json.dumps(json_dict, indent=4))
+
+    @staticmethod
+    def _write_entry_file(file_path: Path, entry: BNDEntry):
+        packed_entry, _ = entry.get_data_for_pack()
+        with file_path.open("wb") as f:
+            f.write(packed_entry)
 
     def add_entry(self, entry: BNDEntry):
-        if entry in self._entries:
-            raise BNDError(f"Given `BNDEntry` instance with ID {entry.id} is already in this BND.")
-        if entry.id in self.entries_by_id:
+        # Any entry equal to `entry` must have the same ID, so only that entry needs to be compared.
+        existing_entry = self.entries_by_id.get(entry.id)
+        if existing_entry is not None:
+            if existing_entry == entry:
+                raise BNDError(f"Given `BNDEntry` instance with ID {entry.id} is already in this BND.")
             _LOGGER.warning(f"Entry ID {entry.id} appears more than once in this BND. Fix this as soon as you can.")
         self._entries.append(entry)
+        if existing_entry is None:
+            # Extend the (just validated) ID dictionary rather than rebuilding it on the next lookup.
+            self._entries_by_id[entry.id] = entry
+            self._entries_by_path = self._entries_by_basename = None
+            self._entries_key = self._get_entries_key()
+        else:
+            self._clear_entries_dicts()
 
     def remove_entry(self, id_or_path_or_basename):
         if isinstance(id_or_path_or_basename, int):
@@ -219,10 +397,24 @@ class BaseBND(GameFile, abc.ABC):
         else:
             raise TypeError("Entry to be removed should be a BND ID (int) or path/basename (str).")
         self._entries.remove(entry)
+        self._clear_entries_dicts()
 
     def clear_entries(self):
         """Remove all entries from the BND."""
         self._entries.clear()
+        self._clear_entries_dicts()
+
+    @staticmethod
+    def _get_entries_data_for_pack(entries: tp.Sequence[BNDEntry]) -> list[tuple[bytes, bool]]:
+        """Calls `get_data_for_pack()` for all `entries`, in a thread pool if more than one entry will be compressed.
+
+        `zlib` releases the GIL while compressing, so this scales with available cores for large compressed BNDs.
+        """
+        compressed_count = sum(is_entry_compressed(entry.magic) for entry in entries)
+        if compressed_count < 2:
+            return [entry.get_data_for_pack() for entry in entries]
+        with ThreadPoolExecutor(max_workers=min(compressed_count, os.cpu_count() or 1)) as executor:
+            return list(executor.map(BNDEntry.get_data_for_pack, entries))
 
     def _check_version(self, version: str):
         if version != self.VERSION:
@@ -232,51 +424,81 @@ class BaseBND(GameFile, abc.ABC):
         raise NotImplementedError
 
     @property
-    def entries(self) -> list[BNDEntry]:
-        """Returns an ordered list of BND entries, unpacked with the `entry_class` given to the constructor."""
-        return self._entries
+    def entries(self) -> tuple[BNDEntry, ...]:
+        """Returns an ordered tuple of BND entries, unpacked with the `entry_class` given to the constructor.
+
+        Entries are added and removed with `add_entry()`, `remove_entry()`, and `clear_entries()`, which keep the
+        `entries_by_*` dictionaries up to date.
+        """
+        return tuple(self._entries)
+
+    @staticmethod
+    def _get_entries_key() -> int:
+        return BNDEntry._key_change_count
+
+    def _clear_entries_dicts(self):
+        self._entries_by_id = self._entries_by_path = self._entries_by_basename = None
+
+    def _check_entries_key(self):
+        """Discard cached `entries_by_*` dictionaries if the ID or path of any entry (of any BND) has changed.
+
+        BND methods that add or remove entries update or clear the dictionaries themselves.
+        """
+        entries_key = self._get_entries_key()
+        if entries_key != self._entries_key:
+            self._entries_key = entries_key
+            self._clear_entries_dicts()
 
     @property
-    def entries_by_id(self) -> dict[int, BNDEntry]:
-        """Dictionary mapping entry IDs to entries.
+    def entries_by_id(self) -> tp.Mapping[int, BNDEntry]:
+        """Read-only dictionary mapping entry IDs to entries.
 
         If there are multiple entries with the same ID in the BND, this will raise a `ValueError`. This should never
         happen; if it does, fix it by accessing the culprit entries with `.entries` and changing one or more IDs.
         """
-        entries = {}
-        for entry in self._entries:
-            if entry.id in entries:
-                raise BNDError(f"There are multiple entries with ID {entry.id}.")
-            entries[entry.id] = entry
-        return entries
+        self._check_entries_key()
+        if self._entries_by_id is None:
+            entries = {}
+            for entry in self._entries:
+                if entry.id in entries:
+                    raise BNDError(f"There are multiple entries with ID {entry.id}.")
+                entries[entry.id] = entry
+            self._entries_by_id = entries
+        return MappingProxyType(self._entries_by_id)
 
     @property
-    def entries_by_path(self) -> dict[str, BNDEntry]:
-        """Dictionary mapping entry paths to (classed) entries.
+    def entries_by_path(self) -> tp.Mapping[str, BNDEntry]:
+        """Read-only dictionary mapping entry paths to (classed) entries.
 
         The same path and/or basename may appear in multiple paths in a BND (e.g. vanilla 'item.msgbnd' in Dark Souls
         Remastered). If it does, this property will raise an exception.
         """
-        entries = {}
-        for entry in self._entries:
-            if entry.path in entries:
-                raise ValueError(f"Path '{entry.path}' appears in multiple `BNDEntry` paths.")
-            entries[entry.path] = entry
-        return entries
+        self._check_entries_key()
+        if self._entries_by_path is None:
+            entries = {}
+            for entry in self._entries:
+                if entry.path in entries:
+                    raise ValueError(f"Path '{entry.path}' appears in multiple `BNDEntry` paths.")
+                entries[entry.path] = entry
+            self._entries_by_path = entries
+        return MappingProxyType(self._entries_by_path)
 
     @property
-    def entries_by_basename(self) -> dict[str, BNDEntry]:
-        """Dictionary mapping entry basenames to (classed) entries.
+    def entries_by_basename(self) -> tp.Mapping[str, BNDEntry]:
+        """Read-only dictionary mapping entry basenames to (classed) entries.
 
         The same path and/or basename may appear in multiple paths in a BND (e.g. vanilla 'item.msgbnd' in Dark Souls
         Remastered). If it does, this property will raise an exception.
         """
-        entries = {}
-        for entry in self._entries:
-            if entry.name in entries:
-                raise ValueError(f"Basename '{entry.name}' appears in multiple BND entry paths.")
-            entries[entry.name] = entry
-        return entries
+        self._check_entries_key()
+        if self._entries_by_basename is None:
+            entries = {}
+            for entry in self._entries:
+                if entry.name in entries:
+                    raise ValueError(f"Basename '{entry.name}' appears in multiple BND entry paths.")
+                entries[entry.name] = entry
+            self._entries_by_basename = entries
+        return MappingProxyType(self._entries_by_basename)
 
     @property
     def entry_count(self) -> int:
@@ -284,7 +506,7 @@ class BaseBND(GameFile, abc.ABC):
 
     @property
     def has_repeated_entry_names(self):
-        entry_names = [e.name for e in self.entries]
+        entry_names = [e.name for e in self._entries]
         return len(set(entry_names)) < len(entry_names)
 
     def __getitem__(self, id_or_path_or_basename) -> BNDEntry:
@@ -311,36 +533,7 @@ class BaseBND(GameFile, abc.ABC):
     @classmethod
     def detect(cls, bnd_source):
         """Returns True if `bnd_source` appears to be this subclass of `BaseBND`. Does not support DCX sources."""
-        if isinstance(bnd_source, (str, Path)):
-            bnd_path = Path(bnd_source)
-            if bnd_path.is_file() and bnd_path.name == "bnd_manifest.json":
-                bnd_path = bnd_path.parent
-            if bnd_path.is_dir():
-                try:
-                    with (bnd_path / "bnd_manifest.json").open("rb") as f:
-                        return json.load(f)["version"] == cls.__name__  # "BND3" or "BND4"
-                except FileNotFoundError:
-                    return False
-            elif bnd_path.is_file():
-                with bnd_path.open("rb") as buffer:
-                    try:
-                        version = read_chars_from_buffer(buffer, length=4, encoding="utf-8")
-                    except ValueError:
-                        return False
-                    return version == cls.__name__
-            return False
-        elif isinstance(bnd_source, bytes):
-            bnd_source = io.BytesIO(bnd_source)
-        if isinstance(bnd_source, io.BufferedIOBase):
-            old_offset = bnd_source.tell()
-            bnd_source.seek(0)
-            try:
-                version = read_chars_from_buffer(bnd_source, length=4, encoding="utf-8")
-            except ValueError:
-                bnd_source.seek(old_offset)
-                return False
-            bnd_source.seek(old_offset)
-            return version == cls.__name__
+        return _detect_bnd_version(bnd_source) == cls.__name__
 
 
 class BND3(BaseBND):
@@ -380,23 +573,16 @@ class BND3(BaseBND):
         super().__init__(bnd_source=bnd_source, dcx_magic=dcx_magic)
 
     def unpack(self, buffer, **kwargs):
-        self.header_struct = BinaryStruct(*self.HEADER_STRUCT_START, byte_order="<")
-        header = self.header_struct.unpack(buffer)
+        header = _get_binary_struct(("<", self.HEADER_STRUCT_START)).unpack(buffer)
         self._check_version(header["version"].decode())
         self.signature = header["signature"].rstrip(b"\0").decode()
         self.magic = header["magic"]
         self.big_endian = header["big_endian"] or is_big_endian(self.magic)
         byte_order = ">" if self.big_endian else "<"
-        header.update(self.header_struct.unpack(buffer, *self.HEADER_STRUCT_ENDIAN, byte_order=byte_order))
+        header.update(_get_binary_struct((byte_order, self.HEADER_STRUCT_ENDIAN)).unpack(buffer))
         self.unknown = header["unknown"]
 
-        self.entry_header_struct = BinaryStruct(*self.BND_ENTRY_HEADER, byte_order=byte_order)
-        if has_id(self.magic):
-            self.entry_header_struct.add_fields(self.ENTRY_ID, byte_order=byte_order)
-        if has_path(self.magic):
-            self.entry_header_struct.add_fields(self.NAME_OFFSET, byte_order=byte_order)
-        if has_uncompressed_size(self.magic):
-            self.entry_header_struct.add_fields(self.UNCOMPRESSED_DATA_SIZE, byte_order=byte_order)
+        self.create_header_structs()
 
         # NOTE: BND paths are *not* encoded in `shift_jis_2004`, unlike most other strings! They are `shift-jis`.
         #  The main annoyance here is that escaped backslashes are encoded as the yen symbol in `shift_jis_2004`.
@@ -406,52 +592,38 @@ class BND3(BaseBND):
             self.add_entry(entry)
 
     def create_header_structs(self):
-        self.header_struct = BinaryStruct(*self.HEADER_STRUCT_START, byte_order="<")
         byte_order = ">" if self.big_endian else "<"
-        self.header_struct.add_fields(*self.HEADER_STRUCT_ENDIAN, byte_order=byte_order)
-        self.entry_header_struct = BinaryStruct(*self.BND_ENTRY_HEADER, byte_order=byte_order)
+        self.header_struct = _get_binary_struct(
+            ("<", self.HEADER_STRUCT_START), (byte_order, self.HEADER_STRUCT_ENDIAN)
+        )
+        entry_fields = self.BND_ENTRY_HEADER
         if has_id(self.magic):
-            self.entry_header_struct.add_fields(self.ENTRY_ID, byte_order=byte_order)
+            entry_fields += (self.ENTRY_ID,)
         if has_path(self.magic):
-            self.entry_header_struct.add_fields(self.NAME_OFFSET, byte_order=byte_order)
+            entry_fields += (self.NAME_OFFSET,)
         if has_uncompressed_size(self.magic):
-            self.entry_header_struct.add_fields(self.UNCOMPRESSED_DATA_SIZE, byte_order=byte_order)
+            entry_fields += (self.UNCOMPRESSED_DATA_SIZE,)
+        self.entry_header_struct = _get_binary_struct((byte_order, entry_fields))
 
     def pack(self):
-        entry_header_dicts = []
-        packed_entry_headers = b""
-        packed_entry_paths = b""
-        relative_entry_path_offsets = []
-        packed_entry_data = b""
-        relative_entry_data_offsets = []
-
-        for entry in sorted(self._entries, key=lambda e: e.id):
-            entry_header_dict = {
-                "entry_magic": entry.magic,
-                "compressed_data_size": entry.data_size,
-                "data_offset": len(packed_entry_data),
-            }
-            if has_id(self.magic):
-                entry_header_dict["entry_id"] = entry.id
-            if has_path(self.magic):
-                entry_header_dict["path_offset"] = len(packed_entry_paths)
-                relative_entry_path_offsets.append(len(packed_entry_paths))  # Relative to start of packed entry paths.
-                packed_entry_paths += entry.get_packed_path("shift-jis")
-            if has_uncompressed_size(self.magic):
-                entry_header_dict["uncompressed_data_size"] = entry.data_size
-
-            relative_entry_data_offsets.append(len(packed_entry_data))
-            entry_data, is_compressed = entry.get_data_for_pack()
-            if is_compressed:
-                entry_header_dict["compressed_data_size"] = len(entry_data)
-            packed_entry_data += entry_data
-            entry_header_dicts.append(entry_header_dict)
+        entry_has_id = has_id(self.magic)
+        entry_has_path = has_path(self.magic)
+        entry_has_uncompressed_size = has_uncompressed_size(self.magic)
+        packed_entry_paths = []  # type: list[bytes]
+        packed_entry_data = []  # type: list[bytes]
+        entries = sorted(self._entries, key=attrgetter("id"))
+
+        # Entry paths are packed first, so all table offsets are known before entry headers are packed.
+        if entry_has_path:
+            packed_entry_paths = [entry.get_packed_path("shift-jis") for entry in entries]
+        paths_size = sum(map(len, packed_entry_paths))
+        entries_data = self._get_entries_data_for_pack(entries)
 
         # Compute table offsets.
         entry_header_table_offset = self.header_struct.size
         entry_path_table_offset = entry_header_table_offset + self.entry_header_struct.size * len(self._entries)
-        entry_packed_data_offset = entry_path_table_offset + len(packed_entry_paths)
-        bnd_file_size = entry_packed_data_offset + len(packed_entry_data)
+        entry_packed_data_offset = entry_path_table_offset + paths_size
+        bnd_file_size = entry_packed_data_offset + sum(len(entry_data) for entry_data, _ in entries_data)
 
         # Pack BND header.
         packed_header = self.header_struct.pack(
@@ -463,14 +635,29 @@ class BND3(BaseBND):
             file_size=bnd_file_size,
         )
 
-        # Convert relative offsets to absolute and pack entry headers.
-        for entry_header_dict in entry_header_dicts:
-            entry_header_dict["data_offset"] += entry_packed_data_offset
-            if has_path(self.magic):
-                entry_header_dict["path_offset"] += entry_path_table_offset
-            packed_entry_headers += self.entry_header_struct.pack(entry_header_dict)
+        # Pack entry headers with absolute offsets.
+        pack_entry_header = self.entry_header_struct.compile_packer()
+        packed_entry_headers = []  # type: list[bytes]
+        path_offset = entry_path_table_offset
+        data_offset = entry_packed_data_offset
+        for i, (entry, (entry_data, is_compressed)) in enumerate(zip(entries, entries_data)):
+            entry_header_dict = {
+                "entry_magic": entry.magic,
+                "compressed_data_size": len(entry_data) if is_compressed else entry.data_size,
+                "data_offset": data_offset,
+            }
+            if entry_has_id:
+                entry_header_dict["entry_id"] = entry.id
+            if entry_has_path:
+                entry_header_dict["path_offset"] = path_offset
+                path_offset += len(packed_entry_paths[i])
+            if entry_has_uncompressed_size:
+                entry_header_dict["uncompressed_data_size"] = entry.data_size
+            packed_entry_headers.append(pack_entry_header(entry_header_dict))
+            packed_entry_data.append(entry_data)
+            data_offset += len(entry_data)
 
-        return packed_header + packed_entry_headers + packed_entry_paths + packed_entry_data
+        return b"".join([packed_header, *packed_entry_headers, *packed_entry_paths, *packed_entry_data])
 
     def get_json_header(self):
         return {
@@ -537,14 +724,13 @@ class BND4(BaseBND):
         super().__init__(bnd_source=bnd_source, dcx_magic=dcx_magic)
 
     def unpack(self, bnd_buffer, **kwargs):
-        self.header_struct = BinaryStruct(*self.HEADER_STRUCT_START, byte_order="<")
-        header = self.header_struct.unpack(bnd_buffer)
+        header = _get_binary_struct(("<", self.HEADER_STRUCT_START)).unpack(bnd_buffer)
         self._check_version(header["version"].decode())
         self.flag1 = header["flag1"]
         self.flag2 = header["flag2"]
         self.big_endian = header["big_endian"] == 0x00000100  # Magic not used to infer endianness here.
         byte_order = ">" if self.big_endian else "<"
-        header.update(self.header_struct.unpack(bnd_buffer, *self.HEADER_STRUCT_ENDIAN, byte_order=byte_order))
+        header.update(_get_binary_struct((byte_order, self.HEADER_STRUCT_ENDIAN)).unpack(bnd_buffer))
         self.signature = header["signature"].rstrip(b"\0").decode()
         self.magic = header["magic"]
         self.utf16_paths = header["utf16_paths"]
@@ -562,17 +748,7 @@ class BND4(BaseBND):
                 f"Found non-zero hash table offset {self.hash_table_offset}, but header says this BND has no hash "
                 f"table."
             )
-        self.entry_header_struct = BinaryStruct(*self.BND_ENTRY_HEADER, byte_order=byte_order)
-        if has_uncompressed_size(self.magic):
-            self.entry_header_struct.add_fields(self.UNCOMPRESSED_DATA_SIZE, byte_order=byte_order)
-        self.entry_header_struct.add_fields(self.DATA_OFFSET, byte_order=byte_order)
-        if has_id(self.magic):
-            self.entry_header_struct.add_fields(self.ENTRY_ID, byte_order=byte_order)
-        if has_path(self.magic):
-            self.entry_header_struct.add_fields(self.NAME_OFFSET, byte_order=byte_order)
-        if self.magic == 0x20:
-            # Extra pad.
-            self.entry_header_struct.add_fields("8x")
+        self.header_struct, self.entry_header_struct = self._get_header_structs()
         if header["entry_header_size"] != self.entry_header_struct.size:
             _LOGGER.warning(
                 f"Entry header size given in BND header ({header['entry_header_size']}) does not match actual entry "
@@ -595,69 +771,48 @@ class BND4(BaseBND):
         self._most_recent_entry_count = len(self._entries)
         self._most_recent_paths = [entry.path for entry in self._entries]
 
-        self.header_struct = BinaryStruct(*self.HEADER_STRUCT_START, byte_order="<")
+        self.header_struct, self.entry_header_struct = self._get_header_structs()
+
+    def _get_header_structs(self) -> tuple[BinaryStruct, BinaryStruct]:
+        """Get (shared) BND header and entry header structs for current endianness and magic."""
         byte_order = ">" if self.big_endian else "<"
-        self.header_struct.add_fields(*self.HEADER_STRUCT_ENDIAN, byte_order=byte_order)
-        self.entry_header_struct = BinaryStruct(*self.BND_ENTRY_HEADER, byte_order=byte_order)
+        header_struct = _get_binary_struct(("<", self.HEADER_STRUCT_START), (byte_order, self.HEADER_STRUCT_ENDIAN))
+        entry_fields = self.BND_ENTRY_HEADER
         if has_uncompressed_size(self.magic):
-            self.entry_header_struct.add_fields(self.UNCOMPRESSED_DATA_SIZE, byte_order=byte_order)
-        self.entry_header_struct.add_fields(self.DATA_OFFSET, byte_order=byte_order)
+            entry_fields += (self.UNCOMPRESSED_DATA_SIZE,)
+        entry_fields += (self.DATA_OFFSET,)
         if has_id(self.magic):
-            self.entry_header_struct.add_fields(self.ENTRY_ID, byte_order=byte_order)
+            entry_fields += (self.ENTRY_ID,)
         if has_path(self.magic):
-            self.entry_header_struct.add_fields(self.NAME_OFFSET, byte_order=byte_order)
+            entry_fields += (self.NAME_OFFSET,)
         if self.magic == 0x20:
-            # Extra pad.
-            self.entry_header_struct.add_fields("8x")
+            entry_fields += ("8x",)  # extra pad
+        return header_struct, _get_binary_struct((byte_order, entry_fields))
 
     def pack(self):
-        entry_header_dicts = []
-        packed_entry_headers = b""
-        packed_entry_paths = b""
-        relative_entry_path_offsets = []
-        packed_entry_data = b""
-        relative_entry_data_offsets = []
-        rebuild_hash_table = not self._most_recent_hash_table
+        entry_has_id = has_id(self.magic)
+        entry_has_path = has_path(self.magic)
+        entry_has_uncompressed_size = has_uncompressed_size(self.magic)
+        packed_entry_paths = []  # type: list[bytes]
+        packed_entry_data = []  # type: list[bytes]
         path_encoding = ("utf-16be" if self.big_endian else "utf-16le") if self.utf16_paths else "shift-jis"
 
-        if len(self._entries) != self._most_recent_entry_count:
-            rebuild_hash_table = True
-        for i, entry in enumerate(self._entries):
-            if not rebuild_hash_table and entry.path != self._most_recent_paths[i]:
-                rebuild_hash_table = True
-
-        self._most_recent_entry_count = len(self._entries)
-        self._most_recent_paths = [entry.path for entry in self._entries]
+        # Hash table only needs rebuilding if entry paths (or their count or order) have changed since the last pack.
+        entry_paths = [entry.path for entry in self._entries]
+        rebuild_hash_table = not self._most_recent_hash_table or entry_paths != self._most_recent_paths
+        self._most_recent_entry_count = len(entry_paths)
+        self._most_recent_paths = entry_paths
 
-        for entry in self._entries:
-
-            packed_entry_data += b"\0" * 10  # Each entry is separated by ten pad bytes. (Probably not necessary.)
-
-            entry_header_dict = {
-                "entry_magic": entry.magic,
-                "compressed_data_size": entry.data_size,
-                "data_offset": len(packed_entry_data),
-            }
-            if has_id(self.magic):
-                entry_header_dict["entry_id"] = entry.id
-            if has_path(self.magic):
-                entry_header_dict["path_offset"] = len(packed_entry_paths)
-                relative_entry_path_offsets.append(len(packed_entry_paths))  # Relative to start of packed entry paths.
-                packed_entry_paths += entry.get_packed_path(path_encoding)
-            if has_uncompressed_size(self.magic):
-                entry_header_dict["uncompressed_data_size"] = entry.data_size
-
-            relative_entry_data_offsets.append(len(packed_entry_data))
-            entry_data, is_compressed = entry.get_data_for_pack()
-            if is_compressed:
-                entry_header_dict["compressed_data_size"] = len(entry_data)
-            packed_entry_data += entry_data
-            entry_header_dicts.append(entry_header_dict)
+        # Entry paths are packed first, so all table offsets are known before entry headers are packed.
+        if entry_has_path:
+            packed_entry_paths = [entry.get_packed_path(path_encoding) for entry in self._entries]
+        paths_size = sum(map(len, packed_entry_paths))
+        entries_data = self._get_entries_data_for_pack(self._entries)
 
         entry_header_table_offset = self.header_struct.size
         entry_path_table_offset = entry_header_table_offset + self.entry_header_struct.size * len(self._entries)
         if self.hash_table_type == 4:
-            hash_table_offset = entry_path_table_offset + len(packed_entry_paths)
+            hash_table_offset = entry_path_table_offset + paths_size
             if rebuild_hash_table:
                 packed_hash_table = self.build_hash_table()
             else:
@@ -666,7 +821,7 @@ class BND4(BaseBND):
         else:
             hash_table_offset = 0
             packed_hash_table = b""
-            entry_packed_data_offset = entry_path_table_offset + len(packed_entry_paths)
+            entry_packed_data_offset = entry_path_table_offset + paths_size
         # BND file size not needed.
 
         packed_header = self.header_struct.pack(
@@ -683,14 +838,36 @@ class BND4(BaseBND):
             hash_table_offset=hash_table_offset,
         )
 
-        # Convert relative offsets to absolute and pack entry headers.
-        for entry_header_dict in entry_header_dicts:
-            entry_header_dict["data_offset"] += entry_packed_data_offset
-            if has_path(self.magic):
-                entry_header_dict["path_offset"] += entry_path_table_offset
-            packed_entry_headers += self.entry_header_struct.pack(entry_header_dict)
+        # Pack entry headers with absolute offsets.
+        pack_entry_header = self.entry_header_struct.compile_packer()
+        packed_entry_headers = []  # type: list[bytes]
+        path_offset = entry_path_table_offset
+        data_offset = entry_packed_data_offset
+        for i, (entry, (entry_data, is_compressed)) in enumerate(zip(self._entries, entries_data)):
 
-        return packed_header + packed_entry_headers + packed_entry_paths + packed_hash_table + packed_entry_data
+            # Each entry is separated by ten pad bytes. (Probably not necessary.)
+            packed_entry_data.append(b"\0" * 10)
+            data_offset += 10
+
+            entry_header_dict = {
+                "entry_magic": entry.magic,
+                "compressed_data_size": len(entry_data) if is_compressed else entry.data_size,
+                "data_offset": data_offset,
+            }
+            if entry_has_id:
+                entry_header_dict["entry_id"] = entry.id
+            if entry_has_path:
+                entry_header_dict["path_offset"] = path_offset
+                path_offset += len(packed_entry_paths[i])
+            if entry_has_uncompressed_size:
+                entry_header_dict["uncompressed_data_size"] = entry.data_size
+            packed_entry_headers.append(pack_entry_header(entry_header_dict))
+            packed_entry_data.append(entry_data)
+            data_offset += len(entry_data)
+
+        return b"".join(
+            [packed_header, *packed_entry_headers, *packed_entry_paths, packed_hash_table, *packed_entry_data]
+        )
 
     def get_json_header(self):
         return {
@@ -714,55 +891,65 @@ class BND4(BaseBND):
             return True
         if (p % 2) == 0:
             return False
-        for i in range(3, p // 2, 2):
+        for i in range(3, isqrt(p) + 1, 2):
             if (p % i) == 0:
                 return False
-            if i ** 2 > p:
-                return True
         return True
 
+    @staticmethod
+    def get_hash_group_count(entry_count: int) -> int:
+        """Hash group count is the first prime number greater than or equal to the number of entries divided by 7.
+
+        Looked up in a precomputed prime table, which covers BNDs of up to ~70000 entries. Larger BNDs sieve over
+        `[0, 2 * start]`, which always contains such a prime (Bertrand).
+        """
+        start = entry_count // 7
+        primes = _HASH_GROUP_PRIMES if start <= _HASH_GROUP_PRIMES[-1] else _get_primes_below(2 * start + 3)
+        return primes[bisect_left(primes, start)]
+
     def build_hash_table(self):
         """ Some BND4 resources include tables of hashed entry paths, which aren't needed to read file contents, but
         need to be re-hashed to properly pack the file in case any paths have changed (or the number of entries). """
 
-        # Group count set to first prime number greater than or equal to the number of entries divided by 7.
-        for p in range(len(self._entries) // 7, 100000):
-            if self.is_prime(p):
-                group_count = p
-                break
-        else:
-            raise ValueError("Hash group count could not be determined.")
-
-        hashes = []
-        hash_lists = [[] for _ in range(group_count)]  # type: list[list[tuple[int, int]], ...]
-
-        for entry_index, entry in enumerate(self._entries):
-            hashes.append(self.path_hash(entry.path))
-            list_index = hashes[-1] % group_count
-            hash_lists[list_index].append((hashes[-1], entry_index))
-
-        for hash_list in hash_lists:
-            hash_list.sort()  # Sort by hash value.
+        group_count = self.get_hash_group_count(len(self._entries))
 
-        hash_groups = []
-        path_hashes = []
-
-        total_hash_count = 0
-        for hash_list in hash_lists:
-            first_hash_index = total_hash_count
-            for path_hash in hash_list:
-                path_hashes.append({"hashed_value": path_hash[0], "entry_index": path_hash[1]})
-                total_hash_count += 1
-            hash_groups.append({"index": first_hash_index, "length": total_hash_count - first_hash_index})
-
-        packed_hash_groups = self.HASH_GROUP_STRUCT.pack_multiple(hash_groups)
+        # Order all path hashes by group, then by hash value (and entry index), with a single sort. Each group is then a
+        # contiguous run whose position is given by a running count of group lengths.
+        sorted_hashes = sorted(
+            (path_hash % group_count, path_hash, entry_index)
+            for entry_index, path_hash in enumerate(self._get_entry_path_hash(entry) for entry in self._entries)
+        )
+        group_lengths = [0] * group_count
+        for group_index, _, _ in sorted_hashes:
+            group_lengths[group_index] += 1
+
+        # Both tables are packed from flat value sequences with one `struct.pack` call each, in the field order (and byte
+        # order) of `HASH_GROUP_STRUCT` (length, index) and `PATH_HASH_STRUCT` (hashed_value, entry_index).
+        hash_group_values = []
+        first_hash_index = 0
+        for group_length in group_lengths:
+            hash_group_values += (group_length, first_hash_index)
+            first_hash_index += group_length
+        group_fmt = self.HASH_GROUP_STRUCT.struct_format[0]
+        packed_hash_groups = struct.pack(group_fmt[0] + group_fmt[1:] * group_count, *hash_group_values)
         packed_hash_table_header = self.HASH_TABLE_HEADER.pack(
             path_hashes_offset=self.HASH_TABLE_HEADER.size + len(packed_hash_groups), hash_group_count=group_count,
         )
-        packed_path_hashes = self.PATH_HASH_STRUCT.pack_multiple(path_hashes)
+        path_hash_fmt = self.PATH_HASH_STRUCT.struct_format[0]
+        packed_path_hashes = struct.pack(
+            path_hash_fmt[0] + path_hash_fmt[1:] * len(sorted_hashes),
+            *chain.from_iterable((path_hash, entry_index) for _, path_hash, entry_index in sorted_hashes),
+        )
 
         return packed_hash_table_header + packed_hash_groups + packed_path_hashes
 
+    @classmethod
+    def _get_entry_path_hash(cls, entry: BNDEntry) -> int:
+        """Hash of `entry.path`, stored on the entry until its path is changed."""
+        if entry._path_hash is None:
+            entry._path_hash = cls.path_hash(entry.path)
+        return entry._path_hash
+
     @staticmethod
     def path_hash(path_string):
         """ Simple string-hashing algorithm used by FROM. Strings use forward-slash path separators and always start
@@ -770,10 +957,46 @@ class BND4(BaseBND):
         hashable = path_string.replace("\\", "/")
         if not hashable.startswith("/"):
             hashable = "/" + hashable
-        h = 0
-        for i, s in enumerate(hashable):
-            h += i * 37 + ord(s)
-        return h
+        # Closed form of `sum(i * 37 + ord(c) for i, c in enumerate(hashable))`.
+        n = len(hashable)
+        return 37 * (n * (n - 1) // 2) + sum(map(ord, hashable))
+
+
+_BND_VERSION_CLASSES = {"BND3": BND3, "BND4": BND4}
+
+
+def _detect_bnd_version(bnd_source) -> tp.Optional[str]:
+    """Returns BND version string ("BND3" or "BND4") of `bnd_source`, read from its first four bytes or unpacked
+    manifest, or None if it cannot be read. Does not support DCX sources."""
+    if isinstance(bnd_source, (str, Path)):
+        bnd_path = Path(bnd_source)
+        if bnd_path.is_file() and bnd_path.name == "bnd_manifest.json":
+            bnd_path = bnd_path.parent
+        if bnd_path.is_dir():
+            try:
+                with (bnd_path / "bnd_manifest.json").open("rb") as f:
+                    return json.load(f)["version"]
+            except FileNotFoundError:
+                return None
+        elif bnd_path.is_file():
+            with bnd_path.open("rb") as buffer:
+                try:
+                    return read_chars_from_buffer(buffer, length=4, encoding="utf-8")
+                except ValueError:
+                    return None
+        return None
+    elif isinstance(bnd_source, bytes):
+        bnd_source = io.BytesIO(bnd_source)
+    if isinstance(bnd_source, io.BufferedIOBase):
+        old_offset = bnd_source.tell()
+        bnd_source.seek(0)
+        try:
+            return read_chars_from_buffer(bnd_source, length=4, encoding="utf-8")
+        except ValueError:
+            return None
+        finally:
+            bnd_source.seek(old_offset)
+    return None
 
 
 def BND(bnd_source=None, dcx_magic=()) -> BaseBND:
@@ -797,8 +1020,7 @@ def BND(bnd_source=None, dcx_magic=()) -> BaseBND:
                 detect_source = DCX(bnd_path).data
             else:
                 detect_source = bnd_path
-    if BND3.detect(detect_source):
-        return BND3(bnd_source, dcx_magic=dcx_magic)
-    elif BND4.detect(detect_source):
-        return BND4(bnd_source, dcx_magic=dcx_magic)
+    bnd_class = _BND_VERSION_CLASSES.get(_detect_bnd_version(detect_source))
+    if bnd_class is not None:
+        return bnd_class(bnd_source, dcx_magic=dcx_magic)
     raise TypeError("Data bytes could not be interpreted as `BND3` or `BND4` instance.")
@@ -8,13 +8,17 @@ from . import enums
 
 class InstructionDecompiler(_BaseDecompiler):
 
+    __slots__ = ()
     ENUMS = enums
     GET_MAP = staticmethod(get_map)
 
     @parse_parameters
     def _2003_41(self, area_id, block_id, y_threshold, target_model_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
-        return f"ActivateKillplaneForModel({game_map=}, {y_threshold=}, {target_model_id=})"
+        return (
+            f"ActivateKillplaneForModel(game_map={game_map}, y_threshold={y_threshold}, "
+            f"target_model_id={target_model_id})"
+        )
 
     @parse_parameters("AddSpecialEffect", no_name_count=2)
     def _2004_08(self, character: EntityEnum, special_effect_id):
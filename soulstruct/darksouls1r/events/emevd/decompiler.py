@@ -10,6 +10,7 @@ from . import enums
 class InstructionDecompiler(_BaseDecompiler):
     """Subclass of DS1PTDE decompiler."""
 
+    __slots__ = ()
     ENUMS = enums
     GET_MAP = staticmethod(get_map)
 
@@ -41,16 +42,16 @@ class InstructionDecompiler(_BaseDecompiler):
     def _2002_06(self, cutscene_id, cutscene_type: CutsceneType, first_region, last_region, area_id, block_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndRandomlyWarpPlayer_WithUnknownEffect1({cutscene_id}, {cutscene_type}, {first_region=}, "
-            f"{last_region=}, {game_map=})"
+            f"PlayCutsceneAndRandomlyWarpPlayer_WithUnknownEffect1({cutscene_id}, {cutscene_type}, "
+            f"first_region={first_region}, last_region={last_region}, game_map={game_map})"
         )
 
     @parse_parameters
     def _2002_07(self, cutscene_id, cutscene_type: CutsceneType, first_region, last_region, area_id, block_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndRandomlyWarpPlayer_WithUnknownEffect2({cutscene_id}, {cutscene_type}, {first_region=}, "
-            f"{last_region=}, {game_map=})"
+            f"PlayCutsceneAndRandomlyWarpPlayer_WithUnknownEffect2({cutscene_id}, {cutscene_type}, "
+            f"first_region={first_region}, last_region={last_region}, game_map={game_map})"
         )
 
     @parse_parameters("CopyEventValue")
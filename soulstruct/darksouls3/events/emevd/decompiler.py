@@ -3,7 +3,9 @@ __all__ = ["InstructionDecompiler"]
 import struct
 import logging
 
-from soulstruct.base.events.emevd.decompiler import InstructionDecompiler as _BaseDecompiler, parse_parameters
+from soulstruct.base.events.emevd.decompiler import (
+    InstructionDecompiler as _BaseDecompiler, parse_parameters, _get_enum_value
+)
 from soulstruct.darksouls3.maps.constants import get_map
 from .enums import *
 from . import enums
@@ -12,21 +14,22 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class InstructionDecompiler(_BaseDecompiler):
-    RUN_EVENT_INSTRUCTIONS = _BaseDecompiler.RUN_EVENT_INSTRUCTIONS + [(2000, 6)]
+    RUN_EVENT_INSTRUCTIONS = _BaseDecompiler.RUN_EVENT_INSTRUCTIONS | {(2000, 6)}
 
+    __slots__ = ()
     ENUMS = enums
     GET_MAP = staticmethod(get_map)
 
     def _add_min_target_count(self, string, min_target_count):
         if min_target_count == 1:
             return string
-        return string[:-1] + f", {min_target_count=})"
+        return string[:-1] + f", min_target_count={min_target_count})"
 
     def _add_target_args(self, string, target_comparison_type, target_count):
         if target_comparison_type == 0 and target_count == 1:
             return string
-        target_comparison_type = f"ComparisonType.{ComparisonType(target_comparison_type).name}"
-        return string[:-1] + f", {target_comparison_type=}, {target_count=})"
+        target_comparison_type = _get_enum_value(ComparisonType, target_comparison_type)  # `ComparisonType.{name}`
+        return string[:-1] + f", target_comparison_type={target_comparison_type}, target_count={target_count})"
 
     def _2000_06(self, req_args, opt_args, arg_types):
         event_id, first_arg = req_args
@@ -34,7 +37,7 @@ class InstructionDecompiler(_BaseDecompiler):
             req_args = (first_arg, *opt_args)
             if not arg_types.replace("i", ""):
                 # All signed integers (default).
-                return f"RunCommonEvent({event_id}, args={req_args})"
+                return f"RunCommonEvent({event_id}, args={self._format_args(req_args)})"
             elif all(isinstance(i, int) for i in req_args):
                 try:
                     req_args = self._process_args(req_args, arg_types)
@@ -44,12 +47,12 @@ class InstructionDecompiler(_BaseDecompiler):
                         f"args = {req_args}, arg_types = {arg_types}"
                     )
                     raise
-            return f"RunCommonEvent({event_id}, args={req_args}, arg_types=\"{arg_types}\")"
+            return f"RunCommonEvent({event_id}, args={self._format_args(req_args)}, arg_types=\"{arg_types}\")"
         elif not opt_args and first_arg == 0:
             return f"RunCommonEvent({event_id})"
         else:
             # Assume all integers.
-            return f"RunCommonEvent({event_id}, args={(first_arg, *opt_args)})"
+            return f"RunCommonEvent({event_id}, args={self._format_args((first_arg, *opt_args))})"
 
     def _3_02(self, condition, state, character, region, min_target_count=-1):
         return self._add_min_target_count(
@@ -65,10 +68,13 @@ class InstructionDecompiler(_BaseDecompiler):
 
     @parse_parameters
     def _3_23(self, condition, attacked_entity: EntityEnum, attacker: EntityEnum, damage_type: DamageType):
-        if not self._any_vars(damage_type) and damage_type.name == "Unspecified":
+        if damage_type is self._UNSPECIFIED_DAMAGE:
             # Leave out default `damage_type` value.
-            return f"IfAttackedWithDamageType({condition}, {attacked_entity=}, {attacker=})"
-        return f"IfAttackedWithDamageType({condition}, {attacked_entity=}, {attacker=}, {damage_type=})"
+            return f"IfAttackedWithDamageType({condition}, attacked_entity={attacked_entity}, attacker={attacker})"
+        return (
+            f"IfAttackedWithDamageType({condition}, attacked_entity={attacked_entity}, attacker={attacker}, "
+            f"damage_type={damage_type})"
+        )
 
     @parse_parameters("IfActionButtonParam", no_name_count=1)
     def _3_24(self, condition, action_button_id, entity: EntityEnum):
@@ -80,16 +86,16 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"IfPlayerNotInOwnWorld({condition})"
         if not_in_own_world is False:
             return f"IfPlayerInOwnWorld({condition})"
-        return f"IfPlayerOwnWorldState({condition}, {not_in_own_world=}"
+        return f"IfPlayerOwnWorldState({condition}, not_in_own_world={not_in_own_world}"
 
     @parse_parameters
     def _3_28(self, condition, state: bool, area_id, block_id, ceremony_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
         if state is True:
-            return f"IfMapInCeremony({condition}, {game_map=}, {ceremony_id=})"
+            return f"IfMapInCeremony({condition}, game_map={game_map}, ceremony_id={ceremony_id})"
         if state is False:
-            return f"IfMapNotInCeremony({condition}, {game_map=}, {ceremony_id=})"
-        return f"IfMapCeremonyState({condition}, {state=}, {game_map=}, {ceremony_id=})"
+            return f"IfMapNotInCeremony({condition}, game_map={game_map}, ceremony_id={ceremony_id})"
+        return f"IfMapCeremonyState({condition}, state={state}, game_map={game_map}, ceremony_id={ceremony_id})"
 
     @parse_parameters("IfMultiplayerNetworkPenalized", no_name_count=1)
     def _3_29(self, condition):
@@ -201,7 +207,7 @@ class InstructionDecompiler(_BaseDecompiler):
         elif state is False:
             string = f"IfCharacterDrawGroupInactive({condition}, {character})"
         else:
-            string = f"IfCharacterDrawGroupState({condition}, {character=}, {state=})"
+            string = f"IfCharacterDrawGroupState({condition}, character={character}, state={state})"
         return self._add_target_args(string, target_comparison_type, target_count)
 
     @parse_parameters("IfPlayerRemainingYoelLevelComparison", no_name_count=1)
@@ -218,7 +224,7 @@ class InstructionDecompiler(_BaseDecompiler):
         target_count=1,
     ):
         return self._add_target_args(
-            f"IfCharacterInvadeType({condition}, {character=}, {invade_type=})",
+            f"IfCharacterInvadeType({condition}, character={character}, invade_type={invade_type})",
             target_comparison_type,
             target_count,
         )
@@ -245,7 +251,7 @@ class InstructionDecompiler(_BaseDecompiler):
         target_count=1,
     ):
         return self._add_target_args(
-            f"IfObjectBurnState({condition}, {obj=}, {comparison_type=}, {state=})",
+            f"IfObjectBurnState({condition}, obj={obj}, comparison_type={comparison_type}, state={state})",
             target_comparison_type,
             target_count,
         )
@@ -253,28 +259,28 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _5_10(self, condition, obj, state: bool, target_comparison_type: ComparisonType = 0, target_count=1):
         if state is True:
-            string = f"IfObjectBackreadEnabled({condition}, {obj=})"
+            string = f"IfObjectBackreadEnabled({condition}, obj={obj})"
         elif state is False:
-            string = f"IfObjectBackreadDisabled({condition}, {obj=})"
+            string = f"IfObjectBackreadDisabled({condition}, obj={obj})"
         else:
-            string = f"IfObjectBackreadState({condition}, {obj=}, {state=})"
+            string = f"IfObjectBackreadState({condition}, obj={obj}, state={state})"
         return self._add_target_args(string, target_comparison_type, target_count)
 
     @parse_parameters
     def _5_11(self, condition, obj, state: bool, target_comparison_type: ComparisonType = 0, target_count=1):
         if state is True:
-            string = f"IfObjectBackreadEnabled_Alternate({condition}, {obj=})"
+            string = f"IfObjectBackreadEnabled_Alternate({condition}, obj={obj})"
         elif state is False:
-            string = f"IfObjectBackreadDisabled_Alternate({condition}, {obj=})"
+            string = f"IfObjectBackreadDisabled_Alternate({condition}, obj={obj})"
         else:
-            string = f"IfObjectBackreadState_Alternate({condition}, {obj=}, {state=})"
+            string = f"IfObjectBackreadState_Alternate({condition}, obj={obj}, state={state})"
         return self._add_target_args(string, target_comparison_type, target_count)
 
     @parse_parameters
     def _1000_101(self, label: Label, state: bool, input_condition):
         if not self._any_vars(state):
-            return f"GotoIfCondition{state}({label}, {input_condition=})"
-        return f"GotoIfConditionState({label}, {state=}, {input_condition=})"
+            return f"GotoIfCondition{state}({label}, input_condition={input_condition})"
+        return f"GotoIfConditionState({label}, state={state}, input_condition={input_condition})"
 
     @parse_parameters("Goto", no_name_count=1)
     def _1000_103(self, label: Label):
@@ -287,8 +293,8 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _1000_107(self, label: Label, state: bool, input_condition):
         if not self._any_vars(state):
-            return f"GotoIfFinishedCondition{state}({label}, {input_condition=})"
-        return f"GotoIfFinishedConditionState({label}, {state=}, {input_condition=})"
+            return f"GotoIfFinishedCondition{state}({label}, input_condition={input_condition})"
+        return f"GotoIfFinishedConditionState({label}, state={state}, input_condition={input_condition})"
 
     @parse_parameters("WaitHollowArenaHalftime")
     def _1001_04(self, match_type, is_second_half: bool):
@@ -315,11 +321,17 @@ class InstructionDecompiler(_BaseDecompiler):
         target_count=-1,
     ):
         if state is True:
-            string = f"GotoIfCharacterHasSpecialEffect({label}, {character=}, {special_effect=})"
+            string = f"GotoIfCharacterHasSpecialEffect({label}, character={character}, special_effect={special_effect})"
         elif state is False:
-            string = f"GotoIfCharacterDoesNotHaveSpecialEffect({label}, {character=}, {special_effect=})"
+            string = (
+                f"GotoIfCharacterDoesNotHaveSpecialEffect({label}, character={character}, "
+                f"special_effect={special_effect})"
+            )
         else:
-            string = f"GotoIfCharacterSpecialEffectState({label}, {character=}, {special_effect=}, {state=})"
+            string = (
+                f"GotoIfCharacterSpecialEffectState({label}, character={character}, special_effect={special_effect}, "
+                f"state={state})"
+            )
         return self._add_target_args(string, target_comparison_type, target_count)
 
     @parse_parameters
@@ -328,14 +340,17 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"GotoIfPlayerNotInOwnWorld({label})"
         elif not_in_own_world is False:
             return f"GotoIfPlayerInOwnWorld({label})"
-        return f"GotoIfPlayerOwnWorldState({label}, {not_in_own_world=})"
+        return f"GotoIfPlayerOwnWorldState({label}, not_in_own_world={not_in_own_world})"
 
     @parse_parameters
     def _1003_13(self, event_return_type: EventReturnType, not_in_own_world: bool):
         if self._any_vars(event_return_type):
-            return f"ReturnIfPlayerOwnWorldState({event_return_type=}, {not_in_own_world=})"
+            return (
+                f"ReturnIfPlayerOwnWorldState(event_return_type={event_return_type}, "
+                f"not_in_own_world={not_in_own_world})"
+            )
         if self._any_vars(not_in_own_world):
-            return f"{event_return_type.name}IfPlayerOwnWorldState({not_in_own_world=})"
+            return f"{event_return_type.name}IfPlayerOwnWorldState(not_in_own_world={not_in_own_world})"
         state = "Not" if not_in_own_world else ""
         return f"{event_return_type.name}IfPlayer{state}InOwnWorld()"
 
@@ -362,30 +377,26 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _1003_101(self, label: Label, state: FlagState, flag_type: FlagType, flag):
         if self._any_vars(state, flag_type):
-            return f"GotoIfFlagState({label}, {state=}, {flag_type=}, {flag=})"
-        if state != FlagState.Change:
-            if flag_type == FlagType.Absolute:
-                return f"GotoIfFlag{state.name}({label}, {flag})"
-            elif flag == 0:
-                if flag_type == FlagType.RelativeToThisEvent:
-                    return f"GotoIfThisEvent{state.name}({label})"
-                elif flag_type == FlagType.RelativeToThisEventSlot:
-                    return f"GotoIfThisEventSlot{state.name}({label})"
-        return f"GotoIfFlagState({label}, {state=}, {flag_type=}, {flag=})" + self.SUSPICIOUS
+            return f"GotoIfFlagState({label}, state={state}, flag_type={flag_type}, flag={flag})"
+        if state is not self._CHANGE and (flag_test := self._get_flag_test(state, flag_type, flag, label)):
+            return f"GotoIf{flag_test}"
+        return f"GotoIfFlagState({label}, state={state}, flag_type={flag_type}, flag={flag})" + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_103(self, label: Label, state: RangeState, flag_type: FlagType, first_flag, last_flag):
         flag_range = f"({first_flag}, {last_flag})"
         if self._any_vars(state, flag_type):
-            return f"GotoIfFlagRangeState({label}, {state=}, {flag_type=}, {flag_range=})"
-        if flag_type == FlagType.Absolute:
+            return f"GotoIfFlagRangeState({label}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        if flag_type is self._ABSOLUTE:
             return f"GotoIfFlagRange{state.name}({label}, {flag_range})"
-        return f"GotoIfFlagRangeState({label}, {state=}, {flag_type=}, {flag_range=})" + self.SUSPICIOUS
+        return (
+            f"GotoIfFlagRangeState({label}, state={state}, flag_type={flag_type}, flag_range={flag_range})"
+        ) + self.SUSPICIOUS
 
     @parse_parameters
     def _1003_105(self, label: Label, state: MultiplayerState):
         if self._any_vars(state):
-            return f"GotoIfMultiplayerState({label}, {state=})"
+            return f"GotoIfMultiplayerState({label}, state={state})"
         return f"GotoIf{state.name}({label})"
 
     @parse_parameters
@@ -395,7 +406,7 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"GotoIfInsideMap({label}, {game_map})"
         if state is False:
             return f"GotoIfOutsideMap({label}, {game_map})"
-        return f"GotoIfMapPresenceState({label}, {game_map}, {state=})"
+        return f"GotoIfMapPresenceState({label}, {game_map}, state={state})"
 
     @parse_parameters("GotoIfCoopClientCountComparison", no_name_count=3)
     def _1003_109(self, label: Label, comparison_type: ComparisonType, value):
@@ -413,10 +424,14 @@ class InstructionDecompiler(_BaseDecompiler):
     ):
         if self._any_vars(event_return_type):
             string = (
-                f"ReturnIfCharacterSpecialEffectState({event_return_type=}, {character=}, {special_effect=}, {state=})"
+                f"ReturnIfCharacterSpecialEffectState(event_return_type={event_return_type}, character={character}, "
+                f"special_effect={special_effect}, state={state})"
             )
         elif self._any_vars(state):
-            string = f"{event_return_type.name}IfCharacterSpecialEffectState({character}, {special_effect=}, {state=})"
+            string = (
+                f"{event_return_type.name}IfCharacterSpecialEffectState({character}, special_effect={special_effect}, "
+                f"state={state})"
+            )
         else:
             state_name = "Has" if state else "DoesNotHave"
             string = f"{event_return_type.name}IfCharacter{state_name}SpecialEffect({character}, {special_effect})"
@@ -433,20 +448,26 @@ class InstructionDecompiler(_BaseDecompiler):
         target_count=1,
     ):
         if self._any_vars(state):
-            string = f"SkipLinesIfCharacterSpecialEffectState({line_count}, {character=}, {special_effect=}, {state=})"
+            string = (
+                f"SkipLinesIfCharacterSpecialEffectState({line_count}, character={character}, "
+                f"special_effect={special_effect}, state={state})"
+            )
         else:
             state_name = "Has" if state else "DoesNotHave"
-            string = f"SkipLinesIfCharacter{state_name}SpecialEffect({line_count}, {character}, {special_effect=})"
+            string = (
+                f"SkipLinesIfCharacter{state_name}SpecialEffect({line_count}, {character}, "
+                f"special_effect={special_effect})"
+            )
         return self._add_target_args(string, target_comparison_type, target_count)
 
     @parse_parameters
     def _1003_200(self, label: Label, state: bool, character: EntityEnum, region, min_target_count=-1):
         if state is True:
-            string = f"GotoIfCharacterInsideRegion({label}, {character=}, {region=})"
+            string = f"GotoIfCharacterInsideRegion({label}, character={character}, region={region})"
         elif state == 0:
-            string = f"GotoIfCharacterOutsideRegion({label}, {character=}, {region=})"
+            string = f"GotoIfCharacterOutsideRegion({label}, character={character}, region={region})"
         else:
-            string = f"GotoIfCharacterRegionState({label}, {state=}, {character=}, {region=})"
+            string = f"GotoIfCharacterRegionState({label}, state={state}, character={character}, region={region})"
         return self._add_min_target_count(string, min_target_count)
 
     @parse_parameters
@@ -459,9 +480,12 @@ class InstructionDecompiler(_BaseDecompiler):
         min_target_count=-1,
     ):
         if self._any_vars(event_return_type):
-            string = f"ReturnIfCharacterRegionState({event_return_type=}, {state=}, {character=}, {region=})"
+            string = (
+                f"ReturnIfCharacterRegionState(event_return_type={event_return_type}, state={state}, "
+                f"character={character}, region={region})"
+            )
         elif self._any_vars(state):
-            string = f"{event_return_type.name}IfCharacterRegionState({state=}, {character}, {region=})"
+            string = f"{event_return_type.name}IfCharacterRegionState(state={state}, {character}, region={region})"
         else:
             state_name = "Inside" if state else "Outside"
             string = f"{event_return_type.name}IfCharacter{state_name}Region({character}, {region})"
@@ -470,11 +494,13 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _1003_202(self, line_count, state: bool, character: EntityEnum, region, min_target_count=-1):
         if state is True:
-            string = f"SkipLinesIfCharacterInsideRegion({line_count}, {character=}, {region=})"
+            string = f"SkipLinesIfCharacterInsideRegion({line_count}, character={character}, region={region})"
         elif state is False:
-            string = f"SkipLinesIfCharacterOutsideRegion({line_count}, {character=}, {region=})"
+            string = f"SkipLinesIfCharacterOutsideRegion({line_count}, character={character}, region={region})"
         else:
-            string = f"SkipLinesIfCharacterRegionState({line_count}, {state=}, {character=}, {region=})"
+            string = (
+                f"SkipLinesIfCharacterRegionState({line_count}, state={state}, character={character}, region={region})"
+            )
         return self._add_min_target_count(string, min_target_count)
 
     @parse_parameters("GotoIfHollowArenaMatchType", no_name_count=1)
@@ -484,11 +510,11 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _1005_01(self, line_count, state: bool, obj, target_comparison_type: ComparisonType = 0, target_count=-1):
         if state is True:
-            string = f"SkipLinesIfObjectDestroyed({line_count}, {obj=})"
+            string = f"SkipLinesIfObjectDestroyed({line_count}, obj={obj})"
         elif state is False:
-            string = f"SkipLinesIfObjectNotDestroyed({line_count}, {obj=})"
+            string = f"SkipLinesIfObjectNotDestroyed({line_count}, obj={obj})"
         else:
-            string = f"SkipLinesIfObjectDestructionState({line_count}, {obj=}, {state=})"
+            string = f"SkipLinesIfObjectDestructionState({line_count}, obj={obj}, state={state})"
         return self._add_target_args(string, target_comparison_type, target_count)
 
     @parse_parameters
@@ -501,7 +527,7 @@ class InstructionDecompiler(_BaseDecompiler):
         target_count=-1,
     ):
         if self._any_vars(event_return_type, state):
-            string = f"ReturnIfObjectDestructionState({event_return_type=}, {obj=}, {state=})"
+            string = f"ReturnIfObjectDestructionState(event_return_type={event_return_type}, obj={obj}, state={state})"
         else:
             state_name = "" if state else "Not"
             string = f"{event_return_type.name}IfObject{state_name}Destroyed({obj})"
@@ -517,10 +543,10 @@ class InstructionDecompiler(_BaseDecompiler):
         target_count=-1,
     ):
         if self._any_vars(state):
-            string = f"GotoIfObjectDestructionState({label}, {obj=}, {state=})"
+            string = f"GotoIfObjectDestructionState({label}, obj={obj}, state={state})"
         else:
             state_name = "" if state else "Not"
-            string = f"GotoIfObject{state_name}Destroyed({label}, {obj=})"
+            string = f"GotoIfObject{state_name}Destroyed({label}, obj={obj})"
         return self._add_target_args(string, target_comparison_type, target_count)
 
     def _1014_00(self):
@@ -599,8 +625,8 @@ class InstructionDecompiler(_BaseDecompiler):
     ):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndMovePlayerAndSetTimePeriod({cutscene}, {cutscene_type}, {move_to_region=}, "
-            f"{move_to_map=}, {player_id=}, {time_period_id=})"
+            f"PlayCutsceneAndMovePlayerAndSetTimePeriod({cutscene}, {cutscene_type}, move_to_region={move_to_region}, "
+            f"move_to_map={move_to_map}, player_id={player_id}, time_period_id={time_period_id})"
         )
 
     @parse_parameters("PlayCutsceneAndSetTimePeriod", no_name_count=2)
@@ -626,8 +652,8 @@ class InstructionDecompiler(_BaseDecompiler):
     ):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndMovePlayerAndSetMapCeremony({cutscene}, {cutscene_type}, {ceremony_id=}, {unknown=}, "
-            f"{move_to_region=}, {move_to_map=}, {player_id=})"
+            f"PlayCutsceneAndMovePlayerAndSetMapCeremony({cutscene}, {cutscene_type}, ceremony_id={ceremony_id}, "
+            f"unknown={unknown}, move_to_region={move_to_region}, move_to_map={move_to_map}, player_id={player_id})"
         )
 
     @parse_parameters("PlayCutsceneAndSetMapCeremony", no_name_count=1)
@@ -648,8 +674,8 @@ class InstructionDecompiler(_BaseDecompiler):
     ):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndMovePlayer_WithUnknowns({cutscene}, {cutscene_type}, {move_to_region=}, {move_to_map=}, "
-            f"{player_id=}, {unknown1=}, {unknown2=})"
+            f"PlayCutsceneAndMovePlayer_WithUnknowns({cutscene}, {cutscene_type}, move_to_region={move_to_region}, "
+            f"move_to_map={move_to_map}, player_id={player_id}, unknown1={unknown1}, unknown2={unknown2})"
         )
 
     @parse_parameters
@@ -665,19 +691,19 @@ class InstructionDecompiler(_BaseDecompiler):
     ):
         move_to_map = self._get_game_map_variable_name(area_id, block_id)
         return (
-            f"PlayCutsceneAndMovePlayer_WithSecondRegion({cutscene}, {cutscene_type}, {move_to_region=}, "
-            f"{move_to_map=}, {player_id=}, {other_region=})"
+            f"PlayCutsceneAndMovePlayer_WithSecondRegion({cutscene}, {cutscene_type}, move_to_region={move_to_region}, "
+            f"move_to_map={move_to_map}, player_id={player_id}, other_region={other_region})"
         )
 
     @parse_parameters
     def _2003_11(self, state: bool, character: EntityEnum, slot, name):
         """Argument order has changed from DS1."""
         if self._any_vars(state, slot):
-            return f"SetBossHealthBarState({character}, {name=}, {slot=}, {state=})"
+            return f"SetBossHealthBarState({character}, name={name}, slot={slot}, state={state})"
         state_name = "Enable" if state else "Disable"
         if slot == 0:
-            return f"{state_name}BossHealthBar({character}, {name=})"
-        return f"{state_name}BossHealthBar({character}, {name=}, {slot=})"
+            return f"{state_name}BossHealthBar({character}, name={name})"
+        return f"{state_name}BossHealthBar({character}, name={name}, slot={slot})"
 
     @parse_parameters("HandleMinibossDefeat", no_name_count=1)
     def _2003_15(self, miniboss_id):
@@ -730,21 +756,21 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"EnableMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y})"
         if state is False:
             return f"DisableMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y})"
-        return f"SetMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y}, {state=})"
+        return f"SetMapHitGridCorrespondence({collision}, {level}, {grid_x}, {grid_y}, state={state})"
 
     @parse_parameters
     def _2003_46(self, content_image_part_id, state: bool):
         """No Enable/Disable wrappers."""
-        return f"SetMapContentImageDisplayState({content_image_part_id}, {state=})"
+        return f"SetMapContentImageDisplayState({content_image_part_id}, state={state})"
 
     @parse_parameters
     def _2003_47(self, hierarchy, grid_x, grid_y, state: bool):
         """No Enable/Disable wrappers."""
-        return f"SetMapBoundariesDisplay({hierarchy}, {grid_x}, {grid_y}, {state=})"
+        return f"SetMapBoundariesDisplay({hierarchy}, {grid_x}, {grid_y}, state={state})"
 
     @parse_parameters
     def _2003_48(self, region, state: bool, duration, wind_parameter_id):
-        return f"SetAreaWind({region}, {state=}, {duration=}, {wind_parameter_id=})"
+        return f"SetAreaWind({region}, state={state}, duration={duration}, wind_parameter_id={wind_parameter_id})"
 
     @parse_parameters("WarpPlayerToRespawnPoint", no_name_count=1)
     def _2003_49(self, respawn_point_id):
@@ -775,7 +801,7 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _2003_59(self, area_id, block_id, ceremony_id):
         game_map = self._get_game_map_variable_name(area_id, block_id)
-        return f"SetMapCeremony({game_map=}, {ceremony_id=})"
+        return f"SetMapCeremony(game_map={game_map}, ceremony_id={ceremony_id})"
 
     @parse_parameters("DisplayEpitaphMessage", no_name_count=1)
     def _2003_61(self, message):
@@ -788,7 +814,7 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _2003_63(self, first_flag, last_flag, state: RangeState):
         flag_range = f"({first_flag}, {last_flag})"
-        return f"SetNetworkConnectedFlagRangeState({flag_range}, {state=})"
+        return f"SetNetworkConnectedFlagRangeState({flag_range}, state={state})"
 
     @parse_parameters("SetOmissionModeCounts")
     def _2003_64(self, level_1_count, level_2_count):
@@ -816,15 +842,15 @@ class InstructionDecompiler(_BaseDecompiler):
             return f"DisableHUDVisibility()"
         elif is_invisible is False:
             return f"EnableHUDVisibility()"
-        return f"SetHUDVisibilityState({is_invisible=})"
+        return f"SetHUDVisibilityState(is_invisible={is_invisible})"
 
     @parse_parameters
     def _2003_72(self, bonfire, animation, state: bool):
         if state is True:
-            return f"EnableBonfireWarping({bonfire=}, {animation=})"
+            return f"EnableBonfireWarping(bonfire={bonfire}, animation={animation})"
         if state is False:
-            return f"DisableBonfireWarping({bonfire=}, {animation=})"
-        return f"SetBonfireWarpingState({bonfire=}, {animation=}, {state=})"
+            return f"DisableBonfireWarping(bonfire={bonfire}, animation={animation})"
+        return f"SetBonfireWarpingState(bonfire={bonfire}, animation={animation}, state={state})"
 
     @parse_parameters("SetAutogeneratedEventSpecificFlag_1")
     def _2003_73(self, unknown1, unknown2):
@@ -844,7 +870,7 @@ class InstructionDecompiler(_BaseDecompiler):
             return "DisableLoadingScreenTips()"
         elif tips_disabled is False:
             return "EnableLoadingScreenTips()"
-        return f"SetLoadingScreenTipsState({tips_disabled=})"
+        return f"SetLoadingScreenTipsState(tips_disabled={tips_disabled})"
 
     @parse_parameters("AwardGestureItem")
     def _2003_77(self, gesture_id, item_type: ItemType, item_id):
@@ -861,10 +887,13 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _2003_80(self, state: bool, character: EntityEnum, slot, name, decoration):
         if state is True:
-            return f"EnableDecoratedBossHealthBar({character}, {slot=}, {name=}, {decoration=})"
+            return f"EnableDecoratedBossHealthBar({character}, slot={slot}, name={name}, decoration={decoration})"
         if state is False:
-            return f"DisableDecoratedBossHealthBar({character}, {slot=}, {name=}, {decoration=})"
-        return f"SetDecoratedBossHealthBarState({state=}, {character=}, {slot=}, {name=}, {decoration=})"
+            return f"DisableDecoratedBossHealthBar({character}, slot={slot}, name={name}, decoration={decoration})"
+        return (
+            f"SetDecoratedBossHealthBarState(state={state}, character={character}, slot={slot}, name={name}, "
+            f"decoration={decoration})"
+        )
 
     @parse_parameters("PlaceNPCSummonSign_WithoutEmber")
     def _2003_81(self, sign_type: SummonSignType, character: EntityEnum, region, summon_flag, dismissal_flag):
@@ -995,10 +1024,10 @@ class InstructionDecompiler(_BaseDecompiler):
     @parse_parameters
     def _2010_06(self, sound_id, state: bool, fade_duration):
         if state is True:
-            return f"EnableSoundEventWithFade({sound_id=}, {fade_duration=})"
+            return f"EnableSoundEventWithFade(sound_id={sound_id}, fade_duration={fade_duration})"
         elif state is False:
-            return f"DisableSoundEventWithFade({sound_id=}, {fade_duration=})"
-        return f"SetMapSoundWithFade({sound_id=}, {state=}, {fade_duration=})"
+            return f"DisableSoundEventWithFade(sound_id={sound_id}, fade_duration={fade_duration})"
+        return f"SetMapSoundWithFade(sound_id={sound_id}, state={state}, fade_duration={fade_duration})"
 
     @parse_parameters("Unknown_2010_07")
     def _2010_07(self, entity):
@@ -1018,7 +1047,7 @@ class InstructionDecompiler(_BaseDecompiler):
             return "EnableAreaWelcomeMessage()"
         elif state is False:
             return "DisableAreaWelcomeMessage()"
-        return f"SetAreaWelcomeMessageState({state=})"
+        return f"SetAreaWelcomeMessageState(state={state})"
 
     @parse_parameters("CreatePlayLog", no_name_count=1)
     def _2013_01(self, name_string):
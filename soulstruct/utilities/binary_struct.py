@@ -7,6 +7,7 @@ import enum
 import inspect
 import io
 import logging
+import operator
 import re
 import struct
 import types
@@ -73,6 +74,8 @@ class BinaryStruct:
         self._struct_format = []  # Format chunks with different byte order are stored in sub-format strings.
         self._struct_length = []  # Number of values to be packed using each sub-format string.
         self.size = 0  # Total number of bytes in struct.
+        self._record_unpacker = None  # type: tp.Optional[tuple]  # cached by `_get_record_unpacker()`
+        self._compiled_formats = None  # type: tp.Optional[tuple]  # cached by `_get_compiled_formats()`
         if fields:
             self.add_fields(*fields, byte_order=byte_order)
 
@@ -246,13 +249,13 @@ class BinaryStruct:
                 source.seek(offset)
             data = source.read(self.size)
         unpacked = []
-        for sub_fmt in self._struct_format:
-            size = struct.calcsize(sub_fmt)
+        for sub_struct in self._get_compiled_formats():
+            size = sub_struct.size
             try:
-                unpacked += struct.unpack(sub_fmt, data[data_offset : data_offset + size])
+                unpacked += sub_struct.unpack_from(data, data_offset)
             except struct.error:
                 _LOGGER.error(
-                    f"Failed to unpack data at offset {data_offset} with sub-format {sub_fmt}: "
+                    f"Failed to unpack data at offset {data_offset} with sub-format {sub_struct.format}: "
                     f"{data[data_offset:data_offset + size]}"
                 )
                 raise
@@ -286,19 +289,81 @@ class BinaryStruct:
             list[AttributeDict]
         """
         old_offset = None
+        size = self.size
         if isinstance(source, bytes):
-            source = source if offset is None else source[offset:]
-        elif offset is not None:
-            old_offset = source.tell()
-            source.seek(offset)
-        structs = [
-            self.unpack(source, exclude_asserted=exclude_asserted, exclude_prefix=exclude_prefix)
-            for _ in range(count)
-        ]
+            start = offset or 0
+            data = source[start : start + size * count]
+        else:
+            if offset is not None:
+                old_offset = source.tell()
+                source.seek(offset)
+            data = source.read(size * count)  # single read for all structs
+        if len(data) != size * count:
+            if old_offset is not None:
+                source.seek(old_offset)
+            raise struct.error(
+                f"`unpack_count()` requires {size * count} bytes for {count} structs of size {size}, but only "
+                f"{len(data)} bytes are available."
+            )
+        record_unpacker = self._get_record_unpacker()
+        if record_unpacker is None:
+            structs = [
+                self.unpack(data[i : i + size], exclude_asserted=exclude_asserted, exclude_prefix=exclude_prefix)
+                for i in range(0, size * count, size)
+            ]
+        else:
+            # Fast path for simple structs: unpack all records with one compiled `struct.Struct`.
+            compiled, field_names, asserted = record_unpacker
+            # Excluded fields are not checked against their asserted values, as in `unpack()`.
+            excluded = [
+                name for name in field_names
+                if (exclude_asserted and asserted.get(name)) or (exclude_prefix and name.startswith(exclude_prefix))
+            ]
+            checked = [(name, asserted_value) for name, asserted_value in asserted.items() if name not in excluded]
+            structs = []
+            for values in compiled.iter_unpack(data):
+                output = AttributeDict(zip(field_names, values))
+                for name, asserted_value in checked:
+                    if output[name] != asserted_value:
+                        raise ValueError(
+                            f"Field '{name}' contained {output[name]} instead of asserted value {asserted_value}."
+                        )
+                for name in excluded:
+                    del output[name]
+                structs.append(output)
         if old_offset is not None:
             source.seek(old_offset)
         return structs
 
+    def _get_compiled_formats(self) -> tuple[struct.Struct, ...]:
+        """Returns a compiled `struct.Struct` for each sub-format, so `unpack()` does not look up or measure each format
+        string on every call.
+
+        Result is cached until the struct's format changes (which `copy()` instances can also cause).
+        """
+        layout = tuple(self._struct_format)
+        if self._compiled_formats is None or self._compiled_formats[0] != layout:
+            self._compiled_formats = (layout, tuple(struct.Struct(sub_fmt) for sub_fmt in layout))
+        return self._compiled_formats[1]
+
+    def _get_record_unpacker(self) -> tp.Optional[tuple[struct.Struct, list[str], dict]]:
+        """Returns `(compiled_struct, field_names, asserted_values)` if this struct has a single byte order and only
+        single, unencoded fields, which can be unpacked directly by `struct.iter_unpack()`. Otherwise, returns None.
+
+        Result is cached until the struct's format changes (which `copy()` instances can also cause).
+        """
+        layout = (tuple(self._struct_format), len(self.fields))
+        if self._record_unpacker is None or self._record_unpacker[0] != layout:
+            if len(self._struct_format) != 1 or any(
+                field.length != 1 or field.encoding for field in self.non_padding_fields
+            ):
+                self._record_unpacker = (layout, None)
+            else:
+                asserted = {field.name: field.asserted for field in self.fields if field.asserted is not None}
+                unpacker = (struct.Struct(self._struct_format[0]), self.field_names, asserted)
+                self._record_unpacker = (layout, unpacker)
+        return self._record_unpacker[1]
+
     def parse_object_source(self, source: object, /, **kwargs) -> dict[str, tp.Any]:
         if isinstance(source, dict):
             struct_dict = source.copy()  # don't modify input dictionary
@@ -368,15 +433,35 @@ class BinaryStruct:
                 raise
         return output
 
+    def compile_packer(self) -> tp.Callable[[dict], bytes]:
+        """Returns a function that packs a `dict` of field values with a single compiled `struct.Struct`.
+
+        Much faster than `pack()` when packing many instances of this struct in a loop, but only supports structs with a
+        single byte order whose fields are all single, unencoded values. Asserted fields are always packed with their
+        asserted values, and any extra keys in the given `dict` are ignored.
+        """
+        if len(self._struct_format) != 1:
+            raise ValueError("Cannot compile a `BinaryStruct` with multiple byte orders into one `struct.Struct`.")
+        field_names = []
+        asserted = {}
+        for field in self.non_padding_fields:
+            if field.length != 1 or field.encoding:
+                raise ValueError(f"Cannot compile field {repr(field)} into a `struct.Struct` packer.")
+            field_names.append(field.name)
+            if field.asserted is not None:
+                asserted[field.name] = field.asserted
+        compiled = struct.Struct(self._struct_format[0])
+        get_values = operator.itemgetter(*field_names) if len(field_names) > 1 else lambda d: (d[field_names[0]],)
+        if asserted:
+            return lambda struct_dict: compiled.pack(*get_values({**struct_dict, **asserted}))
+        return lambda struct_dict: compiled.pack(*get_values(struct_dict))
+
     def pack_multiple(self, sources: tp.Sequence[dict]) -> bytes:
         """Pack multiple instances of this binary struct and return them joined.
 
         Note that `kwargs` of `pack()` cannot be used here. All `sources` must contain all non-asserted fields.
         """
-        output = b""
-        for struct_dict in sources:
-            output += self.pack(struct_dict)
-        return output
+        return b"".join([self.pack(struct_dict) for struct_dict in sources])
 
     def copy(self):
         bs = BinaryStruct()
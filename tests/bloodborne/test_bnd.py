@@ -0,0 +1,70 @@
+import unittest
+from pathlib import Path
+
+from soulstruct.containers.bnd import BND, BND4
+
+RESOURCES = Path(__file__).parent
+
+
+def _original_path_hash(path_string):
+    """Per-character `BND4.path_hash` loop that the closed form replaced."""
+    hashable = path_string.replace("\\", "/")
+    if not hashable.startswith("/"):
+        hashable = "/" + hashable
+    h = 0
+    for i, s in enumerate(hashable):
+        h += i * 37 + ord(s)
+    return h
+
+
+class BND4Test(unittest.TestCase):
+
+    def setUp(self):
+        self.bnd = BND(RESOURCES / "gameparam.parambnd.dcx")
+
+    def test_pack_round_trip(self):
+        self.bnd.hash_table_type = 4  # include a hash table
+        self.bnd.entries[0].path = "N:\\SPRJ\\data\\テスト.param"  # non-ASCII UTF-16 path
+        packed = self.bnd.pack()
+        reloaded = BND(packed)
+        self.assertIsInstance(reloaded, BND4)
+        self.assertEqual(reloaded.hash_table_type, 4)
+        self.assertEqual(len(reloaded.entries), len(self.bnd.entries))
+        for reloaded_entry, entry in zip(reloaded.entries, self.bnd.entries):
+            self.assertEqual(reloaded_entry, entry)
+        self.assertEqual(reloaded.pack(), packed)
+
+        # Reused hash table matches a rebuilt one, including after a path change.
+        self.assertEqual(reloaded._most_recent_hash_table, reloaded.build_hash_table())
+        reloaded.entries[1].path = "N:\\SPRJ\\data\\renamed.param"
+        repacked = BND(reloaded.pack())
+        self.assertEqual(repacked._most_recent_hash_table, repacked.build_hash_table())
+        self.assertNotEqual(repacked._most_recent_hash_table, reloaded._most_recent_hash_table)
+
+    def test_path_hash(self):
+        for path in (
+            "",
+            "/",
+            "N:\\SPRJ\\data\\INTERROOT_ps4\\param\\GameParam\\64bit\\ActionButtonParam.param",
+            "chr/c0000.anibnd",
+            "N:\\FRPG\\data\\Model\\map\\テスト\\m10_00_00_00.flver",
+        ):
+            self.assertEqual(BND4.path_hash(path), _original_path_hash(path), msg=path)
+
+    def test_hash_group_count(self):
+        def trial_division_group_count(entry_count):
+            p = entry_count // 7
+            while not (p >= 2 and all(p % i for i in range(2, int(p ** 0.5) + 1))):
+                p += 1
+            return p
+
+        for entry_count in (*range(0, 200), 69999, 70055, 70070, 80000, 250000):
+            self.assertEqual(
+                BND4.get_hash_group_count(entry_count), trial_division_group_count(entry_count), msg=str(entry_count)
+            )
+        self.assertTrue(all(BND4.is_prime(p) for p in (2, 3, 5, 7, 9973, 10007)))
+        self.assertFalse(any(BND4.is_prime(n) for n in (-7, 0, 1, 4, 9, 25, 49, 10001)))
+
+
+if __name__ == "__main__":
+    unittest.main()
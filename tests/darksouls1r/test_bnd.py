@@ -0,0 +1,156 @@
+import mmap
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+from soulstruct.containers.bnd import BND
+
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+RESOURCES = Path(__file__).parent / "resources"
+
+
+class BNDTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bnd = BND(RESOURCES / "GameParam.parambnd.dcx")
+
+    def test_pack_round_trip(self):
+        packed = self.bnd.pack()
+        reloaded = BND(packed)
+        self.assertEqual(type(reloaded).__name__, "BND3")
+        self.assertEqual(len(reloaded.entries), len(self.bnd.entries))
+        for reloaded_entry, entry in zip(reloaded.entries, sorted(self.bnd.entries, key=lambda e: e.id)):
+            self.assertEqual(reloaded_entry, entry)
+        self.assertEqual(reloaded.pack(), packed)
+
+    def _compressed_first_entry_bnd(self, packed_data: bytes = None):
+        """Repack the first entry of `self.bnd` as compressed, optionally with the given compressed data, and reload."""
+        entry = self.bnd.entries[0]
+        entry.magic = 0x03  # compressed entry
+        if packed_data is not None:
+            entry._packed_data = packed_data  # written in place of the compressed data on the next pack
+        return BND(self.bnd.pack())
+
+    def test_compressed_entry(self):
+        data = self.bnd.entries[0].data
+        reloaded = self._compressed_first_entry_bnd()
+        self.assertEqual(reloaded.entries[0].data_size, len(data))  # known without decompressing
+        self.assertEqual(reloaded.entries[0].data, data)
+
+    def test_compressed_entry_one_shot_decompression(self):
+        data = self.bnd.entries[0].data
+        reloaded = self._compressed_first_entry_bnd()
+        decompress_patch = mock.patch("soulstruct.containers.bnd.core.zlib.decompress", wraps=zlib.decompress)
+        decompressobj_patch = mock.patch("soulstruct.containers.bnd.core.zlib.decompressobj")
+        with mock.patch("soulstruct.containers.bnd.core.deflate", None):
+            with decompress_patch as decompress, decompressobj_patch as decompressobj:
+                self.assertEqual(reloaded.entries[0].data, data)
+        decompress.assert_called_once_with(mock.ANY, bufsize=len(data))
+        decompressobj.assert_not_called()  # only used for streams that one-shot decompression rejects
+
+    @unittest.skipIf(deflate is None, "optional `deflate` package is not installed")
+    def test_compressed_entry_deflate(self):
+        data = self.bnd.entries[0].data
+        reloaded = self._compressed_first_entry_bnd()
+        with mock.patch.object(deflate, "zlib_decompress", wraps=deflate.zlib_decompress) as zlib_decompress:
+            self.assertEqual(reloaded.entries[0].data, data)
+        zlib_decompress.assert_called_once_with(mock.ANY, len(data))
+
+    def test_compressed_entry_deflate_error(self):
+        """Entries that `deflate` fails to decompress are decompressed by `zlib` instead."""
+        data = self.bnd.entries[0].data
+        reloaded = self._compressed_first_entry_bnd()
+        failing_deflate = mock.Mock(DeflateError=type("DeflateError", (Exception,), {}))
+        failing_deflate.zlib_decompress.side_effect = failing_deflate.DeflateError
+        with mock.patch("soulstruct.containers.bnd.core.deflate", failing_deflate):
+            self.assertEqual(reloaded.entries[0].data, data)
+        failing_deflate.zlib_decompress.assert_called_once()
+
+    def test_corrupt_compressed_entry(self):
+        reloaded = self._compressed_first_entry_bnd(b"not a zlib stream")  # loading does not decompress
+        with self.assertRaises(zlib.error):
+            _ = reloaded.entries[0].data
+        self.assertEqual(reloaded.entries[1].data, self.bnd.entries[1].data)
+
+    def test_truncated_compressed_entry(self):
+        data = self.bnd.entries[0].data
+        compressed = zlib.compress(data, level=7)
+        reloaded = self._compressed_first_entry_bnd(compressed[: len(compressed) // 2])
+        partial_data = reloaded.entries[0].data
+        self.assertLess(len(partial_data), len(data))
+        self.assertEqual(partial_data, data[: len(partial_data)])
+
+    def test_load_from_path(self):
+        """Packed (non-DCX) BND files are memory-mapped while loading, and the map is closed afterwards."""
+        for entry in self.bnd.entries:
+            entry.magic = 0x03  # compressed entries, which are decompressed lazily after loading
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bnd_path = Path(temp_dir, "GameParam.parambnd")
+            bnd_path.write_bytes(self.bnd.pack())
+            maps = []
+            mmap_class = mmap.mmap
+
+            def record_mmap(*args, **kwargs):
+                maps.append(mmap_class(*args, **kwargs))
+                return maps[-1]
+
+            with mock.patch("soulstruct.containers.bnd.core.mmap.mmap", side_effect=record_mmap):
+                reloaded = BND(bnd_path)
+            self.assertEqual(len(maps), 1)
+            self.assertTrue(maps[0].closed)
+            self.assertEqual(reloaded.path, bnd_path)
+            for reloaded_entry, entry in zip(reloaded.entries, self.bnd.entries):
+                self.assertEqual(reloaded_entry.data, entry.data)
+
+    def test_write_unpacked_dir_duplicate_file(self):
+        """Entries written to the same file leave the last entry's data, as when entries were written in order."""
+        self.bnd.clear_entries()
+        for i in range(2):  # same ID and basename (which `add_entry` warns about)
+            self.bnd.add_entry(self.bnd.BNDEntry(f"data {i}".encode(), entry_id=1, path=f"N:/FRPG/data/{i}/a.param"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.bnd.write_unpacked_dir(temp_dir)
+            unpacked_dir = Path(temp_dir, self.bnd.path.name + ".unpacked")
+            self.assertEqual((unpacked_dir / "__1__a.param").read_bytes(), b"data 1")
+
+    def test_entries_by_lookups(self):
+        entries_by_id = self.bnd.entries_by_id
+        with self.assertRaises(TypeError):
+            del entries_by_id[self.bnd.entries[0].id]  # read-only
+        self.assertIs(self.bnd.entries_by_id[self.bnd.entries[0].id], self.bnd.entries[0])
+
+        entry = self.bnd.entries[0]
+        self.bnd.remove_entry(entry.id)
+        self.assertNotIn(entry.id, self.bnd.entries_by_id)
+        self.assertNotIn(entry.path, self.bnd.entries_by_path)
+        self.bnd.add_entry(entry)
+        self.assertIs(self.bnd.entries_by_path[entry.path], entry)
+
+        entry.path = "N:\\FRPG\\data\\renamed.param"
+        entry.id = 9999
+        self.assertIs(self.bnd.entries_by_path["N:\\FRPG\\data\\renamed.param"], entry)
+        self.assertIs(self.bnd.entries_by_id[9999], entry)
+
+        # Replace an entry while keeping the entry count the same.
+        new_entry = self.bnd.BNDEntry(b"data", entry_id=10000, path="N:\\FRPG\\data\\new.param")
+        entry_count = len(self.bnd.entries)
+        self.bnd.remove_entry(9999)
+        self.bnd.add_entry(new_entry)
+        self.assertEqual(len(self.bnd.entries), entry_count)
+        self.assertNotIn(9999, self.bnd.entries_by_id)
+        self.assertIs(self.bnd.entries_by_id[10000], new_entry)
+        self.assertIs(self.bnd[10000], new_entry)
+        self.assertIs(self.bnd["N:\\FRPG\\data\\new.param"], new_entry)
+
+        self.assertIsInstance(self.bnd.entries, tuple)  # list mutations must go through the methods above
+        with self.assertRaises(AttributeError):
+            self.bnd.entries.append(entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from pathlib import Path
+
+from soulstruct.base.events.emevd.decompiler import InstructionDecompiler as BaseInstructionDecompiler, _get_enum_value
+from soulstruct.darksouls1r.events import EMEVD
+from soulstruct.darksouls1r.events.emevd.enums import CharacterType
+
+VANILLA_EVS = Path(__file__).parents[2] / "soulstruct/darksouls1r/events/vanilla"
+
+
+class DecompilerTest(unittest.TestCase):
+
+    def test_decompile_many(self):
+        """`decompile_many()` gives the same results as `decompile()` on each instruction."""
+        for evs_name in ("common.evs.py", "m10_00_00_00.evs.py"):
+            emevd = EMEVD(VANILLA_EVS / evs_name)
+            for event in emevd.events.values():
+                event.get_evs_function_args()  # records event argument types
+                decompiler_args = [
+                    instruction.get_decompiler_args(event.EVENT_ARG_TYPES) for instruction in event.instructions
+                ]
+                decompiler = event.Instruction.DECOMPILER
+                self.assertEqual(
+                    decompiler.decompile_many(decompiler_args),
+                    [decompiler.decompile(*args) for args in decompiler_args],
+                    msg=f"{evs_name}: Event {event.event_id}",
+                )
+
+    def test_base_decompiler_dispatch(self):
+        """The base decompiler dispatches its own shared instructions, like every game subclass."""
+        decompiled = BaseInstructionDecompiler().decompile(11, 2, (0, 1000), (), None)
+        self.assertEqual(decompiled, "IfStandingOnCollision(0, 1000)")
+
+    def test_duplicate_instruction_methods(self):
+        with self.assertRaises(ValueError):
+            type("BadDecompiler", (BaseInstructionDecompiler,), {"_99_005": lambda self: "", "_99_05": lambda self: ""})
+        # Methods without a zero-padded index are not instruction methods.
+        decompiler_class = type("OtherDecompiler", (BaseInstructionDecompiler,), {"_99_5": lambda self: ""})
+        self.assertNotIn(99 << 16 | 5, decompiler_class._DISPATCH)
+
+    def test_enum_value_cache(self):
+        self.assertIs(_get_enum_value(CharacterType, 1), _get_enum_value(CharacterType, 1))
+        enum_value_true = _get_enum_value(CharacterType, True)
+        self.assertIsNot(enum_value_true, _get_enum_value(CharacterType, 1))
+        self.assertIs(enum_value_true.value, True)
+        self.assertIs(_get_enum_value(CharacterType, 1).value, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import os
 import unittest
+from pathlib import Path
 
 from soulstruct.darksouls1r.maps import MSB
 
@@ -38,6 +39,27 @@ class MSBTest(unittest.TestCase):
         finally:
             os.remove("_test.msb")
 
+    def test_subtype_entries(self):
+        """Subtype entry lists follow entries added, duplicated, and deleted through `MSBEntryList` methods."""
+        msb = MSB(Path(__file__).parent / "resources/m10_00_00_00.msb")
+        treasures = msb.events.Treasure
+        self.assertEqual(treasures, [e for e in msb.events if e.ENTRY_SUBTYPE == treasures[0].ENTRY_SUBTYPE])
+        treasures.clear()  # returned lists are copies
+        self.assertTrue(msb.events.Treasure)
+
+        copy = msb.events.new_treasure(copy_entry=0, name="TREASURE_0_COPY")
+        self.assertIs(msb.events.Treasure[1], copy)
+        msb.events.delete_entry(copy)
+        self.assertNotIn(copy, msb.events.Treasure)
+        msb.events.add_entry(copy)
+        self.assertIs(msb.events.Treasure[-1], copy)
+        msb.events.delete_all_entries_of_subtype("Treasure")
+        self.assertEqual(msb.events.Treasure, [])
+
+        entries = msb.events.get_entries()
+        entries.pop()  # global list is a copy, too
+        self.assertEqual(len(msb.events), len(entries) + 1)
+
 
 if __name__ == '__main__':
     unittest.main()
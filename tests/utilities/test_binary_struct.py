@@ -0,0 +1,37 @@
+import io
+import struct
+import unittest
+
+from soulstruct.utilities.binary_struct import BinaryStruct
+
+
+class BinaryStructTest(unittest.TestCase):
+
+    RECORD_STRUCT = BinaryStruct(("a", "i"), ("b", "H"), "2x")  # simple struct (`iter_unpack` fast path)
+    VECTOR_STRUCT = BinaryStruct(("a", "i"), ("v", "2f"))  # multi-value field (general `unpack` path)
+
+    def test_unpack_count_bytes_offset(self):
+        """Successive records are unpacked from `bytes` sources (not the first record `count` times)."""
+        data = b"\xff" * 3 + b"".join(struct.pack("<iH2x", i, i * 2) for i in range(4))
+        records = self.RECORD_STRUCT.unpack_count(data, count=3, offset=3 + 8)
+        self.assertEqual([(r.a, r.b) for r in records], [(1, 2), (2, 4), (3, 6)])
+
+        data = b"\xff" * 5 + b"".join(struct.pack("<i2f", i, i / 2, -i) for i in range(4))
+        records = self.VECTOR_STRUCT.unpack_count(data, count=2, offset=5 + 12 * 2)
+        self.assertEqual([(r.a, r.v) for r in records], [(2, [1.0, -2.0]), (3, [1.5, -3.0])])
+
+    def test_unpack_count_truncated(self):
+        data = b"".join(struct.pack("<iH2x", i, i * 2) for i in range(5))
+        for binary_struct in (self.RECORD_STRUCT, self.VECTOR_STRUCT):
+            with self.assertRaises(struct.error):
+                binary_struct.unpack_count(data, count=10)
+            buffer = io.BytesIO(data)
+            with self.assertRaises(struct.error):
+                binary_struct.unpack_count(buffer, count=10, offset=8)
+            self.assertEqual(buffer.tell(), 0)  # old offset restored
+            with self.assertRaises(struct.error):
+                binary_struct.unpack_count(io.BytesIO(data[:-1]), count=5)
+
+
+if __name__ == "__main__":
+    unittest.main()